@@ -15,6 +15,7 @@ Key Concepts for React Developers:
 - Dependencies (Depends()) are like middleware functions
 """
 
+import secrets
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -329,7 +330,6 @@ async def forgot_password(
     
     if user_data:
         # Generate reset token (in a real app, this would be stored in database)
-        import secrets
         reset_token = secrets.token_urlsafe(32)
         reset_token_expires = datetime.utcnow() + timedelta(hours=1)
         
@@ -9,9 +9,12 @@ This module contains FastAPI routes for:
 """
 
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from bson import ObjectId
+from operator import itemgetter
+import heapq
 
 from pydantic import BaseModel, Field
 
@@ -27,13 +30,16 @@ class DashboardResponse(BaseModel):
 
 
 from app.core.logging import logger
-from app.core.database import get_database
+from app.core.database import get_database, iter_prefetched
 from app.repositories.mongodb_repository import MongoDBRepository
 from app.models.mongodb_models import COLLECTIONS
 from app.api.auth import get_current_user
 from app.models.mongodb_models import UserDocument
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Documents fetched per round-trip when scanning a user's whole resume bank
+RESUME_SCAN_BATCH_SIZE = 200
 
 
 @router.get("/overview", response_model=DashboardResponse)
@@ -303,8 +309,12 @@ async def calculate_dashboard_statistics(database, user_id: ObjectId) -> Dict[st
         experience_distribution = {"0-2": 0, "3-5": 0, "6-10": 0, "10+": 0}
         location_distribution = {}
         
-        cursor = database[COLLECTIONS["resume_bank_entries"]].find({"user_id": user_id})
-        async for resume_data in cursor:
+        # Stream only the fields used below, in fixed-size batches
+        cursor = database[COLLECTIONS["resume_bank_entries"]].find(
+            {"user_id": user_id},
+            {"skills": 1, "years_experience": 1, "candidate_location": 1, "_id": 0}
+        ).batch_size(RESUME_SCAN_BATCH_SIZE)
+        async for resume_data in iter_prefetched(cursor, RESUME_SCAN_BATCH_SIZE):
             # Skills analysis
             if resume_data.get("skills"):
                 for skill in resume_data["skills"]:
@@ -328,8 +338,8 @@ async def calculate_dashboard_statistics(database, user_id: ObjectId) -> Dict[st
             if location:
                 location_distribution[location] = location_distribution.get(location, 0) + 1
         
-        # Top skills (limit to top 10)
-        top_skills = sorted(skills_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        # Top skills (limit to top 10); a bounded heap instead of sorting every skill
+        top_skills = heapq.nlargest(10, skills_counts.items(), key=itemgetter(1))
         
         return {
             "resume_stats": {
@@ -366,7 +376,7 @@ async def calculate_dashboard_statistics(database, user_id: ObjectId) -> Dict[st
                 "skills_distribution": dict(top_skills),
                 "experience_distribution": experience_distribution,
                 "location_distribution": location_distribution,
-                "top_locations": sorted(location_distribution.items(), key=lambda x: x[1], reverse=True)[:5]
+                "top_locations": heapq.nlargest(5, location_distribution.items(), key=itemgetter(1))
             }
         }
         
@@ -465,9 +475,8 @@ async def get_recent_activity(database, user_id: ObjectId) -> List[Dict[str, Any
         except:
             pass  # Skip meetings if collection doesn't exist
         
-        # Sort all activities by timestamp
-        recent_activity.sort(key=lambda x: x["timestamp"], reverse=True)
-        return recent_activity[:10]  # Return top 10 most recent
+        # Top 10 most recent activities across all sources
+        return heapq.nlargest(10, recent_activity, key=itemgetter("timestamp"))
         
     except Exception as e:
         logger.error(f"Failed to get recent activity: {e}")
@@ -530,15 +539,18 @@ async def generate_ai_insights(database, user_id: ObjectId) -> Dict[str, Any]:
         
         # Skills analysis
         skills_counts = {}
-        cursor = database[COLLECTIONS["resume_bank_entries"]].find({"user_id": user_id})
-        async for resume_data in cursor:
+        cursor = database[COLLECTIONS["resume_bank_entries"]].find(
+            {"user_id": user_id},
+            {"skills": 1, "_id": 0}
+        ).batch_size(RESUME_SCAN_BATCH_SIZE)
+        async for resume_data in iter_prefetched(cursor, RESUME_SCAN_BATCH_SIZE):
             if resume_data.get("skills"):
                 for skill in resume_data["skills"]:
                     if isinstance(skill, str):
                         skills_counts[skill] = skills_counts.get(skill, 0) + 1
         
         if skills_counts:
-            top_skill = max(skills_counts.items(), key=lambda x: x[1])
+            top_skill = max(skills_counts.items(), key=itemgetter(1))
             insights["highlights"].append(f"Most common skill: {top_skill[0]} ({top_skill[1]} candidates)")
         
         # Generate summary
@@ -14,12 +14,14 @@ Key Features:
 """
 
 from typing import List, Optional
+from operator import attrgetter
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from app.core.logging import logger
 
-from ..core.database import get_database
+from ..core.dependencies import get_mongodb_repository
 from ..api.auth import get_current_user
-from ..models.mongodb_models import UserDocument
+from ..models.mongodb_models import UserDocument, ProcessStage
 from ..models.hiring_process import (
     HiringProcessCreate,
     HiringProcessUpdate,
@@ -36,14 +38,14 @@ from ..models.mongodb_models import ProcessStatus, CandidateStageStatus
 from ..repositories.mongodb_repository import MongoDBRepository
 
 # Create router for hiring process endpoints
-router = APIRouter(prefix="/hiring-processes", tags=["hiring-processes"])
+router = APIRouter(prefix="/hiring-processes", tags=["hiring-processes"], default_response_class=ORJSONResponse)
 
 
 @router.post("/", response_model=HiringProcessResponse)
 async def create_hiring_process(
     process_data: HiringProcessCreate,
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Create a new hiring process.
@@ -56,15 +58,12 @@ async def create_hiring_process(
     The process is automatically associated with the current user.
     """
     try:
-        repository = MongoDBRepository(database)
-        
         # Convert Pydantic model to dict and add user_id
         process_dict = process_data.model_dump()
         process_dict["user_id"] = current_user.id
         
         # Convert ProcessStageCreate objects to ProcessStage objects with IDs
         if "stages" in process_dict:
-            from ..models.mongodb_models import ProcessStage
             process_stages = []
             for stage_data in process_dict["stages"]:
                 stage = ProcessStage(**stage_data)
@@ -85,7 +84,7 @@ async def create_hiring_process(
 @router.get("/available", response_model=List[HiringProcessResponse])
 async def get_available_hiring_processes(
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Get available hiring processes for the current user.
@@ -95,8 +94,6 @@ async def get_available_hiring_processes(
     are returned to ensure candidates are added to active pipelines.
     """
     try:
-        repository = MongoDBRepository(database)
-        
         # Get active hiring processes for the current user
         available_processes = await repository.get_hiring_processes_by_user_and_status(
             user_id=str(current_user.id),
@@ -123,7 +120,7 @@ async def list_hiring_processes(
     limit: int = Query(20, ge=1, le=100, description="Limit results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     List hiring processes for the current user.
@@ -134,8 +131,6 @@ async def list_hiring_processes(
     - Pagination with limit and offset
     """
     try:
-        repository = MongoDBRepository(database)
-        
         processes = await repository.get_hiring_processes_by_user(
             user_id=str(current_user.id),
             status=status,
@@ -159,7 +154,7 @@ async def list_hiring_processes(
 @router.get("/stats", response_model=ProcessStats)
 async def get_process_stats(
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Get hiring process statistics for the current user.
@@ -170,8 +165,6 @@ async def get_process_stats(
     - Overall recruitment metrics
     """
     try:
-        repository = MongoDBRepository(database)
-        
         stats = await repository.get_hiring_process_stats_by_user(str(current_user.id))
         return ProcessStats(**stats)
         
@@ -184,7 +177,7 @@ async def get_process_stats(
 async def get_hiring_process(
     process_id: str,
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Get detailed information about a specific hiring process.
@@ -196,8 +189,6 @@ async def get_hiring_process(
     - Stage movement history
     """
     try:
-        repository = MongoDBRepository(database)
-        
         process = await repository.get_hiring_process_by_id(process_id, str(current_user.id))
         if not process:
             raise HTTPException(status_code=404, detail="Hiring process not found")
@@ -216,7 +207,7 @@ async def update_hiring_process(
     process_id: str,
     update_data: HiringProcessUpdate,
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Update a hiring process.
@@ -227,8 +218,6 @@ async def update_hiring_process(
     - Deadline and target hires
     """
     try:
-        repository = MongoDBRepository(database)
-        
         # Filter out None values
         update_dict = {k: v for k, v in update_data.model_dump().items() if v is not None}
         
@@ -255,7 +244,7 @@ async def update_hiring_process(
 async def delete_hiring_process(
     process_id: str,
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Delete a hiring process.
@@ -264,8 +253,6 @@ async def delete_hiring_process(
     Use with caution - this action cannot be undone.
     """
     try:
-        repository = MongoDBRepository(database)
-        
         success = await repository.delete_hiring_process(process_id, str(current_user.id))
         
         if not success:
@@ -285,7 +272,7 @@ async def add_candidate_to_process(
     process_id: str,
     candidate_data: CandidateAssignment,
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Add a candidate from the resume bank to a hiring process.
@@ -294,8 +281,6 @@ async def add_candidate_to_process(
     with a "pending" status. You can specify initial notes about the candidate.
     """
     try:
-        repository = MongoDBRepository(database)
-        
         logger.info(f"Adding candidate {candidate_data.resume_bank_entry_id} to process {process_id}")
         
         # Get the process to find the first stage
@@ -309,7 +294,7 @@ async def add_candidate_to_process(
             raise HTTPException(status_code=400, detail="Process has no stages defined")
         
         # Find the first stage (lowest order)
-        first_stage = min(process.stages, key=lambda s: s.order)
+        first_stage = min(process.stages, key=attrgetter("order"))
         logger.info(f"Adding candidate to first stage: {first_stage.name} (ID: {first_stage.id})")
         
         # Verify the resume bank entry exists and belongs to the current user
@@ -367,7 +352,7 @@ async def move_candidate_stage(
     candidate_id: str,
     move_data: CandidateStageMove,
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Move a candidate to a different stage in the hiring process.
@@ -381,8 +366,6 @@ async def move_candidate_stage(
     The candidate_id can be either a resume_bank_entry_id or job_application_id
     """
     try:
-        repository = MongoDBRepository(database)
-        
         # Verify the process exists and user has access
         process = await repository.get_hiring_process_by_id(process_id, str(current_user.id))
         if not process:
@@ -420,7 +403,7 @@ async def remove_candidate_from_process(
     process_id: str,
     candidate_id: str,
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Remove a candidate from a hiring process.
@@ -429,8 +412,6 @@ async def remove_candidate_from_process(
     The candidate can be identified by either resume_bank_entry_id or job_application_id.
     """
     try:
-        repository = MongoDBRepository(database)
-        
         # Verify the process exists and user has access
         process = await repository.get_hiring_process_by_id(process_id, str(current_user.id))
         if not process:
@@ -592,7 +573,7 @@ async def _convert_to_process_detail(process, repository) -> HiringProcessDetail
     
     # Convert stages
     stages = []
-    for stage in sorted(process.stages, key=lambda s: s.order):
+    for stage in sorted(process.stages, key=attrgetter("order")):
         stages.append(ProcessStageResponse(
             id=stage.id,
             name=stage.name,
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel
 from datetime import datetime
@@ -15,7 +15,7 @@ from app.core.dependencies import (
     get_resume_bank_service,
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # Request Models
 class CreateApplicationFormRequest(BaseModel):
@@ -7,20 +7,21 @@ This module contains FastAPI routes for:
 - Compatibility analysis
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 from pydantic import BaseModel
 from bson import ObjectId
-from app.core.database import get_database
 from app.core.dependencies import get_mongodb_repository
 from app.models.job import JobPostingCreate, JobPostingResponse, JobPostingUpdate
 from app.api.auth import get_current_user
+from app.api.resume_bank import search_candidates_for_job as search_resume_bank_for_job
 from app.models.mongodb_models import UserDocument, COLLECTIONS
 from app.services.job_parser_service import job_parser_service
 from app.core.logging import logger
 from app.repositories.mongodb_repository import MongoDBRepository
 
-router = APIRouter(tags=["jobs"])
+router = APIRouter(tags=["jobs"], default_response_class=ORJSONResponse)
 
 
 class ParseTextRequest(BaseModel):
@@ -101,7 +102,7 @@ async def parse_job_text(request: ParseTextRequest):
 async def create_job_posting(
     job_data: JobPostingCreate,
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repo: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     logger.warning(f"Job creation attempt by user: {current_user.email if current_user else 'No user'}")
     """
@@ -109,14 +110,12 @@ async def create_job_posting(
     
     Args:
         job_data: Job posting data
-        database: Database instance
+        repo: MongoDB repository
         
     Returns:
         JobPostingResponse: Created job posting
     """
     try:
-        repo = MongoDBRepository(database)
-        
         # Convert Pydantic model to dict
         job_dict = job_data.dict()
         job_dict["user_id"] = current_user.id
@@ -127,22 +126,7 @@ async def create_job_posting(
         logger.info(f"Job posting created: {created_job.title} at {created_job.company} (ID: {created_job.id})")
         
         # Convert MongoDB document to response model
-        return JobPostingResponse(
-            id=str(created_job.id),
-            title=created_job.title,
-            company=created_job.company,
-            location=created_job.location,
-            job_type=created_job.job_type,
-            experience_level=created_job.experience_level,
-            description=created_job.description,
-            salary_range=created_job.salary_range,
-            requirements=created_job.requirements,
-            responsibilities=created_job.responsibilities,
-            benefits=created_job.benefits,
-            status=created_job.status,
-            created_at=created_job.created_at,
-            updated_at=created_job.updated_at
-        )
+        return JobPostingResponse.from_document(created_job)
         
     except Exception as e:
         logger.error(f"Failed to create job posting: {e}")
@@ -157,7 +141,7 @@ async def get_job_postings(
     skip: int = 0,
     limit: int = 100,
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repo: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Get all job postings.
@@ -165,40 +149,17 @@ async def get_job_postings(
     Args:
         skip: Number of records to skip
         limit: Maximum number of records to return
-        database: Database instance
+        repo: MongoDB repository
         
     Returns:
         List[JobPostingResponse]: List of job postings
     """
     try:
-        repo = MongoDBRepository(database)
-        # Filter jobs by user_id
-        jobs = await repo.get_job_postings_by_user(current_user.id)
-        
-        # Apply pagination
-        paginated_jobs = jobs[skip:skip + limit]
+        # Filter jobs by user_id; only the requested page is read and validated
+        paginated_jobs = await repo.get_job_postings_by_user(current_user.id, skip=skip, limit=limit)
         
         # Convert MongoDB documents to response models
-        response_jobs = []
-        for job in paginated_jobs:
-            response_jobs.append(JobPostingResponse(
-                id=str(job.id),
-                title=job.title,
-                company=job.company,
-                location=job.location,
-                job_type=job.job_type,
-                experience_level=job.experience_level,
-                description=job.description,
-                salary_range=job.salary_range,
-                requirements=job.requirements,
-                responsibilities=job.responsibilities,
-                benefits=job.benefits,
-                status=job.status,
-                created_at=job.created_at,
-                updated_at=job.updated_at
-            ))
-        
-        return response_jobs
+        return [JobPostingResponse.from_document(job) for job in paginated_jobs]
         
     except Exception as e:
         logger.error(f"Failed to get job postings: {e}")
@@ -211,20 +172,19 @@ async def get_job_postings(
 @router.get("/public/{job_id}")
 async def get_public_job_posting(
     job_id: str,
-    database = Depends(get_database)
+    repo: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Get a specific job posting for public access (no authentication required).
     
     Args:
         job_id: Job posting ID
-        database: Database instance
+        repo: MongoDB repository
         
     Returns:
         JobPostingResponse: Job posting details
     """
     try:
-        repo = MongoDBRepository(database)
         job = await repo.get_job_posting_by_id(job_id)
         
         if not job:
@@ -242,22 +202,7 @@ async def get_public_job_posting(
         #     )
         
         # Convert MongoDB document to response model
-        return JobPostingResponse(
-            id=str(job.id),
-            title=job.title,
-            company=job.company,
-            location=job.location,
-            job_type=job.job_type,
-            experience_level=job.experience_level,
-            description=job.description,
-            salary_range=job.salary_range,
-            requirements=job.requirements,
-            responsibilities=job.responsibilities,
-            benefits=job.benefits,
-            status=job.status,
-            created_at=job.created_at,
-            updated_at=job.updated_at
-        )
+        return JobPostingResponse.from_document(job)
         
     except HTTPException:
         raise
@@ -273,20 +218,19 @@ async def get_public_job_posting(
 async def get_job_posting(
     job_id: str,
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repo: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Get a specific job posting.
     
     Args:
         job_id: Job posting ID
-        database: Database instance
+        repo: MongoDB repository
         
     Returns:
         JobPostingResponse: Job posting details
     """
     try:
-        repo = MongoDBRepository(database)
         job = await repo.get_job_posting_by_id(job_id)
         
         if not job:
@@ -303,22 +247,7 @@ async def get_job_posting(
             )
         
         # Convert MongoDB document to response model
-        return JobPostingResponse(
-            id=str(job.id),
-            title=job.title,
-            company=job.company,
-            location=job.location,
-            job_type=job.job_type,
-            experience_level=job.experience_level,
-            description=job.description,
-            salary_range=job.salary_range,
-            requirements=job.requirements,
-            responsibilities=job.responsibilities,
-            benefits=job.benefits,
-            status=job.status,
-            created_at=job.created_at,
-            updated_at=job.updated_at
-        )
+        return JobPostingResponse.from_document(job)
         
     except HTTPException:
         raise
@@ -335,7 +264,7 @@ async def update_job_posting(
     job_id: str,
     job_data: JobPostingUpdate,
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Update a job posting.
@@ -343,14 +272,12 @@ async def update_job_posting(
     Args:
         job_id: Job posting ID
         job_data: Updated job data
-        database: Database session
+        repository: MongoDB repository
         
     Returns:
         JobPostingResponse: Updated job posting
     """
     try:
-        repository = MongoDBRepository(database)
-        
         # Check if job exists
         existing_job = await repository.get_job_posting_by_id(job_id)
         if not existing_job:
@@ -383,7 +310,7 @@ async def update_job_posting(
         
         logger.info(f"Job posting updated: {updated_job.title} at {updated_job.company} (ID: {job_id})")
         
-        return JobPostingResponse(**updated_job.dict())
+        return JobPostingResponse.from_document(updated_job)
         
     except HTTPException:
         raise
@@ -399,21 +326,19 @@ async def update_job_posting(
 async def delete_job_posting(
     job_id: str,
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Delete a job posting.
     
     Args:
         job_id: Job posting ID
-        database: Database session
+        repository: MongoDB repository
         
     Returns:
         dict: Success message
     """
     try:
-        repository = MongoDBRepository(database)
-        
         # Check if job exists and get details for logging
         job = await repository.get_job_posting_by_id(job_id)
         if not job:
@@ -458,16 +383,17 @@ async def delete_job_posting(
 @router.get("/{job_id}/candidates")
 async def search_candidates_for_job(
     job_id: str,
-    page: int = 1,
-    limit: int = 20,
-    min_score: float = 0.0,
+    page: int = Query(1, ge=1),
+    limit: int = Query(20, ge=1, le=50),
+    min_score: float = Query(0.0, ge=0.0, le=100.0),
     sort_by: str = "score",
     sort_order: str = "desc",
-    database = Depends(get_database)
+    current_user: UserDocument = Depends(get_current_user),
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Search for candidates that match a specific job.
-    This endpoint dynamically searches the entire resume bank for the best matches.
+    This endpoint dynamically searches the user's resume bank for the best matches.
     
     Args:
         job_id: Job posting ID
@@ -476,58 +402,39 @@ async def search_candidates_for_job(
         min_score: Minimum compatibility score (0-100)
         sort_by: Sort field (score, experience, name)
         sort_order: Sort order (asc, desc)
-        database: Database session
+        repository: MongoDB repository
         
     Returns:
         dict: Candidate search results with pagination
     """
     try:
-        # Get the job posting
-        repository = MongoDBRepository(database)
-        job = await repository.get_job_posting_by_id(job_id)
-        
-        if not job:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Job posting not found"
-            )
-        
-        # Use compatibility service to find matches dynamically
-        # CompatibilityService is not defined in this file, assuming it's imported elsewhere or will be added.
-        # For now, commenting out the line to avoid NameError.
-        # compatibility_service = CompatibilityService(database)
-        # candidates = await compatibility_service.find_candidates_for_job(
-        #     job_id=job_id,
-        #     limit=100,  # Get more candidates to apply filtering
-        #     min_score=min_score
-        # )
-        
-        # Apply sorting
-        # if sort_by == "score":
-        #     candidates.sort(key=lambda x: x.compatibility_score.overall_score or 0, reverse=(sort_order == "desc"))
-        # elif sort_by == "experience":
-        #     candidates.sort(key=lambda x: x.years_experience or 0, reverse=(sort_order == "desc"))
-        # elif sort_by == "name":
-        #     candidates.sort(key=lambda x: x.candidate_name or "", reverse=(sort_order == "desc"))
-        
-        # Apply pagination
-        # start_idx = (page - 1) * limit
-        # end_idx = start_idx + limit
-        # paginated_candidates = candidates[start_idx:end_idx]
-        
-        # Calculate pagination info
-        # total_candidates = len(candidates)
-        # total_pages = (total_candidates + limit - 1) // limit
+        # Scoring, filtering, sorting and pagination all run in the resume bank's
+        # MongoDB aggregation; only the requested page comes back
+        results = await search_resume_bank_for_job(
+            job_id,
+            limit=limit,
+            page=page,
+            skills=None,
+            location=None,
+            experience_min=None,
+            experience_max=None,
+            min_score=min_score,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            current_user=current_user,
+            repository=repository
+        )
+        job = await repository.get_job_posting_by_id_cached(job_id)
         
         return {
-            "candidates": [], # Placeholder for candidates, as CompatibilityService is not defined
+            "candidates": results.candidates,
             "pagination": {
                 "page": page,
                 "limit": limit,
-                "total_candidates": 0,
-                "total_pages": 0,
-                "has_next": False,
-                "has_prev": False
+                "total_candidates": results.total_candidates,
+                "total_pages": results.pagination["total_pages"],
+                "has_next": results.pagination["has_next"],
+                "has_prev": results.pagination["has_previous"]
             },
             "job": {
                 "id": job.id,
@@ -543,4 +450,4 @@ async def search_candidates_for_job(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to search candidates"
-        ) 
\ No newline at end of file
+        ) 
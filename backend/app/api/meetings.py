@@ -3,20 +3,20 @@ API endpoints for meeting and scheduling functionality.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date
 import json
+import traceback
 
 from app.services.meeting_service import MeetingService
 from app.models.mongodb_models import MeetingStatus, SlotSelectionType, MeetingType
 from app.api.auth import get_current_user
 from app.models.mongodb_models import UserDocument
 from app.core.dependencies import get_meeting_service
-from app.core.database import get_database
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # Protected routes (require authentication)
 # Create a request model for meeting creation
@@ -44,7 +44,6 @@ async def create_meeting(
     """Create a new meeting with time slots."""
     try:
         # Convert string dates to datetime objects
-        from datetime import datetime
         start_date_obj = datetime.strptime(meeting_data.start_date, "%Y-%m-%d").date()
         end_date_obj = datetime.strptime(meeting_data.end_date, "%Y-%m-%d").date()
         
@@ -100,14 +99,10 @@ async def create_meeting(
 @router.get("/")
 async def get_my_meetings(
     current_user = Depends(get_current_user),
-    database = Depends(get_database)
+    meeting_service: MeetingService = Depends(get_meeting_service)
 ):
     """Get all meetings organized by the current user."""
     try:
-        # Create repository and service locally like the resume bank API
-        repository = MeetingRepository(database)
-        meeting_service = MeetingService(repository)
-        
         meetings = await meeting_service.get_meetings_by_user(current_user.id)
         
         formatted_meetings = []
@@ -852,7 +847,6 @@ async def get_public_meeting_info(
         # Re-raise HTTP exceptions
         raise
     except Exception as e:
-        import traceback
         traceback.print_exc()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -27,30 +27,157 @@ Think of this module like a smart HR assistant that can:
 """
 
 from fastapi import APIRouter, HTTPException, Query, UploadFile, File, Form, Depends
-from typing import List, Optional
+from fastapi.responses import ORJSONResponse, FileResponse
+from typing import List, Optional, Tuple
 from datetime import datetime
+from collections import OrderedDict
+from dataclasses import dataclass
+import asyncio
+import os
+import time
+import re
+import traceback
 from bson import ObjectId  # MongoDB's unique identifier
+from pymongo.errors import DuplicateKeyError
 
 # Import data models (like TypeScript interfaces)
 from app.models.resume_bank import (
-    ResumeBankEntry, ResumeSearchFilters, CandidateMatch, ResumeBankStats,
+    ResumeBankEntry, CandidateMatch, ResumeBankStats,
     ResumeBankResponse, CandidateSearchResponse, ResumeBankEntryCreate,
-    ResumeBankEntryUpdate, ResumeStatus, ResumeSource, CandidateStatus
+    ResumeBankEntryUpdate, ResumeStatus, ResumeSource, CandidateStatus, ResumeBankBatchRequest,
+    JobCriteria
 )
+from app.models.job import CompatibilityScore, EXPERIENCE_LEVEL_YEARS
 
 # Import core services
-from app.core.database import get_database              # Database connection
+from app.core.dependencies import get_mongodb_repository  # Shared repository instance
 from app.repositories.mongodb_repository import MongoDBRepository  # Database operations
 from app.models.mongodb_models import COLLECTIONS       # Collection names
 from app.services.openai_service import openai_service  # AI processing
 from app.utils.pdf_processor import PDFProcessor        # PDF text extraction
 from app.utils.ai_extractor import ai_extractor         # AI-powered extraction
 from app.core.logging import logger                      # Logging utility
+from app.core.config import ensure_directory            # Upload directories
 from app.api.auth import get_current_user              # Authentication
-from app.models.mongodb_models import UserDocument      # User data model
+from app.models.mongodb_models import (  # Data models
+    UserDocument, JobPostingDocument, location_to_text, has_role_keyword, ROLE_KEYWORDS_PATTERN, normalize_tags
+)
 
 # Create router instance (like Express Router)
-router = APIRouter()
+# List and stats responses can be large, so render them with orjson
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Minimum years of experience for each experience level, highest first
+_EXPERIENCE_BUCKETS = ((5, "Senior"), (3, "Mid"), (1, "Junior"))
+
+# Stored fields that ResumeBankEntry.from_document never reads; left out of
+# the resume bank listing and batch reads so they aren't sent over the wire and decoded
+_LISTING_EXCLUDED_FIELDS = {
+    "process_history": 0, "current_processes": 0, "resume_analysis_id": 0,
+    "pdf_file_path": 0, "text_hash": 0, "file_hash": 0,
+    "skills_lower": 0, "candidate_location_lower": 0, "location_tokens": 0
+}
+
+# Document fields returned as-is by the candidate detail endpoint
+_CANDIDATE_DETAIL_FIELDS = (
+    "filename", "candidate_name", "candidate_email", "candidate_phone",
+    "candidate_location", "years_experience", "current_role", "desired_role",
+    "salary_expectation", "availability", "status", "candidate_status", "source",
+    "tags", "notes", "current_processes", "process_history", "pdf_file_path",
+    "summary", "skills", "education", "experience_level", "overall_assessment",
+    "last_contact_date"
+)
+
+@dataclass(frozen=True)
+class JobScoringContext:
+    """Job-side inputs to candidate scoring, derived once per job version."""
+    skills: Tuple[str, ...]
+    expected_range: Tuple[int, int]
+    role_match: bool
+
+
+# LRU cache of scoring contexts keyed by (job id, job updated_at), so paging
+# through a job's candidates doesn't re-derive them on every request
+_JOB_SCORING_CACHE_SIZE = 256
+_job_scoring_cache: "OrderedDict[Tuple[str, float], JobScoringContext]" = OrderedDict()
+
+
+def _job_scoring_context(db_job: JobPostingDocument) -> JobScoringContext:
+    """Get the scoring context for a job, building it on first use or after the job changes."""
+    key = (str(db_job.id), db_job.updated_at.timestamp() if db_job.updated_at else 0.0)
+    context = _job_scoring_cache.get(key)
+    if context is not None:
+        _job_scoring_cache.move_to_end(key)
+        return context
+    
+    job_experience_level = db_job.experience_level.lower() if db_job.experience_level else "mid"
+    context = JobScoringContext(
+        # Deduplicated, so a repeated requirement doesn't inflate the skills-score denominator
+        skills=tuple(dict.fromkeys(req.get("skill", "").lower() for req in db_job.requirements or ())),
+        expected_range=EXPERIENCE_LEVEL_YEARS.get(job_experience_level, EXPERIENCE_LEVEL_YEARS["mid"]),
+        role_match=has_role_keyword(db_job.title)
+    )
+    _job_scoring_cache[key] = context
+    if len(_job_scoring_cache) > _JOB_SCORING_CACHE_SIZE:
+        _job_scoring_cache.popitem(last=False)
+    return context
+
+
+def _candidate_match(resume_data: dict) -> CandidateMatch:
+    """Build a CandidateMatch from a scored resume returned by aggregate_candidate_matches."""
+    overall_score = resume_data["overall_score"]
+    experience_score = resume_data["experience_score"]
+    role_score = resume_data["role_score"]
+    location_score = resume_data["location_score"]
+    
+    # Generate match reasons
+    match_reasons = []
+    if resume_data["matching_skills_count"]:
+        match_reasons.append(f"Matches {resume_data['matching_skills_count']} required skills")
+    if experience_score >= 80:
+        match_reasons.append(f"Experience level suitable ({resume_data.get('years_experience') or 0} years)")
+    if role_score >= 80:
+        match_reasons.append("Role alignment")
+    if location_score >= 50:
+        match_reasons.append("Location match")
+    
+    if not match_reasons:
+        match_reasons = ["Basic profile match"]
+    
+    # Create candidate match straight from the projected fields; scores are computed
+    # and years_experience is already converted to int by the aggregation
+    return CandidateMatch.model_construct(
+        resume_id=str(resume_data["_id"]),
+        candidate_name=resume_data["candidate_name"],
+        candidate_email=resume_data.get("candidate_email"),
+        compatibility_score=CompatibilityScore.model_construct(
+            overall_score=round(float(overall_score), 1),
+            skills_match=float(resume_data["skills_score"]),
+            experience_match=float(experience_score),
+            role_match=float(role_score),
+            location_match=float(location_score),
+            match_confidence=float(min(95, max(50, overall_score + 10)))  # Confidence based on overall score
+        ),
+        current_role=resume_data.get("current_role"),
+        years_experience=resume_data.get("years_experience"),
+        location=location_to_text(resume_data.get("candidate_location")),
+        status=ResumeStatus(resume_data.get("status", "active")),
+        match_reasons=match_reasons
+    )
+
+
+def _experience_level(years: Optional[int]) -> str:
+    """Map years of experience to an experience level label."""
+    if years is None:
+        return "Unknown"
+    return next((name for threshold, name in _EXPERIENCE_BUCKETS if years >= threshold), "Entry")
+
+
+def _parse_tag_list(value: Optional[str]) -> List[str]:
+    """Split a comma-separated string into stripped, lowercased, de-duplicated tags."""
+    if not value:
+        return []
+    return normalize_tags(value.split(","))
 
 
 @router.post("/upload", response_model=ResumeBankEntry)
@@ -68,7 +195,7 @@ async def upload_resume_to_bank(
     tags: str = Form(""),
     notes: str = Form(""),
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repo: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     logger.warning(f"Resume upload attempt by user: {current_user.email if current_user else 'No user'}")
     
@@ -92,6 +219,10 @@ async def upload_resume_to_bank(
     Returns:
         ResumeBankEntry: Created resume bank entry
     """
+    # The temporary upload and the reserved final path; whichever is still set
+    # when the request ends is removed in the finally block below
+    upload_path = None
+    file_path = None
     try:
         # Validate file type
         if not file.content_type or not file.content_type.startswith('application/pdf'):
@@ -100,90 +231,77 @@ async def upload_resume_to_bank(
                 detail="Only PDF files are allowed"
             )
         
-        # Initialize file_path variable
-        file_path = None
-        
         # Process PDF file and save it
         try:
-            # Read file content first (before it gets consumed by PDFProcessor)
-            content = await file.read()
-            
-            # Reset file position for PDFProcessor
-            await file.seek(0)
-            
-            # Process PDF to extract text and get filename
-            resume_text, filename = await PDFProcessor.process_pdf(file)
-            print(f"====> PDFProcessor returned filename: {filename}")
-            
             # Create user-specific directory
-            import os
             # Use a path relative to the backend directory where the server runs
             user_dir = f"uploads/resumes/{current_user.id}"
-            os.makedirs(user_dir, exist_ok=True)
-            print(f"====> Created directory: {user_dir}")
-            print(f"====> Current working directory: {os.getcwd()}")
+            ensure_directory(user_dir)
+            
+            # Stream the PDF to a temporary path, hashing the bytes on the way; it
+            # only gets its final name once a new entry is created for it
+            upload_path = PDFProcessor.temporary_upload_path(user_dir)
+            filename = file.filename
+            file_hash = await PDFProcessor.save_pdf_upload(file, upload_path)
             
-            # Save PDF file
-            file_path = os.path.join(user_dir, filename)
-            print(f"====> Saving file to: {file_path}")
-            with open(file_path, "wb") as buffer:
-                buffer.write(content)
-            print(f"====> File saved successfully, size: {len(content)} bytes")
-            print("====> PDF processed successfully:")
-            print(f"====> Filename: {filename}")
-            print(f"====> Text length: {len(resume_text)}")
-            print(f"====> Full text content:")
-            print(resume_text)
-            print("====> End of PDF text")
+            # A byte-identical re-upload returns the existing entry before any PDF parsing
+            existing_entry = await repo.get_resume_bank_entry_by_file_hash(ObjectId(current_user.id), file_hash)
+            if existing_entry:
+                logger.info(f"Duplicate resume file upload, returning existing entry {existing_entry.id}")
+                return ResumeBankEntry.from_document(existing_entry)
+            
+            # PDF parsing is blocking CPU work; run it off the event loop so other
+            # requests keep being served while a large resume is parsed
+            resume_text = await asyncio.to_thread(PDFProcessor.extract_text_from_file, upload_path, filename)
 
             logger.info(f"PDF processed successfully: {filename}")
             logger.info(f"PDF text length: {len(resume_text)}")
-            logger.info(f"PDF text content: {resume_text}")
+            # Args-style so the full text is only formatted when debug logging is on
+            logger.debug("PDF saved to {} with text content: {}", upload_path, resume_text)
+        except HTTPException:
+            raise
         except Exception as pdf_error:
             logger.error(f"PDF processing failed: {pdf_error}")
-            import traceback
             logger.error(f"PDF processing traceback: {traceback.format_exc()}")
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to process PDF file: {str(pdf_error)}"
             )
         
+        # Return the existing entry if this user already uploaded the same resume,
+        # skipping AI extraction entirely. Placeholder text for unreadable PDFs is not hashed.
+        text_hash = None
+        if PDFProcessor.validate_pdf_content(resume_text):
+            text_hash = PDFProcessor.compute_text_hash(resume_text)
+            existing_entry = await repo.get_resume_bank_entry_by_text_hash(ObjectId(current_user.id), text_hash)
+            if existing_entry:
+                logger.info(f"Duplicate resume upload, returning existing entry {existing_entry.id}")
+                return ResumeBankEntry.from_document(existing_entry)
+        
         # Extract candidate information from resume text using AI-powered extraction
         try:
-            print("====> Starting AI extraction...")
-            print(f"====> Input text length: {len(resume_text)}")
-            print(f"====> Input filename: {filename}")
-            
             extracted_info = await ai_extractor.extract_candidate_info(resume_text, filename)
-            
-            print("====> AI extraction completed:")
-            print(f"====> Extracted info: {extracted_info}")
-            for key, value in extracted_info.items():
-                print(f"====> {key}: {value}")
-            
             logger.info(f"AI extraction completed: {extracted_info}")
         except Exception as ai_error:
             logger.error(f"AI extraction failed: {ai_error}")
-            import traceback
             logger.error(f"AI extraction traceback: {traceback.format_exc()}")
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to extract information from resume: {str(ai_error)}"
             )
         # Use extracted info if form data is empty (no fallback values)
-        print("====> MERGING FORM DATA WITH EXTRACTED INFO:")
-        print(f"====> Original candidate_name: '{candidate_name}'")
-        print(f"====> Extracted name: '{extracted_info.get('name', '')}'")
-        
         candidate_name = candidate_name if candidate_name else extracted_info.get("name", "")
         candidate_email = candidate_email if candidate_email else extracted_info.get("email", "")
         candidate_phone = candidate_phone if candidate_phone else extracted_info.get("phone", "")
         candidate_location = candidate_location if candidate_location else extracted_info.get("location", "")
         
-        print(f"====> Final candidate_name: '{candidate_name}'")
-        print(f"====> Final candidate_email: '{candidate_email}'")
-        print(f"====> Final candidate_phone: '{candidate_phone}'")
-        print(f"====> Final candidate_location: '{candidate_location}'")
+        # The dict is only built when debug logging is enabled
+        logger.opt(lazy=True).debug("Merged candidate form data: {}", lambda: {
+            "candidate_name": candidate_name,
+            "candidate_email": candidate_email,
+            "candidate_phone": candidate_phone,
+            "candidate_location": candidate_location
+        })
         
         # Handle years_experience conversion
         years_exp = None
@@ -226,56 +344,14 @@ async def upload_resume_to_bank(
         overall_assessment = ". ".join(assessment_parts) if assessment_parts else "Qualified candidate with relevant experience"
         
         # Determine experience level
-        experience_level = "Entry"
-        if years_exp:
-            if years_exp >= 5:
-                experience_level = "Senior"
-            elif years_exp >= 3:
-                experience_level = "Mid"
-            elif years_exp >= 1:
-                experience_level = "Junior"
-        
-        # Get education information
-        education = extracted_info.get("education", "Not specified")
-        
-        # Prepare candidate info - only include fields that have actual data
-        candidate_info = {
-            "filename": filename,
-            "tags": tags.split(',') if tags else [],  # Convert string to list
-            "notes": notes,
-            "skills": extracted_skills  # Add extracted skills
-        }
+        experience_level = _experience_level(years_exp)
         
-        # Only add fields that have actual data (no fallback values)
-        if candidate_name:
-            candidate_info["candidate_name"] = candidate_name
-        if candidate_email:
-            candidate_info["candidate_email"] = candidate_email
-        if candidate_phone:
-            candidate_info["candidate_phone"] = candidate_phone
-        if candidate_location:
-            candidate_info["candidate_location"] = candidate_location
-        if years_exp:
-            candidate_info["years_experience"] = years_exp
-        if current_role:
-            candidate_info["current_role"] = current_role
-        if desired_role:
-            candidate_info["desired_role"] = desired_role
-        if salary_expectation:
-            candidate_info["salary_expectation"] = salary_expectation
-        if availability:
-            candidate_info["availability"] = availability
+        # Claim the PDF's final name now so the entry can record it; the upload
+        # is only moved there once the entry exists
+        file_path = await asyncio.to_thread(PDFProcessor.reserve_upload_path, user_dir, filename)
         
-        # Add to resume bank using MongoDB
-        repo = MongoDBRepository(database)
-        
-        # Create resume bank entry directly without analysis
-        
-        # Create resume bank entry with all parsed data
-        from bson import ObjectId
-        
-        # Clean and prepare data for MongoDB
-        print(f"====> Creating database entry with file_path: {file_path}")
+        # Clean and prepare data for MongoDB; every field has a fallback except
+        # years_experience and text_hash, which are only set when known
         entry_data = {
             "user_id": ObjectId(current_user.id),
             "filename": filename or "unknown.pdf",
@@ -283,12 +359,11 @@ async def upload_resume_to_bank(
             "candidate_email": candidate_email or "no-email@example.com",
             "candidate_phone": candidate_phone or "",
             "candidate_location": candidate_location or "",
-            "years_experience": years_exp,
             "current_role": current_role or "",
             "desired_role": desired_role or "",
             "salary_expectation": salary_expectation or "",
             "availability": availability or "",
-            "tags": tags.split(',') if tags else [],
+            "tags": _parse_tag_list(tags),
             "notes": notes or "",
             "status": "active",
             "candidate_status": "available",  # Default status
@@ -298,61 +373,56 @@ async def upload_resume_to_bank(
             "summary": summary or "Professional resume",
             "skills": extracted_skills or [],
             "education": extracted_info.get("education") or "Not specified",
-            "experience_level": "Senior" if years_exp and years_exp >= 5 else "Mid" if years_exp and years_exp >= 2 else "Junior" if years_exp else "Unknown",
-            "overall_assessment": overall_assessment or "Qualified candidate"
+            "experience_level": experience_level,
+            "overall_assessment": overall_assessment or "Qualified candidate",
+            "file_hash": file_hash
         }
         
-        # Remove None values to avoid serialization issues
-        entry_data = {k: v for k, v in entry_data.items() if v is not None}
+        if years_exp is not None:
+            entry_data["years_experience"] = years_exp
+        if text_hash is not None:
+            # Left unset rather than null so the partial unique index ignores unreadable PDFs
+            entry_data["text_hash"] = text_hash
         
         try:
             created_entry = await repo.create_resume_bank_entry(entry_data)
+        except DuplicateKeyError:
+            # A concurrent upload of the same resume won the race; this upload's
+            # PDF is not kept either way
+            existing_entry = await repo.get_resume_bank_entry_by_text_hash(ObjectId(current_user.id), text_hash)
+            if existing_entry is not None and existing_entry.pdf_file_path == file_path:
+                file_path = None
+            if existing_entry is None:
+                # The winning entry was deleted before it could be read back
+                raise HTTPException(
+                    status_code=409,
+                    detail="A concurrent upload of this resume did not complete; please retry"
+                )
+            logger.info(f"Duplicate resume upload, returning existing entry {existing_entry.id}")
+            return ResumeBankEntry.from_document(existing_entry)
         except Exception as create_error:
             logger.error(f"Failed to create resume bank entry: {create_error}")
             logger.error(f"Entry data: {entry_data}")
-            import traceback
             logger.error(f"Database creation traceback: {traceback.format_exc()}")
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to save resume to database: {str(create_error)}"
             )
         
-        # Resume successfully stored in MongoDB
+        # Resume successfully stored in MongoDB; keep the PDF under its final name
+        await asyncio.to_thread(os.replace, upload_path, file_path)
+        upload_path = file_path = None
         logger.info(f"Resume successfully stored in MongoDB: {filename}")
         
         logger.info(f"Successfully uploaded resume to bank: {filename}")
         
         # Convert MongoDB document to response model
         try:
-            response_data = ResumeBankEntry(
-                id=str(created_entry.id),
-                filename=created_entry.filename,
-                candidate_name=created_entry.candidate_name,
-                candidate_email=created_entry.candidate_email,
-                candidate_phone=created_entry.candidate_phone,
-                candidate_location=created_entry.candidate_location,
-                years_experience=created_entry.years_experience,
-                current_role=created_entry.current_role,
-                desired_role=created_entry.desired_role,
-                salary_expectation=created_entry.salary_expectation,
-                availability=created_entry.availability,
-                tags=created_entry.tags,
-                notes=created_entry.notes,
-                summary=created_entry.summary,
-                skills=created_entry.skills,
-                education=created_entry.education,
-                experience_level=created_entry.experience_level,
-                overall_assessment=created_entry.overall_assessment,
-                status=created_entry.status,
-                last_contact_date=created_entry.last_contact_date,
-                created_date=created_entry.created_at,
-                updated_date=created_entry.updated_at
-            )
+            response_data = ResumeBankEntry.from_document(created_entry)
             return response_data
         except Exception as response_error:
             logger.error(f"Failed to create response model: {response_error}")
             logger.error(f"Created entry data: {created_entry}")
-            import traceback
             logger.error(f"Response creation traceback: {traceback.format_exc()}")
             raise HTTPException(
                 status_code=500,
@@ -362,13 +432,14 @@ async def upload_resume_to_bank(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
         logger.error(f"Failed to upload resume to bank: {e}")
         logger.error(f"Full traceback: {traceback.format_exc()}")
         raise HTTPException(
             status_code=500,
             detail=f"Failed to upload resume to bank: {str(e)}"
         )
+    finally:
+        await PDFProcessor.remove_files(upload_path, file_path)
 
 
 # Removed add_resume_to_bank function - use upload_resume_to_bank instead
@@ -384,7 +455,7 @@ async def get_resume_bank(
     status: Optional[ResumeStatus] = Query(None, description="Resume status"),
     tags: Optional[str] = Query(None, description="Comma-separated tags"),
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repo: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Get resumes from the bank with optional filtering.
@@ -402,74 +473,38 @@ async def get_resume_bank(
         List[ResumeBankEntry]: List of resumes
     """
     try:
-        repo = MongoDBRepository(database)
-        
         # Build filters for MongoDB
         filters = {}
         
         if skills:
-            skills_list = [skill.strip() for skill in skills.split(",")]
-            filters["tags"] = {"$in": skills_list}
+            filters["skills_lower"] = {"$in": _parse_tag_list(skills)}
         
-        if location:
-            filters["candidate_location"] = {"$regex": location, "$options": "i"}
+        if location and location.strip():
+            # Anchored prefix match on the lowercased copy can use the
+            # (user_id, candidate_location_lower) index instead of scanning
+            filters["candidate_location_lower"] = {"$regex": f"^{re.escape(location.strip().lower())}"}
         
         if status:
             filters["status"] = status.value if hasattr(status, 'value') else status
         
         if tags:
-            tags_list = [tag.strip() for tag in tags.split(",")]
-            filters["tags"] = {"$in": tags_list}
+            filters["tags"] = {"$in": _parse_tag_list(tags)}
         
         # Calculate skip for pagination
         skip = (page - 1) * page_size
         
         # Get resumes from MongoDB filtered by user
-        from bson import ObjectId
         user_object_id = ObjectId(current_user.id)
-        entries = await repo.get_resume_bank_entries_by_user(user_object_id, skip=skip, limit=page_size)
+        entries = await repo.get_resume_bank_entries_by_user(
+            user_object_id, skip=skip, limit=page_size, filters=filters,
+            projection=_LISTING_EXCLUDED_FIELDS
+        )
         
         # Convert MongoDB documents to response models
         response_entries = []
         for i, entry in enumerate(entries):
             try:
-                # Handle location field - convert dict to string if needed
-                location = entry.candidate_location
-                if isinstance(location, dict):
-                    if 'city' in location and 'country' in location:
-                        location = f"{location['city']}, {location['country']}"
-                    elif 'city' in location:
-                        location = location['city']
-                    elif 'country' in location:
-                        location = location['country']
-                    else:
-                        location = str(location)
-                
-                response_entries.append(ResumeBankEntry(
-                    id=str(entry.id),
-                    filename=entry.filename,
-                    candidate_name=entry.candidate_name,
-                    candidate_email=entry.candidate_email,
-                    candidate_phone=entry.candidate_phone,
-                    candidate_location=location,
-                    years_experience=entry.years_experience,
-                    current_role=entry.current_role,
-                    desired_role=entry.desired_role,
-                    salary_expectation=entry.salary_expectation,
-                    availability=entry.availability,
-                    tags=entry.tags,
-                    notes=entry.notes,
-                    summary=entry.summary,
-                    skills=entry.skills,
-                    education=entry.education,
-                    experience_level=entry.experience_level,
-                    overall_assessment=entry.overall_assessment,
-                    status=entry.status,
-                    last_contact_date=entry.last_contact_date,
-                    created_date=entry.created_at,
-                    updated_date=entry.updated_at,
-                    source="direct_upload"  # Add missing required field
-                ))
+                response_entries.append(ResumeBankEntry.from_document(entry))
             except Exception as e:
                 logger.error(f"Error converting entry {i}: {e}")
                 raise
@@ -487,7 +522,7 @@ async def get_resume_bank(
 @router.get("/stats", response_model=ResumeBankStats)
 async def get_resume_bank_stats(
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repo: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Get statistics about the resume bank.
@@ -496,19 +531,22 @@ async def get_resume_bank_stats(
         ResumeBankStats: Bank statistics
     """
     try:
-        repo = MongoDBRepository(database)
-        from bson import ObjectId
         user_object_id = ObjectId(current_user.id)
-        stats_data = await repo.get_resume_bank_stats_by_user(user_object_id)
+        # Counters come from the per-user stats document; the distributions
+        # are a single $facet aggregation, so both run concurrently
+        stats_data, distributions = await asyncio.gather(
+            repo.get_resume_bank_stats_by_user(user_object_id),
+            repo.get_resume_bank_distributions_by_user(user_object_id)
+        )
         
         return ResumeBankStats(
             total_resumes=stats_data["total_entries"],
-            active_resumes=stats_data.get("active", 0),
-            shortlisted_resumes=stats_data.get("shortlisted", 0),
-            recent_uploads=0,  # Can be calculated if needed
-            top_skills=[],  # Can be calculated if needed
-            experience_distribution={},  # Can be calculated if needed
-            location_distribution={}  # Can be calculated if needed
+            active_resumes=stats_data["status_breakdown"].get("active", 0),
+            shortlisted_resumes=stats_data["status_breakdown"].get("shortlisted", 0),
+            recent_uploads=stats_data["recent_uploads"],
+            top_skills=distributions["top_skills"],
+            experience_distribution=distributions["experience_distribution"],
+            location_distribution=distributions["location_distribution"]
         )
         
     except Exception as e:
@@ -524,10 +562,10 @@ async def get_resume_bank_stats(
 
 @router.post("/find-candidates", response_model=CandidateSearchResponse)
 async def find_candidates_for_job_criteria(
-    job_criteria: dict,
+    job_criteria: JobCriteria,
     limit: int = Query(10, ge=1, le=50, description="Maximum number of candidates"),
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repo: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Find candidates based on job criteria using rule-based search.
@@ -540,61 +578,56 @@ async def find_candidates_for_job_criteria(
         CandidateSearchResponse: List of matching candidates
     """
     try:
-        start_time = datetime.now()
-        
-        # Rule-based search
-        filters = ResumeSearchFilters()
-        
-        if job_criteria.get("requirements"):
-            # Extract skills from requirements
-            skills = []
-            for req in job_criteria["requirements"]:
-                if isinstance(req, dict) and req.get("skill"):
-                    skills.append(req["skill"])
-                elif isinstance(req, str):
-                    skills.append(req)
-            if skills:
-                filters.skills = skills
-        
-        if job_criteria.get("location"):
-            filters.location = job_criteria["location"]
-        
-        if job_criteria.get("experience_level"):
-            # Map experience level to years
-            exp_mapping = {
-                "entry": (0, 2),
-                "junior": (1, 3),
-                "mid": (3, 7),
-                "senior": (5, 10),
-                "lead": (8, 15)
-            }
-            if job_criteria["experience_level"] in exp_mapping:
-                min_exp, max_exp = exp_mapping[job_criteria["experience_level"]]
-                filters.years_experience_min = min_exp
-                filters.years_experience_max = max_exp
-        
-        # Search candidates using MongoDB repository
-        repo = MongoDBRepository(database)
-        from bson import ObjectId
+        start_time = time.perf_counter()
+        
+        skills = job_criteria.skills
+        job_skills = list(dict.fromkeys(skill.lower() for skill in skills))
+        
+        # Map experience level to years; the same range filters and scores
+        experience_level = job_criteria.experience_level
+        level_range = EXPERIENCE_LEVEL_YEARS.get(experience_level.value) if experience_level else None
+        expected_range = level_range or EXPERIENCE_LEVEL_YEARS["mid"]
+        experience_min, experience_max = level_range or (None, None)
+        
+        # Score, filter and rank in MongoDB; only the top matches come back
         user_object_id = ObjectId(current_user.id)
-        candidates = await repo.get_resume_bank_entries_by_user(user_object_id, skip=0, limit=limit)
-        search_time = (datetime.now() - start_time).total_seconds()
+        page_resumes, total_candidates = await repo.aggregate_candidate_matches(
+            user_object_id,
+            job_skills=job_skills,
+            expected_range=expected_range,
+            job_role_match=has_role_keyword(job_criteria.title),
+            role_pattern=ROLE_KEYWORDS_PATTERN,
+            location=job_criteria.location or None,
+            required_skills=job_skills or None,
+            experience_min=experience_min,
+            experience_max=experience_max,
+            limit=limit
+        )
+        candidates = [_candidate_match(resume_data) for resume_data in page_resumes]
+        search_time = time.perf_counter() - start_time
         
         # Build search criteria
         search_criteria = {
-            "job_title": job_criteria.get("title", "Unknown"),
+            "job_title": job_criteria.title,
             "limit": limit,
-            "skills": filters.skills if filters.skills else [],
-            "location": filters.location,
-            "experience_level": job_criteria.get("experience_level"),
+            "skills": skills,
+            "location": job_criteria.location,
+            "experience_level": experience_level.value if experience_level else None,
             "search_type": "rule_based"
         }
         
         return CandidateSearchResponse(
             candidates=candidates,
-            total_count=len(candidates),
+            total_candidates=total_candidates,
             search_criteria=search_criteria,
-            search_time=search_time
+            search_time=search_time,
+            pagination={
+                "page": 1,
+                "limit": limit,
+                "total_pages": (total_candidates + limit - 1) // limit,
+                "has_next": total_candidates > limit,
+                "has_previous": False
+            }
         )
         
     except Exception as e:
@@ -618,7 +651,7 @@ async def search_candidates_for_job(
     sort_by: str = Query("score", description="Sort by: score, experience, name"),
     sort_order: str = Query("desc", description="Sort order: asc, desc"),
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Find the best candidates for a specific job posting with advanced filtering and pagination.
@@ -634,231 +667,53 @@ async def search_candidates_for_job(
         min_score: Minimum compatibility score (0-100)
         sort_by: Sort field (score, experience, name)
         sort_order: Sort order (asc, desc)
-        database: Database instance
+        repository: MongoDB repository
         
     Returns:
         CandidateSearchResponse: List of matching candidates with pagination info
     """
     try:
-        # Get job posting from database using MongoDB
-        repository = MongoDBRepository(database)
-        
-        db_job = await repository.get_job_posting_by_id(job_id)
+        # Get job posting; cached briefly since pages of the same search reuse it
+        db_job = await repository.get_job_posting_by_id_cached(job_id)
         if not db_job:
             raise HTTPException(
                 status_code=404,
                 detail="Job posting not found"
             )
         
-        # Convert to JobPosting model for compatibility analysis
-        from app.models.job import JobPosting, JobType, ExperienceLevel, JobRequirement
-        
-        # Convert requirements from dict to JobRequirement objects
-        job_requirements = []
-        if db_job.requirements:
-            for req in db_job.requirements:
-                if isinstance(req, dict):
-                    job_requirements.append(JobRequirement(
-                        skill=req.get("skill", ""),
-                        level=req.get("level", "Intermediate"),
-                        weight=req.get("weight", 1.0)
-                    ))
-                else:
-                    job_requirements.append(req)
-        
-        job_posting = JobPosting(
-            id=str(db_job.id),
-            title=db_job.title,
-            company=db_job.company,
-            location=db_job.location,
-            job_type=JobType(db_job.job_type),
-            experience_level=ExperienceLevel(db_job.experience_level),
-            description=db_job.description,
-            requirements=job_requirements,
-            responsibilities=db_job.responsibilities or [],
-            benefits=db_job.benefits or [],
-            salary_range=db_job.salary_range,
-            status=db_job.status,
-            created_at=db_job.created_at,
-            updated_at=db_job.updated_at or db_job.created_at
-        )
-        
-        # Build additional filters
-        filters = None
-        if skills or location or experience_min or experience_max:
-            filters = ResumeSearchFilters()
-            
-            if skills:
-                filters.skills = [skill.strip() for skill in skills.split(",")]
-            
-            if location:
-                filters.location = location
-            
-            if experience_min:
-                filters.years_experience_min = experience_min
-            
-            if experience_max:
-                filters.years_experience_max = experience_max
+        # Parse the skills filter once; the lowercased list drives the query
+        skills_list = [skill.strip() for skill in skills.split(",")] if skills else None
+        required_skills = [skill.lower() for skill in skills_list] if skills_list else None
         
-        # Get all resumes from the bank
-        start_time = datetime.now()
+        # Job-side inputs for scoring
+        start_time = time.perf_counter()
+        scoring_context = _job_scoring_context(db_job)
         
-        # Get all candidates from resume bank for the current user
-        from bson import ObjectId
+        # Score, filter, sort and paginate in MongoDB; only the requested page comes back
+        start_index = (page - 1) * limit
+        end_index = start_index + limit
         user_object_id = ObjectId(current_user.id)
-        all_resumes = await repository.get_resume_bank_entries_by_user(user_object_id, skip=0, limit=1000)
+        page_resumes, total_candidates = await repository.aggregate_candidate_matches(
+            user_object_id,
+            job_skills=scoring_context.skills,
+            expected_range=scoring_context.expected_range,
+            job_role_match=scoring_context.role_match,
+            role_pattern=ROLE_KEYWORDS_PATTERN,
+            location=location,
+            required_skills=required_skills,
+            experience_min=experience_min,
+            experience_max=experience_max,
+            min_score=min_score,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            skip=start_index,
+            limit=limit
+        )
         
         # Convert to candidate format
-        all_candidates = []
-        for resume in all_resumes:
-            # Enhanced compatibility scoring
-            job_skills = [req.get("skill", "").lower() for req in db_job.requirements] if db_job.requirements else []
-            resume_skills = [skill.lower() for skill in resume.skills] if resume.skills else []
-            
-            # 1. Skills Matching (40% weight)
-            matching_skills = set(job_skills) & set(resume_skills)
-            skills_score = (len(matching_skills) / max(len(job_skills), 1)) * 100 if job_skills else 60
-            
-            # 2. Experience Level Matching (30% weight)
-            job_experience_level = db_job.experience_level.lower() if db_job.experience_level else "mid"
-            resume_years = resume.years_experience or 0
-            
-            # Map experience levels to years
-            experience_levels = {
-                "entry": (0, 2),
-                "junior": (1, 3),
-                "mid": (3, 6),
-                "senior": (5, 10),
-                "lead": (8, 15)
-            }
-            
-            expected_range = experience_levels.get(job_experience_level, (3, 6))
-            if resume_years >= expected_range[0] and resume_years <= expected_range[1]:
-                experience_score = 100
-            elif resume_years > expected_range[1]:
-                experience_score = 80  # Overqualified but still good
-            elif resume_years > 0:
-                experience_score = max(20, (resume_years / expected_range[0]) * 60)
-            else:
-                experience_score = 10
-            
-            # 3. Role Title Matching (20% weight)
-            job_title = db_job.title.lower()
-            current_role = (resume.current_role or "").lower()
-            desired_role = (resume.desired_role or "").lower()
-            
-            # Check for role similarity
-            role_keywords = ["developer", "engineer", "programmer", "software", "full stack", "frontend", "backend"]
-            job_role_match = any(keyword in job_title for keyword in role_keywords)
-            resume_role_match = any(keyword in current_role or keyword in desired_role for keyword in role_keywords)
-            
-            role_score = 100 if job_role_match and resume_role_match else 30
-            
-            # 4. Location Matching (10% weight)
-            location_score = 0
-            if location and resume.candidate_location:
-                job_location = location.lower()
-                resume_location = resume.candidate_location.lower()
-                if job_location in resume_location or resume_location in job_location:
-                    location_score = 100
-                elif any(word in resume_location for word in job_location.split()):
-                    location_score = 50
-            
-            # Calculate overall compatibility score
-            overall_score = (skills_score * 0.4 + experience_score * 0.3 + role_score * 0.2 + location_score * 0.1)
-            
-            # Apply minimum score filter
-            if min_score and min_score > 0 and overall_score < min_score:
-                continue
-            
-            # Apply location filter
-            if location and resume.candidate_location:
-                if location.lower() not in resume.candidate_location.lower():
-                    continue
-            
-            # Apply experience filter
-            if experience_min and resume.years_experience:
-                if resume.years_experience < experience_min:
-                    continue
-            
-            if experience_max and resume.years_experience:
-                if resume.years_experience > experience_max:
-                    continue
-            
-            # Apply skills filter
-            if skills:
-                required_skills = [skill.strip().lower() for skill in skills.split(",")]
-                resume_skills_lower = [skill.lower() for skill in resume.skills] if resume.skills else []
-                if not any(skill in resume_skills_lower for skill in required_skills):
-                    continue
-            
-            # Generate match reasons
-            match_reasons = []
-            if matching_skills:
-                match_reasons.append(f"Matches {len(matching_skills)} required skills")
-            if experience_score >= 80:
-                match_reasons.append(f"Experience level suitable ({resume_years} years)")
-            if role_score >= 80:
-                match_reasons.append("Role alignment")
-            if location_score >= 50:
-                match_reasons.append("Location match")
-            
-            if not match_reasons:
-                match_reasons = ["Basic profile match"]
-            
-            # Create candidate match
-            from app.models.resume_bank import CandidateMatch, CompatibilityScore
-            
-            candidate = CandidateMatch(
-                resume_id=str(resume.id),
-                candidate_name=resume.candidate_name,
-                candidate_email=resume.candidate_email,
-                compatibility_score=CompatibilityScore(
-                    overall_score=round(overall_score, 1),
-                    skills_match=skills_score,
-                    experience_match=experience_score,
-                    role_match=role_score,
-                    location_match=location_score,
-                    match_confidence=min(95, max(50, overall_score + 10))  # Confidence based on overall score
-                ),
-                current_role=resume.current_role,
-                years_experience=resume.years_experience,
-                location=resume.candidate_location,
-                status=resume.status,
-                match_reasons=match_reasons
-            )
-            all_candidates.append(candidate)
-        
-        # Apply sorting
-        if sort_by == "score":
-            all_candidates.sort(
-                key=lambda x: x.compatibility_score.overall_score,
-                reverse=(sort_order.lower() == "desc")
-            )
-        elif sort_by == "experience":
-            all_candidates.sort(
-                key=lambda x: x.years_experience or 0,
-                reverse=(sort_order.lower() == "desc")
-            )
-        elif sort_by == "name":
-            all_candidates.sort(
-                key=lambda x: x.candidate_name.lower(),
-                reverse=(sort_order.lower() == "desc")
-            )
-        else:
-            # Default sort by score descending
-            all_candidates.sort(
-                key=lambda x: x.compatibility_score.overall_score,
-                reverse=True
-            )
+        paginated_candidates = [_candidate_match(resume_data) for resume_data in page_resumes]
         
-        # Apply pagination
-        total_candidates = len(all_candidates)
-        start_index = (page - 1) * limit
-        end_index = start_index + limit
-        paginated_candidates = all_candidates[start_index:end_index]
-        
-        search_time = (datetime.now() - start_time).total_seconds()
+        search_time = time.perf_counter() - start_time
         
         # Calculate pagination info
         total_pages = (total_candidates + limit - 1) // limit
@@ -878,15 +733,15 @@ async def search_candidates_for_job(
             "sort_order": sort_order
         }
         
-        if filters:
-            if filters.skills:
-                search_criteria["additional_skills"] = filters.skills
-            if filters.location:
-                search_criteria["preferred_location"] = filters.location
-            if filters.years_experience_min:
-                search_criteria["experience_min"] = filters.years_experience_min
-            if filters.years_experience_max:
-                search_criteria["experience_max"] = filters.years_experience_max
+        # Echo the additional filters; they were applied once, inside the aggregation
+        if skills_list:
+            search_criteria["additional_skills"] = skills_list
+        if location:
+            search_criteria["preferred_location"] = location
+        if experience_min:
+            search_criteria["experience_min"] = experience_min
+        if experience_max:
+            search_criteria["experience_max"] = experience_max
         
         # Build response
         response = CandidateSearchResponse(
@@ -905,7 +760,7 @@ async def search_candidates_for_job(
             }
         )
         
-        logger.info(f"Found {len(paginated_candidates)} candidates for job {job_posting.title} (page {page}/{total_pages}) in {search_time:.2f}s")
+        logger.info(f"Found {len(paginated_candidates)} candidates for job {db_job.title} (page {page}/{total_pages}) in {search_time:.2f}s")
         
         return response
         
@@ -924,20 +779,90 @@ async def test_endpoint():
     """Test endpoint to verify server is working."""
     return {"message": "Server is working", "timestamp": datetime.utcnow().isoformat()}
 
+@router.post("/batch")
+async def get_resumes_from_bank(
+    batch: ResumeBankBatchRequest,
+    current_user: UserDocument = Depends(get_current_user),
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
+):
+    """
+    Get several resumes from the bank in one request.
+    
+    Args:
+        batch: Resume IDs to fetch
+        repository: MongoDB repository
+        
+    Returns:
+        dict: Resumes keyed by ID, plus the IDs that were not found
+    """
+    try:
+        entries = await repository.get_resume_bank_entries_by_ids(
+            ObjectId(current_user.id), batch.ids, projection=_LISTING_EXCLUDED_FIELDS
+        )
+        resumes = {str(entry.id): ResumeBankEntry.from_document(entry) for entry in entries}
+        
+        return {
+            "resumes": resumes,
+            "missing_ids": [resume_id for resume_id in batch.ids if resume_id not in resumes]
+        }
+        
+    except Exception as e:
+        logger.error(f"Failed to get resumes in batch: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to get resumes"
+        )
+
+
+@router.post("/batch-delete")
+async def delete_resumes_from_bank(
+    batch: ResumeBankBatchRequest,
+    current_user: UserDocument = Depends(get_current_user),
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
+):
+    """
+    Delete several resumes from the bank in one request.
+    
+    Args:
+        batch: Resume IDs to delete
+        repository: MongoDB repository
+        
+    Returns:
+        dict: Deleted IDs and the IDs that were not found
+    """
+    try:
+        deleted_ids = await repository.delete_resume_bank_entries(ObjectId(current_user.id), batch.ids)
+        deleted = set(deleted_ids)
+        
+        logger.info(f"Resumes deleted in batch: {len(deleted_ids)} of {len(batch.ids)}")
+        
+        return {
+            "message": f"{len(deleted_ids)} resumes deleted successfully",
+            "deleted_ids": deleted_ids,
+            "missing_ids": [resume_id for resume_id in batch.ids if resume_id not in deleted]
+        }
+        
+    except Exception as e:
+        logger.error(f"Failed to delete resumes in batch: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to delete resumes"
+        )
+
+
 @router.get("/{resume_id}", response_model=ResumeBankEntry)
-async def get_resume_from_bank(resume_id: str, database = Depends(get_database)):
+async def get_resume_from_bank(resume_id: str, repository: MongoDBRepository = Depends(get_mongodb_repository)):
     """
     Get a specific resume from the bank.
     
     Args:
         resume_id: Resume ID
-        database: Database instance
+        repository: MongoDB repository
         
     Returns:
         ResumeBankEntry: Resume details
     """
     try:
-        repository = MongoDBRepository(database)
         resume_entry = await repository.get_resume_bank_entry_by_id(resume_id)
         
         if not resume_entry:
@@ -947,30 +872,7 @@ async def get_resume_from_bank(resume_id: str, database = Depends(get_database))
             )
         
         # Convert MongoDB document to response model
-        return ResumeBankEntry(
-            id=str(resume_entry.id),
-            filename=resume_entry.filename,
-            candidate_name=resume_entry.candidate_name,
-            candidate_email=resume_entry.candidate_email,
-            candidate_phone=resume_entry.candidate_phone,
-            candidate_location=resume_entry.candidate_location,
-            years_experience=resume_entry.years_experience,
-            current_role=resume_entry.current_role,
-            desired_role=resume_entry.desired_role,
-            salary_expectation=resume_entry.salary_expectation,
-            availability=resume_entry.availability,
-            tags=resume_entry.tags,
-            notes=resume_entry.notes,
-            summary=resume_entry.summary,
-            skills=resume_entry.skills,
-            education=resume_entry.education,
-            experience_level=resume_entry.experience_level,
-            overall_assessment=resume_entry.overall_assessment,
-            status=resume_entry.status,
-            last_contact_date=resume_entry.last_contact_date,
-            created_date=resume_entry.created_at,
-            updated_date=resume_entry.updated_at
-        )
+        return ResumeBankEntry.from_document(resume_entry)
         
     except HTTPException:
         raise
@@ -983,21 +885,19 @@ async def get_resume_from_bank(resume_id: str, database = Depends(get_database))
 
 
 @router.put("/{resume_id}", response_model=ResumeBankEntry)
-async def update_resume_in_bank(resume_id: str, update_data: ResumeBankEntryUpdate, database = Depends(get_database)):
+async def update_resume_in_bank(resume_id: str, update_data: ResumeBankEntryUpdate, repository: MongoDBRepository = Depends(get_mongodb_repository)):
     """
     Update a resume in the bank.
     
     Args:
         resume_id: Resume ID
         update_data: Updated resume data
-        database: Database instance
+        repository: MongoDB repository
         
     Returns:
         ResumeBankEntry: Updated resume
     """
     try:
-        repository = MongoDBRepository(database)
-        
         # Check if resume exists
         resume_entry = await repository.get_resume_bank_entry_by_id(resume_id)
         if not resume_entry:
@@ -1006,45 +906,30 @@ async def update_resume_in_bank(resume_id: str, update_data: ResumeBankEntryUpda
                 detail="Resume not found"
             )
         
-        # Update only provided fields
-        update_dict = update_data.dict(exclude_unset=True)
+        # Update only provided fields that differ from the stored values
+        update_dict = {
+            field: value
+            for field, value in update_data.model_dump(exclude_unset=True).items()
+            if not hasattr(resume_entry, field) or getattr(resume_entry, field) != value
+        }
+        if not update_dict:
+            # Nothing changes; skip the write and the re-read
+            return ResumeBankEntry.from_document(resume_entry)
         
         # Update the resume
         updated_resume = await repository.update_resume_bank_entry(resume_id, update_dict)
         
         if not updated_resume:
+            # Deleted since it was read
             raise HTTPException(
-                status_code=500,
-                detail="Failed to update resume"
+                status_code=404,
+                detail="Resume not found"
             )
         
         logger.info(f"Resume updated: {updated_resume.candidate_name} (ID: {resume_id})")
         
         # Convert MongoDB document to response model
-        return ResumeBankEntry(
-            id=str(updated_resume.id),
-            filename=updated_resume.filename,
-            candidate_name=updated_resume.candidate_name,
-            candidate_email=updated_resume.candidate_email,
-            candidate_phone=updated_resume.candidate_phone,
-            candidate_location=updated_resume.candidate_location,
-            years_experience=updated_resume.years_experience,
-            current_role=updated_resume.current_role,
-            desired_role=updated_resume.desired_role,
-            salary_expectation=updated_resume.salary_expectation,
-            availability=updated_resume.availability,
-            tags=updated_resume.tags,
-            notes=updated_resume.notes,
-            summary=updated_resume.summary,
-            skills=updated_resume.skills,
-            education=updated_resume.education,
-            experience_level=updated_resume.experience_level,
-            overall_assessment=updated_resume.overall_assessment,
-            status=updated_resume.status,
-            last_contact_date=updated_resume.last_contact_date,
-            created_date=updated_resume.created_at,
-            updated_date=updated_resume.updated_at
-        )
+        return ResumeBankEntry.from_document(updated_resume)
         
     except HTTPException:
         raise
@@ -1057,20 +942,18 @@ async def update_resume_in_bank(resume_id: str, update_data: ResumeBankEntryUpda
 
 
 @router.delete("/{resume_id}")
-async def delete_resume_from_bank(resume_id: str, database = Depends(get_database)):
+async def delete_resume_from_bank(resume_id: str, repository: MongoDBRepository = Depends(get_mongodb_repository)):
     """
     Delete a resume from the bank.
     
     Args:
         resume_id: Resume ID
-        database: Database instance
+        repository: MongoDB repository
         
     Returns:
         dict: Success message
     """
     try:
-        repository = MongoDBRepository(database)
-        
         # Check if resume exists
         resume = await repository.get_resume_bank_entry_by_id(resume_id)
         if not resume:
@@ -1105,66 +988,33 @@ async def delete_resume_from_bank(resume_id: str, database = Depends(get_databas
 
 
 @router.post("/{resume_id}/status")
-async def update_resume_status(resume_id: str, status: ResumeStatus, database = Depends(get_database)):
+async def update_resume_status(resume_id: str, status: ResumeStatus, repository: MongoDBRepository = Depends(get_mongodb_repository)):
     """
     Update the status of a resume in the bank.
     
     Args:
         resume_id: Resume ID
         status: New status
-        database: Database instance
+        repository: MongoDB repository
         
     Returns:
         ResumeBankEntry: Updated resume
     """
     try:
-        repository = MongoDBRepository(database)
-        
-        # Check if resume exists
-        resume_entry = await repository.get_resume_bank_entry_by_id(resume_id)
-        if not resume_entry:
-            raise HTTPException(
-                status_code=404,
-                detail="Resume not found"
-            )
-        
-        # Update the status
+        # Update the status; the repository returns None if the resume doesn't exist
         update_data = {"status": status.value if hasattr(status, 'value') else status}
         updated_resume = await repository.update_resume_bank_entry(resume_id, update_data)
         
         if not updated_resume:
             raise HTTPException(
-                status_code=500,
-                detail="Failed to update resume status"
+                status_code=404,
+                detail="Resume not found"
             )
         
         logger.info(f"Resume status updated: {updated_resume.candidate_name} -> {status}")
         
         # Convert MongoDB document to response model
-        return ResumeBankEntry(
-            id=str(updated_resume.id),
-            filename=updated_resume.filename,
-            candidate_name=updated_resume.candidate_name,
-            candidate_email=updated_resume.candidate_email,
-            candidate_phone=updated_resume.candidate_phone,
-            candidate_location=updated_resume.candidate_location,
-            years_experience=updated_resume.years_experience,
-            current_role=updated_resume.current_role,
-            desired_role=updated_resume.desired_role,
-            salary_expectation=updated_resume.salary_expectation,
-            availability=updated_resume.availability,
-            tags=updated_resume.tags,
-            notes=updated_resume.notes,
-            summary=updated_resume.summary,
-            skills=updated_resume.skills,
-            education=updated_resume.education,
-            experience_level=updated_resume.experience_level,
-            overall_assessment=updated_resume.overall_assessment,
-            status=updated_resume.status,
-            last_contact_date=updated_resume.last_contact_date,
-            created_date=updated_resume.created_at,
-            updated_date=updated_resume.updated_at
-        )
+        return ResumeBankEntry.from_document(updated_resume)
         
     except HTTPException:
         raise
@@ -1184,7 +1034,7 @@ async def update_resume_status(resume_id: str, status: ResumeStatus, database =
 async def get_candidate_detail(
     candidate_id: str,
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Get detailed candidate information for the profile page.
@@ -1204,7 +1054,6 @@ async def get_candidate_detail(
         logger.info(f"Current user ID: {current_user.id}")
         
         # Get candidate from database
-        repository = MongoDBRepository(database)
         candidate_doc = await repository.get_resume_bank_entry_by_id(candidate_id)
         
         logger.info(f"Candidate document found: {candidate_doc is not None}")
@@ -1224,38 +1073,13 @@ async def get_candidate_detail(
             logger.warning(f"Access denied: user {current_user.id} trying to access candidate owned by {candidate_user_id}")
             raise HTTPException(status_code=403, detail="Access denied")
         
-        # Return raw candidate data without model validation for now
-        candidate = {
-            "id": str(candidate_doc.id),
-            "filename": candidate_doc.filename or "",
-            "candidate_name": candidate_doc.candidate_name or "",
-            "candidate_email": candidate_doc.candidate_email,
-            "candidate_phone": candidate_doc.candidate_phone,
-            "candidate_location": candidate_doc.candidate_location,
-            "years_experience": candidate_doc.years_experience,
-            "current_role": candidate_doc.current_role,
-            "desired_role": candidate_doc.desired_role,
-            "salary_expectation": candidate_doc.salary_expectation,
-            "availability": candidate_doc.availability,
-            "status": candidate_doc.status or "active",
-            "candidate_status": candidate_doc.candidate_status or "available",
-            "source": candidate_doc.source or "direct_upload",
-            "tags": candidate_doc.tags or [],
-            "notes": candidate_doc.notes,
-            "current_processes": candidate_doc.current_processes or [],
-            "process_history": candidate_doc.process_history or [],
-            "pdf_file_path": candidate_doc.pdf_file_path,
-            "summary": candidate_doc.summary,
-            "skills": candidate_doc.skills or [],
-            "education": candidate_doc.education,
-            "experience_level": candidate_doc.experience_level,
-            "overall_assessment": candidate_doc.overall_assessment,
-            "created_date": candidate_doc.created_at or candidate_doc.created_date,
-            "updated_date": candidate_doc.updated_at or candidate_doc.updated_date,
-            "last_contact_date": candidate_doc.last_contact_date
-        }
+        # Return raw candidate data; the document is already validated
+        candidate = {field: getattr(candidate_doc, field) for field in _CANDIDATE_DETAIL_FIELDS}
+        candidate["id"] = str(candidate_doc.id)
+        candidate["created_date"] = candidate_doc.created_at
+        candidate["updated_date"] = candidate_doc.updated_at
         
-        logger.info(f"Candidate data prepared: {candidate}")
+        logger.debug("Candidate data prepared: {}", candidate)
         
         # Get current hiring processes (placeholder - will be implemented with hiring process module)
         current_processes = []
@@ -1286,7 +1110,7 @@ async def get_candidate_detail(
 @router.get("/pdf/{candidate_id}")
 async def get_candidate_pdf(
     candidate_id: str,
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Serve the PDF file for a candidate.
@@ -1299,7 +1123,6 @@ async def get_candidate_pdf(
             raise HTTPException(status_code=400, detail="Invalid candidate ID")
         
         # Get candidate from database
-        repository = MongoDBRepository(database)
         candidate_doc = await repository.get_resume_bank_entry_by_id(candidate_id)
         
         if not candidate_doc:
@@ -1314,12 +1137,10 @@ async def get_candidate_pdf(
             raise HTTPException(status_code=404, detail="PDF file not found")
         
         # Check if file exists
-        import os
         if not os.path.exists(pdf_file_path):
             raise HTTPException(status_code=404, detail="PDF file not found on disk")
         
         # Return the PDF file for inline viewing (not download)
-        from fastapi.responses import FileResponse
         return FileResponse(
             path=pdf_file_path,
             media_type="application/pdf",
@@ -1340,7 +1161,7 @@ async def get_candidate_pdf(
 @router.get("/pdf/{candidate_id}/download")
 async def download_candidate_pdf(
     candidate_id: str,
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Download the PDF file for a candidate (forces download).
@@ -1354,7 +1175,6 @@ async def download_candidate_pdf(
             raise HTTPException(status_code=400, detail="Invalid candidate ID")
         
         # Get candidate from database
-        repository = MongoDBRepository(database)
         candidate_doc = await repository.get_resume_bank_entry_by_id(candidate_id)
         
         if not candidate_doc:
@@ -1366,12 +1186,10 @@ async def download_candidate_pdf(
             raise HTTPException(status_code=404, detail="PDF file not found")
         
         # Check if file exists
-        import os
         if not os.path.exists(pdf_file_path):
             raise HTTPException(status_code=404, detail="PDF file not found on disk")
         
         # Return the PDF file for download
-        from fastapi.responses import FileResponse
         return FileResponse(
             path=pdf_file_path,
             media_type="application/pdf",
@@ -1394,7 +1212,7 @@ async def update_candidate_status(
     candidate_id: str,
     status_update: dict,
     current_user: UserDocument = Depends(get_current_user),
-    database = Depends(get_database)
+    repository: MongoDBRepository = Depends(get_mongodb_repository)
 ):
     """
     Update candidate status (available, in_process, hired, etc.).
@@ -1413,7 +1231,6 @@ async def update_candidate_status(
             raise HTTPException(status_code=400, detail="Invalid candidate status")
         
         # Get candidate from database
-        repository = MongoDBRepository(database)
         candidate_doc = await repository.find_by_id(COLLECTIONS.RESUME_BANK, candidate_id)
         
         if not candidate_doc:
@@ -10,11 +10,42 @@ This module provides centralized configuration management with:
 
 from pydantic_settings import BaseSettings
 from pydantic import Field, field_validator
-from typing import Optional, List
+from typing import Optional, Tuple, FrozenSet, Set
+from functools import lru_cache
 import os
 from pathlib import Path
 
 
+# Accepted values for the environment and log_level settings
+_ALLOWED_ENVIRONMENTS = ('development', 'staging', 'production', 'test')
+_ALLOWED_LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+_ALLOWED_ENVIRONMENTS_SET = frozenset(_ALLOWED_ENVIRONMENTS)
+_ALLOWED_LOG_LEVELS_SET = frozenset(_ALLOWED_LOG_LEVELS)
+
+
+# Directories already created by ensure_directory in this process
+_created_directories: Set[str] = set()
+
+
+def ensure_directory(path: str) -> None:
+    """Create a directory and its parents on the first call for a path; later calls are no-ops."""
+    if path not in _created_directories:
+        Path(path).mkdir(parents=True, exist_ok=True)
+        _created_directories.add(path)
+
+
+@lru_cache(maxsize=32)
+def _split_csv(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated setting into stripped, non-empty items (once per distinct value)."""
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+@lru_cache(maxsize=32)
+def _csv_set(value: str) -> FrozenSet[str]:
+    """Comma-separated setting as a set, built once per distinct value."""
+    return frozenset(_split_csv(value))
+
+
 class Settings(BaseSettings):
     """
     Application settings loaded from environment variables.
@@ -33,10 +64,10 @@ class Settings(BaseSettings):
     @classmethod
     def validate_environment(cls, v: str) -> str:
         """Validate environment value."""
-        allowed = ['development', 'staging', 'production', 'test']
-        if v.lower() not in allowed:
-            raise ValueError(f"Environment must be one of: {', '.join(allowed)}")
-        return v.lower()
+        environment = v.lower()
+        if environment not in _ALLOWED_ENVIRONMENTS_SET:
+            raise ValueError(f"Environment must be one of: {', '.join(_ALLOWED_ENVIRONMENTS)}")
+        return environment
     
     # OpenAI API configuration
     openai_api_key: str = Field(
@@ -51,6 +82,10 @@ class Settings(BaseSettings):
         default="gpt-3.5-turbo",
         description="OpenAI model to use"
     )
+    openai_embedding_model: str = Field(
+        default="text-embedding-3-small",
+        description="OpenAI model used for text embeddings"
+    )
     
     # File upload settings
     max_file_size: int = Field(
@@ -120,10 +155,10 @@ class Settings(BaseSettings):
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate log level."""
-        allowed = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if v.upper() not in allowed:
-            raise ValueError(f"Log level must be one of: {', '.join(allowed)}")
-        return v.upper()
+        level = v.upper()
+        if level not in _ALLOWED_LOG_LEVELS_SET:
+            raise ValueError(f"Log level must be one of: {', '.join(_ALLOWED_LOG_LEVELS)}")
+        return level
     
     # MongoDB settings
     mongodb_url: str = Field(
@@ -134,6 +169,20 @@ class Settings(BaseSettings):
         default="resume_analysis",
         description="MongoDB database name"
     )
+    mongodb_max_pool_size: int = Field(
+        default=200,
+        ge=1,
+        description="Maximum connections in the MongoDB connection pool"
+    )
+    mongodb_min_pool_size: int = Field(
+        default=10,
+        ge=0,
+        description="Connections the MongoDB pool keeps open when idle"
+    )
+    mongodb_compressors: str = Field(
+        default="zstd,zlib",
+        description="Comma-separated wire compressors in order of preference (zstd needs the zstandard package; unavailable ones are skipped)"
+    )
     
     # Security settings
     enable_security_middleware: bool = Field(
@@ -171,45 +220,45 @@ class Settings(BaseSettings):
         description="Comma-separated list of allowed headers"
     )
     
-    def get_allowed_file_types(self) -> List[str]:
+    def get_allowed_file_types(self) -> FrozenSet[str]:
         """
-        Get allowed file types as a list.
+        Get allowed file types as a set, for O(1) membership checks.
         
         Returns:
-            List of allowed file type strings
+            Set of allowed file type strings
         """
-        return [ft.strip() for ft in self.allowed_file_types.split(",") if ft.strip()]
+        return _csv_set(self.allowed_file_types)
     
-    def get_cors_origins(self) -> List[str]:
+    def get_cors_origins(self) -> Tuple[str, ...]:
         """
-        Get CORS origins as a list.
+        Get CORS origins, split once per distinct setting value.
         
         Returns:
-            List of allowed CORS origin strings
+            Tuple of allowed CORS origin strings
         """
-        return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
+        return _split_csv(self.cors_origins)
     
-    def get_cors_methods(self) -> List[str]:
+    def get_cors_methods(self) -> Tuple[str, ...]:
         """
-        Get CORS allowed methods as a list.
+        Get CORS allowed methods, split once per distinct setting value.
         
         Returns:
-            List of allowed HTTP method strings
+            Tuple of allowed HTTP method strings
         """
         if self.cors_allow_methods == "*":
-            return ["*"]
-        return [method.strip() for method in self.cors_allow_methods.split(",") if method.strip()]
+            return ("*",)
+        return _split_csv(self.cors_allow_methods)
     
-    def get_cors_headers(self) -> List[str]:
+    def get_cors_headers(self) -> Tuple[str, ...]:
         """
-        Get CORS allowed headers as a list.
+        Get CORS allowed headers, split once per distinct setting value.
         
         Returns:
-            List of allowed header strings
+            Tuple of allowed header strings
         """
         if self.cors_allow_headers == "*":
-            return ["*"]
-        return [header.strip() for header in self.cors_allow_headers.split(",") if header.strip()]
+            return ("*",)
+        return _split_csv(self.cors_allow_headers)
     
     def is_production(self) -> bool:
         """Check if running in production environment."""
@@ -231,16 +280,21 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
         case_sensitive = False
         extra = "allow"  # Allow extra fields for flexibility
+        frozen = True  # Read-only after load; the cached instance is shared process-wide
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get the application settings instance.
     
+    The environment and .env file are read on the first call only; later
+    calls (including Depends(get_settings)) return the same instance.
+    
     Returns:
         Settings: The application settings instance
     """
-    return settings
+    return Settings()
 
 
 def validate_settings() -> None:
@@ -253,6 +307,8 @@ def validate_settings() -> None:
     Raises:
         ValueError: If required settings are missing or invalid
     """
+    settings = get_settings()
+    
     # Validate secret key
     if not settings.secret_key or settings.secret_key == "your-secret-key-here":
         raise ValueError(
@@ -265,8 +321,7 @@ def validate_settings() -> None:
         raise ValueError("MONGODB_URL is required")
     
     # Create upload directory if it doesn't exist
-    upload_path = Path(settings.upload_folder)
-    upload_path.mkdir(parents=True, exist_ok=True)
+    ensure_directory(settings.upload_folder)
     
     # Log configuration status (lazy import to avoid circular dependency)
     try:
@@ -282,8 +337,8 @@ def validate_settings() -> None:
         print(f"Configuration validated - Environment: {settings.environment}, Debug: {settings.debug}")
 
 
-# Create global settings instance
-settings = Settings()
+# Global settings instance, shared with get_settings()
+settings = get_settings()
 
 # Note: validate_settings() should be called explicitly from main.py
 # after all modules are loaded to avoid circular import issues
@@ -5,31 +5,93 @@ This module provides a centralized service container for managing
 all service and repository instances with proper lifecycle management.
 """
 
-from typing import Dict, Type, TypeVar, Optional, Any
+from typing import TYPE_CHECKING, Dict, Type, TypeVar, Optional, Any
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from app.core.database import get_database
 from app.core.logging import logger
-from app.services.openai_service import OpenAIService, get_openai_service
+
+if TYPE_CHECKING:
+    from app.services.openai_service import OpenAIService
+    from app.repositories.mongodb_repository import MongoDBRepository
+    from app.repositories.resume_bank_repository import ResumeBankRepository
+    from app.repositories.job_application_repository import JobApplicationRepository
+    from app.repositories.meeting_repository import MeetingRepository
+    from app.services.resume_bank_service import ResumeBankService
+    from app.services.job_application_service import JobApplicationService
+    from app.services.meeting_service import MeetingService
 
 # Type variable for generic service types
 T = TypeVar('T')
 
 
+def _preloaded_repositories() -> Dict[str, Type]:
+    """
+    Repositories created up front by ServiceContainer.initialize, by the
+    container attribute that holds each one.
+    
+    Imported here rather than at module level so importing the container
+    doesn't load every repository module and its models.
+    """
+    from app.repositories.mongodb_repository import MongoDBRepository
+    from app.repositories.resume_bank_repository import ResumeBankRepository
+    from app.repositories.job_application_repository import JobApplicationRepository
+    from app.repositories.meeting_repository import MeetingRepository
+    return {
+        "mongo_repo": MongoDBRepository,
+        "resume_bank_repo": ResumeBankRepository,
+        "job_application_repo": JobApplicationRepository,
+        "meeting_repo": MeetingRepository,
+    }
+
+
+def _load_openai_service() -> "OpenAIService":
+    """Import and get the OpenAI service on first use."""
+    from app.services.openai_service import get_openai_service
+    return get_openai_service()
+
+
 class ServiceContainer:
     """
     Service container for dependency injection.
     
     This container manages the lifecycle of all services and repositories,
     ensuring they are properly initialized and can be reused across requests.
+    
+    The preloaded repositories and the request-scoped services are plain
+    attributes, so the FastAPI dependencies read them with one attribute load;
+    the class-keyed dicts only hold ad-hoc registrations.
     """
     
+    __slots__ = (
+        "mongo_repo",
+        "resume_bank_repo",
+        "job_application_repo",
+        "meeting_repo",
+        "resume_bank_service",
+        "job_application_service",
+        "meeting_service",
+        "_services",
+        "_repositories",
+        "_database",
+        "_openai_service",
+        "_initialized",
+    )
+    
     def __init__(self):
         """Initialize the service container."""
+        # Set by initialize()
+        self.mongo_repo: Optional["MongoDBRepository"] = None
+        self.resume_bank_repo: Optional["ResumeBankRepository"] = None
+        self.job_application_repo: Optional["JobApplicationRepository"] = None
+        self.meeting_repo: Optional["MeetingRepository"] = None
+        # Built on first use by the dependencies module
+        self.resume_bank_service: Optional["ResumeBankService"] = None
+        self.job_application_service: Optional["JobApplicationService"] = None
+        self.meeting_service: Optional["MeetingService"] = None
         self._services: Dict[Type, Any] = {}
         self._repositories: Dict[Type, Any] = {}
         self._database: Optional[AsyncIOMotorDatabase] = None
-        self._openai_service: Optional[OpenAIService] = None
+        self._openai_service: Optional["OpenAIService"] = None
         self._initialized = False
     
     def initialize(self, database: AsyncIOMotorDatabase) -> None:
@@ -40,8 +102,13 @@ class ServiceContainer:
             database: MongoDB database instance
         """
         self._database = database
+        # Create the known repositories now; get_repository(Class) returns the same instances
+        for name, repository_class in _preloaded_repositories().items():
+            if repository_class not in self._repositories:
+                self._repositories[repository_class] = repository_class(database)
+            setattr(self, name, self._repositories[repository_class])
         try:
-            self._openai_service = get_openai_service()
+            self._openai_service = _load_openai_service()
         except Exception as e:
             logger.warning(f"OpenAI service not available: {e}")
             self._openai_service = None
@@ -56,11 +123,11 @@ class ServiceContainer:
             self._database = get_mongodb_database()
         return self._database
     
-    def get_openai_service(self) -> Optional[OpenAIService]:
+    def get_openai_service(self) -> Optional["OpenAIService"]:
         """Get the OpenAI service instance."""
         if self._openai_service is None:
             try:
-                self._openai_service = get_openai_service()
+                self._openai_service = _load_openai_service()
             except Exception as e:
                 logger.warning(f"OpenAI service not available: {e}")
                 return None
@@ -87,14 +154,14 @@ class ServiceContainer:
         Returns:
             Repository instance
         """
-        if repository_class not in self._repositories:
-            # Create repository instance
-            database = self.get_database()
-            instance = repository_class(database)
+        try:
+            return self._repositories[repository_class]
+        except KeyError:
+            # Not preloaded: create it on first use
+            instance = repository_class(self.get_database())
             self._repositories[repository_class] = instance
-            logger.debug(f"Created repository instance: {repository_class.__name__}")
-        
-        return self._repositories[repository_class]
+            logger.debug("Created repository instance: {}", repository_class.__name__)
+            return instance
     
     def register_service(self, service_class: Type[T], instance: T) -> None:
         """
@@ -131,6 +198,11 @@ class ServiceContainer:
         """Clear all registered services and repositories."""
         self._services.clear()
         self._repositories.clear()
+        for name in _preloaded_repositories():
+            setattr(self, name, None)
+        self.resume_bank_service = None
+        self.job_application_service = None
+        self.meeting_service = None
         logger.debug("Service container cleared")
 
 
@@ -2,9 +2,10 @@
 Database configuration and session management.
 """
 
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+import asyncio
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCursor, AsyncIOMotorDatabase
 from app.core.config import settings
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 # MongoDB client
 client: Optional[AsyncIOMotorClient] = None
@@ -20,7 +21,14 @@ def get_mongodb_client() -> AsyncIOMotorClient:
     """
     global client
     if client is None:
-        client = AsyncIOMotorClient(settings.mongodb_url)
+        client = AsyncIOMotorClient(
+            settings.mongodb_url,
+            maxPoolSize=settings.mongodb_max_pool_size,
+            minPoolSize=settings.mongodb_min_pool_size,
+            # Resume text and job descriptions compress well; the server picks
+            # the first compressor it also supports
+            compressors=settings.mongodb_compressors
+        )
     return client
 
 
@@ -48,15 +56,49 @@ async def get_database() -> AsyncIOMotorDatabase:
     return get_mongodb_database()
 
 
+async def iter_prefetched(cursor: AsyncIOMotorCursor, batch_size: int) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Iterate a cursor batch by batch, fetching the next batch while the caller
+    works through the current one.
+    
+    Args:
+        cursor: Motor cursor to read from
+        batch_size: Documents per fetch
+        
+    Yields:
+        Documents from the cursor, in cursor order
+    """
+    next_batch = asyncio.ensure_future(cursor.to_list(length=batch_size))
+    try:
+        while True:
+            batch = await next_batch
+            if len(batch) < batch_size:
+                # Cursor exhausted; no further fetch needed
+                for document in batch:
+                    yield document
+                return
+            next_batch = asyncio.ensure_future(cursor.to_list(length=batch_size))
+            # Let the fetch start so its network round-trip overlaps the caller's work
+            await asyncio.sleep(0)
+            for document in batch:
+                yield document
+    finally:
+        if not next_batch.done():
+            next_batch.cancel()
+
+
 async def close_mongodb_connection() -> None:
     """
     Close MongoDB connection.
     
     This should be called during application shutdown.
     """
-    global client
+    global client, database
     if client:
         client.close()
+        # Drop the closed client so a later get_mongodb_client() creates the one new client
+        client = None
+        database = None
         try:
             from app.core.logging import logger
             logger.info("MongoDB connection closed")
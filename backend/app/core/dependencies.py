@@ -7,9 +7,7 @@ the application, ensuring consistent service and repository creation.
 
 from typing import Optional
 from fastapi import Depends
-from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from app.core.database import get_database
 from app.core.container import get_container
 from app.core.logging import logger
 
@@ -19,9 +17,6 @@ from app.repositories.job_application_repository import JobApplicationRepository
 from app.repositories.meeting_repository import MeetingRepository
 from app.repositories.mongodb_repository import MongoDBRepository
 
-# Note: JobRepository and ResumeRepository are SQLAlchemy-based legacy files
-# and are not used in this MongoDB-based application
-
 # Services
 from app.services.job_application_service import JobApplicationService
 from app.services.resume_bank_service import ResumeBankService
@@ -33,103 +28,106 @@ from app.services.openai_service import OpenAIService
 # Repository Dependencies
 # ============================================================================
 
-# Note: JobRepository and ResumeRepository are not available as they are
-# SQLAlchemy-based legacy files. Use MongoDBRepository for job and resume operations.
+# Job and resume operations go through MongoDBRepository.
+
+# Repository dependencies take no parameters: the container binds each repository
+# to the module-level database singleton once, so FastAPI has no sub-dependency
+# to resolve for them on every request.
 
 
-def get_resume_bank_repository(
-    database: AsyncIOMotorDatabase = Depends(get_database)
-) -> ResumeBankRepository:
+def get_resume_bank_repository() -> ResumeBankRepository:
     """Get ResumeBankRepository instance."""
-    container = get_container()
-    return container.get_repository(ResumeBankRepository)
+    return get_container().resume_bank_repo
 
 
-def get_job_application_repository(
-    database: AsyncIOMotorDatabase = Depends(get_database)
-) -> JobApplicationRepository:
+def get_job_application_repository() -> JobApplicationRepository:
     """Get JobApplicationRepository instance."""
-    container = get_container()
-    return container.get_repository(JobApplicationRepository)
+    return get_container().job_application_repo
 
 
-def get_meeting_repository(
-    database: AsyncIOMotorDatabase = Depends(get_database)
-) -> MeetingRepository:
+def get_meeting_repository() -> MeetingRepository:
     """Get MeetingRepository instance."""
-    container = get_container()
-    return container.get_repository(MeetingRepository)
+    return get_container().meeting_repo
 
 
-def get_mongodb_repository(
-    database: AsyncIOMotorDatabase = Depends(get_database)
-) -> MongoDBRepository:
+def get_mongodb_repository() -> MongoDBRepository:
     """Get MongoDBRepository instance."""
-    # MongoDBRepository is created with database, so we create it directly
-    # rather than using the container since it needs the database instance
-    return MongoDBRepository(database)
+    # The container caches one repository for the app lifetime
+    return get_container().mongo_repo
 
 
 # ============================================================================
 # Service Dependencies
 # ============================================================================
 
+# The OpenAI service is an app-lifetime singleton; once the container has it,
+# the dependency hands it out without going back through the container
+_openai_service: Optional[OpenAIService] = None
+
+
 def get_openai_service_dependency() -> Optional[OpenAIService]:
     """Get OpenAI service instance (can be None if not configured)."""
-    container = get_container()
-    return container.get_openai_service()
+    global _openai_service
+    if _openai_service is None:
+        # Not cached while unavailable, so a later request can still pick it up
+        _openai_service = get_container().get_openai_service()
+    return _openai_service
 
 
 def get_job_application_service(
-    repository: JobApplicationRepository = Depends(get_job_application_repository),
     openai_service: Optional[OpenAIService] = Depends(get_openai_service_dependency)
 ) -> JobApplicationService:
     """
     Get JobApplicationService instance.
     
     Args:
-        repository: JobApplicationRepository instance
         openai_service: OpenAI service (optional)
         
     Returns:
         JobApplicationService instance
     """
-    # Check if service is already registered
+    # Repositories and the OpenAI service are app-lifetime singletons, so this is
+    # built once and reused for every request; it is only rebuilt if the OpenAI
+    # service became available after the first build
     container = get_container()
-    service_key = (JobApplicationService, repository, openai_service)
-    
-    # For now, create new instance each time (can be optimized with caching)
-    return JobApplicationService(repository, openai_service)
+    service = container.job_application_service
+    if service is None or service.openai_service is not openai_service:
+        service = JobApplicationService(container.job_application_repo, openai_service)
+        container.job_application_service = service
+    return service
 
 
 def get_resume_bank_service(
-    repository: ResumeBankRepository = Depends(get_resume_bank_repository),
     openai_service: Optional[OpenAIService] = Depends(get_openai_service_dependency)
 ) -> ResumeBankService:
     """
     Get ResumeBankService instance.
     
     Args:
-        repository: ResumeBankRepository instance
         openai_service: OpenAI service (optional)
         
     Returns:
         ResumeBankService instance
     """
-    return ResumeBankService(repository, openai_service)
+    container = get_container()
+    service = container.resume_bank_service
+    if service is None or service.openai_service is not openai_service:
+        service = ResumeBankService(container.resume_bank_repo, openai_service)
+        container.resume_bank_service = service
+    return service
 
 
-def get_meeting_service(
-    repository: MeetingRepository = Depends(get_meeting_repository)
-) -> MeetingService:
+def get_meeting_service() -> MeetingService:
     """
     Get MeetingService instance.
     
-    Args:
-        repository: MeetingRepository instance
-        
     Returns:
         MeetingService instance
     """
-    return MeetingService(repository)
+    container = get_container()
+    service = container.meeting_service
+    if service is None:
+        service = MeetingService(container.meeting_repo)
+        container.meeting_service = service
+    return service
 
@@ -5,11 +5,20 @@ This module provides centralized logging with correlation IDs,
 structured formatting, and proper log levels for different environments.
 """
 
+import glob
+import gzip
 import logging
+import os
+import shutil
 import sys
-from typing import Optional
+import threading
+import time
+import traceback
+from datetime import datetime
+from typing import Any, Dict, Optional
 from contextvars import ContextVar
 import uuid
+import orjson
 from loguru import logger
 from app.core.config import settings
 
@@ -35,12 +44,126 @@ class CorrelationFilter:
         return True
 
 
+def _json_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick the fields written to the JSON log files."""
+    entry = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "name": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+        "correlation_id": record["extra"].get("correlation_id"),
+    }
+    if record["exception"] is not None:
+        exc_type, exc_value, exc_traceback = record["exception"]
+        entry["exception"] = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+    return entry
+
+
+def _json_format(record: Dict[str, Any]) -> str:
+    """
+    Format a record as one JSON line for the file sinks.
+
+    The JSON is encoded by orjson and stashed on the record, so loguru only
+    substitutes a single field and the message text never has to be escaped
+    by hand.
+    """
+    record["extra"]["serialized"] = orjson.dumps(_json_record(record), default=str).decode()
+    return "{extra[serialized]}\n"
+
+
+class _BufferedFileSink:
+    """
+    Block-buffered, size-rotated file sink.
+    
+    Owns a binary file opened with a 64 KiB buffer instead of loguru's line
+    buffering, so request logging costs one write() per buffer rather than per
+    record. The buffer is flushed when full, straight away for ERROR and above,
+    and every flush_interval seconds by a background thread so a quiet process
+    doesn't hold records back.
+    
+    The size used for rotation is a running count of the encoded bytes, since
+    asking the file for its position would flush the buffer. Rotated files are
+    gzipped next to the log and removed once older than retention_days.
+    """
+    
+    def __init__(self, path: str, *, max_bytes: int, flush_interval: float, retention_days: int = 30):
+        self._path = path
+        self._max_bytes = max_bytes
+        self._retention = retention_days * 24 * 60 * 60
+        self._flush_interval = flush_interval
+        # Serializes writes from loguru's worker with the timer's flushes
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._open()
+        threading.Thread(target=self._flush_periodically, name="log-flush", daemon=True).start()
+    
+    def _open(self) -> None:
+        directory = os.path.dirname(self._path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self._path, "ab", buffering=65536)
+        self._size = os.fstat(self._file.fileno()).st_size
+    
+    def write(self, message) -> None:
+        data = message.encode()
+        with self._lock:
+            if self._file is None:
+                return
+            if self._size and self._size + len(data) > self._max_bytes:
+                self._rotate()
+            self._file.write(data)
+            self._size += len(data)
+            if message.record["level"].no >= logging.ERROR:
+                self._file.flush()
+    
+    def _rotate(self) -> None:
+        self._file.close()
+        root, ext = os.path.splitext(self._path)
+        rotated = f"{root}.{datetime.now():%Y-%m-%d_%H-%M-%S_%f}{ext}"
+        os.replace(self._path, rotated)
+        self._open()
+        with open(rotated, "rb") as source, gzip.open(rotated + ".gz", "wb") as target:
+            shutil.copyfileobj(source, target)
+        os.remove(rotated)
+        cutoff = time.time() - self._retention
+        for old in glob.glob(f"{glob.escape(root)}.*{ext}.gz"):
+            try:
+                if os.path.getmtime(old) < cutoff:
+                    os.remove(old)
+            except FileNotFoundError:
+                pass
+    
+    def _flush_periodically(self) -> None:
+        while not self._stopped.wait(self._flush_interval):
+            with self._lock:
+                if self._file is not None:
+                    self._file.flush()
+    
+    def stop(self) -> None:
+        """Called by loguru when the handler is removed; flushes and closes the file."""
+        self._stopped.set()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
 def setup_logging():
     """Setup structured logging configuration."""
     
     # Remove default loguru handler
     logger.remove()
     
+    # Extended tracebacks walk every frame and render local variable values,
+    # which is slow and can leak request data, so keep them to development
+    debug_tracebacks = settings.is_development()
+    
+    # All sinks are enqueued: records are handed to a background thread that
+    # does the writes (and, for files, rotation and compression), so request
+    # handlers never wait on console or disk I/O. The queue is drained by
+    # logger.complete() at shutdown.
     # Configure loguru with structured formatting and colors
     logger.configure(
         handlers=[
@@ -50,24 +173,36 @@ def setup_logging():
                 "level": settings.log_level,
                 "filter": CorrelationFilter().filter,
                 "colorize": True,  # Enable color output for terminal
+                "enqueue": True,
+                "backtrace": debug_tracebacks,
+                "diagnose": debug_tracebacks,
             },
             {
-                "sink": "logs/app.log",
-                "format": "{time} | {level} | {name}:{function}:{line} | {message}",
+                # Block-buffered; flushed at least every 30s and on errors
+                "sink": _BufferedFileSink(
+                    "logs/app.log",
+                    max_bytes=10 * 1024 * 1024,
+                    flush_interval=30,
+                    retention_days=30,
+                ),
+                "format": _json_format,
                 "level": "INFO",
                 "filter": CorrelationFilter().filter,
-                "rotation": "10 MB",
-                "retention": "30 days",
-                "compression": "gz",
+                "enqueue": True,
+                "backtrace": debug_tracebacks,
+                "diagnose": debug_tracebacks,
             },
             {
                 "sink": "logs/error.log",
-                "format": "{time} | {level} | {name}:{function}:{line} | {message}",
+                "format": _json_format,
                 "level": "ERROR",
                 "filter": CorrelationFilter().filter,
                 "rotation": "10 MB",
                 "retention": "30 days",
                 "compression": "gz",
+                "enqueue": True,
+                "backtrace": debug_tracebacks,
+                "diagnose": debug_tracebacks,
             }
         ]
     )
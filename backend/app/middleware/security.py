@@ -88,7 +88,8 @@ class SecurityMiddleware(BaseHTTPMiddleware):
     
     def check_rate_limit(self, client_ip: str, correlation_id: Optional[str] = None) -> bool:
         """Check if client has exceeded rate limit."""
-        current_time = time.time()
+        # Monotonic clock: the window only measures elapsed time, so it must not jump with wall-clock changes
+        current_time = time.monotonic()
         
         # Reset counter if window has passed
         if current_time > request_counts[client_ip]["reset_time"]:
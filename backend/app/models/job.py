@@ -3,7 +3,7 @@ Data models for job posting and compatibility analysis functionality.
 """
 
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, List, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -23,6 +23,16 @@ class ExperienceLevel(str, Enum):
     lead = "lead"
 
 
+# Expected (min, max) years of experience for each experience level
+EXPERIENCE_LEVEL_YEARS = {
+    ExperienceLevel.entry.value: (0, 2),
+    ExperienceLevel.junior.value: (1, 3),
+    ExperienceLevel.mid.value: (3, 6),
+    ExperienceLevel.senior.value: (5, 10),
+    ExperienceLevel.lead.value: (8, 15)
+}
+
+
 class JobRequirement(BaseModel):
     skill: str = Field(..., description="Required skill")
     level: str = Field(..., description="Skill level (Beginner, Intermediate, Advanced)")
@@ -80,6 +90,14 @@ class JobPosting(BaseModel):
     updated_at: Optional[datetime] = Field(None, description="Last update date")
 
 
+# Document fields copied as-is into JobPostingResponse
+_JOB_DOCUMENT_FIELDS = (
+    "title", "company", "location", "job_type", "experience_level", "description",
+    "salary_range", "requirements", "responsibilities", "benefits", "status",
+    "allow_public_applications", "public_application_link", "created_at", "updated_at"
+)
+
+
 class JobPostingResponse(BaseModel):
     """Response model for job postings."""
     id: str
@@ -102,6 +120,17 @@ class JobPostingResponse(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_document(cls, document: Any) -> "JobPostingResponse":
+        """
+        Build a response from a JobPostingDocument.
+        
+        The document has already been validated with compatible field types, so
+        validation is skipped; only the ObjectId id needs converting.
+        """
+        data = {field: getattr(document, field) for field in _JOB_DOCUMENT_FIELDS}
+        return cls.model_construct(id=str(document.id), **data)
+
 
 class CompatibilityScore(BaseModel):
     """Compatibility score between a candidate and a job."""
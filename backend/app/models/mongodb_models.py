@@ -9,6 +9,7 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel, Field, validator
 from bson import ObjectId
+import re
 import uuid
 from enum import Enum
 
@@ -87,6 +88,71 @@ class ResumeAnalysisDocument(BaseModel):
     }
 
 
+def location_to_text(location: Any) -> Any:
+    """Convert a stored location dict (city/country) to a display string; other values pass through."""
+    if isinstance(location, dict):
+        if 'city' in location and 'country' in location:
+            return f"{location['city']}, {location['country']}"
+        elif 'city' in location:
+            return location['city']
+        elif 'country' in location:
+            return location['country']
+        else:
+            return str(location)
+    return location
+
+
+# Keywords that mark a job title or resume role as a software role
+ROLE_KEYWORDS = ("developer", "engineer", "programmer", "software", "full stack", "frontend", "backend")
+ROLE_KEYWORDS_PATTERN = "|".join(re.escape(keyword) for keyword in ROLE_KEYWORDS)
+ROLE_KEYWORDS_RE = re.compile(ROLE_KEYWORDS_PATTERN)
+
+# Words of a lowercased location, compared as sets by candidate search
+LOCATION_TOKEN_PATTERN = "[a-z0-9]+"
+LOCATION_TOKEN_RE = re.compile(LOCATION_TOKEN_PATTERN)
+
+
+def has_role_keyword(text: Any) -> bool:
+    """Whether a job title or resume role mentions one of the role keywords."""
+    return isinstance(text, str) and ROLE_KEYWORDS_RE.search(text.lower()) is not None
+
+
+def normalize_tags(tags: Any) -> List[str]:
+    """Stripped, lowercased, de-duplicated tags, as stored and as matched by the tag filter."""
+    return sorted({str(tag).strip().lower() for tag in tags or () if str(tag).strip()})
+
+
+def location_tokens(location: Any) -> List[str]:
+    """Distinct lowercased words of a location, e.g. ["san", "francisco", "ca"]."""
+    if not isinstance(location, str):
+        return []
+    return list(dict.fromkeys(LOCATION_TOKEN_RE.findall(location.lower())))
+
+
+def resume_search_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Lowercased copies of skills and location, location words and role-keyword flags, stored
+    next to the originals so candidate search doesn't redo this work for
+    every resume on every query. Tags are replaced by their normalized form.
+    Only the fields present in data are returned, so it works for partial updates.
+    """
+    fields = {}
+    if "tags" in data:
+        fields["tags"] = normalize_tags(data["tags"])
+    if "skills" in data:
+        # Stored as a set (no case-variant duplicates) for $setIntersection and the multikey index
+        fields["skills_lower"] = list(dict.fromkeys(str(skill).lower() for skill in data["skills"] or []))
+    if "candidate_location" in data:
+        location = location_to_text(data["candidate_location"])
+        fields["candidate_location_lower"] = location.lower() if isinstance(location, str) else ""
+        fields["location_tokens"] = location_tokens(location)
+    if "current_role" in data:
+        fields["current_role_keyword"] = has_role_keyword(data["current_role"])
+    if "desired_role" in data:
+        fields["desired_role_keyword"] = has_role_keyword(data["desired_role"])
+    return fields
+
+
 class ResumeBankEntryDocument(BaseModel):
     """MongoDB document for resume bank entries."""
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
@@ -122,6 +188,8 @@ class ResumeBankEntryDocument(BaseModel):
     education: Optional[str] = Field(None, description="Education information")
     experience_level: Optional[str] = Field(None, description="Experience level assessment")
     overall_assessment: Optional[str] = Field(None, description="Overall AI assessment")
+    text_hash: Optional[str] = Field(None, description="SHA-256 of the normalized resume text, used to detect duplicate uploads")
+    file_hash: Optional[str] = Field(None, description="SHA-256 of the uploaded PDF bytes, used to skip parsing re-uploads")
     
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -129,16 +197,7 @@ class ResumeBankEntryDocument(BaseModel):
     @validator('candidate_location', pre=True)
     def validate_candidate_location(cls, v):
         """Convert location dict to string if needed."""
-        if isinstance(v, dict):
-            if 'city' in v and 'country' in v:
-                return f"{v['city']}, {v['country']}"
-            elif 'city' in v:
-                return v['city']
-            elif 'country' in v:
-                return v['country']
-            else:
-                return str(v)
-        return v
+        return location_to_text(v)
     
     model_config = {
         "populate_by_name": True,
@@ -302,7 +361,9 @@ COLLECTIONS = {
     "hiring_processes": "hiring_processes",
     "job_applications": "job_applications",
     "job_application_forms": "job_application_forms",
-    "meetings": "meetings"
+    "meetings": "meetings",
+    "user_stats": "user_stats",
+    "extraction_cache": "extraction_cache"
 } 
 
 
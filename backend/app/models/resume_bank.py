@@ -11,7 +11,7 @@ from datetime import datetime
 from enum import Enum
 
 # Resume analysis models removed - using simplified models
-from .job import CompatibilityScore
+from .job import CompatibilityScore, ExperienceLevel, JobRequirement
 
 
 class ResumeStatus(str, Enum):
@@ -36,6 +36,15 @@ class ResumeSource(str, Enum):
     IMPORTED = "imported"
 
 
+# Document fields copied as-is into ResumeBankEntry responses
+_DOCUMENT_FIELDS = (
+    "filename", "candidate_name", "candidate_email", "candidate_phone",
+    "candidate_location", "years_experience", "current_role", "desired_role",
+    "salary_expectation", "availability", "tags", "notes", "summary", "skills",
+    "education", "experience_level", "overall_assessment", "last_contact_date"
+)
+
+
 class ResumeBankEntry(BaseModel):
     """A resume entry in the resume bank."""
     id: str = Field(..., description="Unique identifier for the resume")
@@ -82,6 +91,24 @@ class ResumeBankEntry(BaseModel):
             except ValueError:
                 return None
         return v
+    
+    @classmethod
+    def from_document(cls, document: Any) -> "ResumeBankEntry":
+        """
+        Build a response entry from a ResumeBankEntryDocument.
+        
+        The document has already been validated, so validation is skipped and
+        fields are read straight off it instead of going through model_dump;
+        status is the only field whose type differs (str in the document).
+        """
+        data = {field: getattr(document, field) for field in _DOCUMENT_FIELDS}
+        return cls.model_construct(
+            id=str(document.id),
+            status=ResumeStatus(document.status),
+            created_date=document.created_at,
+            updated_date=document.updated_at,
+            **data
+        )
 
 
 class ResumeSearchFilters(BaseModel):
@@ -124,6 +151,32 @@ class CandidateMatch(BaseModel):
         return v
 
 
+class ResumeBankBatchRequest(BaseModel):
+    """Resume IDs for a bulk fetch or delete."""
+    ids: List[str] = Field(..., min_length=1, max_length=500, description="Resume IDs")
+
+
+class JobCriteria(BaseModel):
+    """Job criteria for a rule-based candidate search."""
+    title: str = Field("Unknown", description="Job title")
+    requirements: List[Union[JobRequirement, str]] = Field(default_factory=list, description="Requirements or plain skill names")
+    location: Optional[str] = Field(None, description="Preferred location")
+    experience_level: Optional[ExperienceLevel] = Field(None, description="Required experience level")
+    
+    @validator('experience_level', pre=True)
+    def validate_experience_level(cls, v):
+        """Accept any casing and treat an empty selection as no level."""
+        if isinstance(v, str):
+            return v.strip().lower() or None
+        return v
+    
+    @property
+    def skills(self) -> List[str]:
+        """Non-empty skill names from the requirements."""
+        skills = [req.skill if isinstance(req, JobRequirement) else req for req in self.requirements]
+        return [skill for skill in skills if skill]
+
+
 class ResumeBankStats(BaseModel):
     """Statistics for the resume bank."""
     total_resumes: int = Field(..., description="Total number of resumes")
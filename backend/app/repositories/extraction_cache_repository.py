@@ -0,0 +1,56 @@
+"""
+Extraction cache repository for MongoDB operations.
+
+Stores AI candidate extraction results keyed by a hash of the exact model
+input, so re-uploading the same resume (by any user, or after the original
+entry was deleted) doesn't pay for another OpenAI call.
+"""
+
+import hashlib
+from typing import Optional, Dict, Any
+from datetime import datetime
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from app.core.logging import logger
+
+from app.models.mongodb_models import COLLECTIONS
+
+
+def extraction_cache_key(model_settings: str, prompt: str) -> str:
+    """Hash the model settings and prompt; the length prefix keeps the two parts unambiguous."""
+    settings_bytes = model_settings.encode("utf-8")
+    digest = hashlib.sha256()
+    digest.update(len(settings_bytes).to_bytes(8, "big"))
+    digest.update(settings_bytes)
+    digest.update(prompt.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ExtractionCacheRepository:
+    """Repository for cached AI extraction results."""
+
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.extraction_cache = database[COLLECTIONS["extraction_cache"]]
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get cached extracted info, or None on a miss or lookup failure."""
+        try:
+            cached = await self.extraction_cache.find_one({"_id": key}, {"extracted_info": 1})
+        except Exception as e:
+            logger.warning(f"Extraction cache lookup failed: {e}")
+            return None
+        return cached["extracted_info"] if cached else None
+
+    async def set(self, key: str, model: str, extracted_info: Dict[str, Any]) -> None:
+        """Store extracted info; failures are logged and otherwise ignored."""
+        try:
+            await self.extraction_cache.update_one(
+                {"_id": key},
+                {"$set": {
+                    "model": model,
+                    "extracted_info": extracted_info,
+                    "created_at": datetime.utcnow()
+                }},
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"Failed to cache extraction result: {e}")
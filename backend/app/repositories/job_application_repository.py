@@ -1,7 +1,9 @@
+import asyncio
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import IndexModel
 
 from app.models.mongodb_models import JobApplicationFormDocument, JobApplicationDocument, COLLECTIONS
 
@@ -14,6 +16,18 @@ class JobApplicationRepository:
         self.job_application_forms = database[COLLECTIONS["job_application_forms"]]
         self.job_applications = database[COLLECTIONS["job_applications"]]
     
+    async def ensure_indexes(self) -> None:
+        """Create the indexes the repository relies on (no-op if they already exist)."""
+        # Forms and applications are always looked up by job
+        await asyncio.gather(
+            self.job_application_forms.create_indexes([
+                IndexModel([("job_id", 1)], name="job_id")
+            ]),
+            self.job_applications.create_indexes([
+                IndexModel([("job_id", 1), ("created_at", -1)], name="job_id_created_at")
+            ])
+        )
+    
     # Job Application Forms
     async def create_application_form(self, form_data: Dict[str, Any]) -> JobApplicationFormDocument:
         """Create a new job application form."""
@@ -96,6 +110,22 @@ class JobApplicationRepository:
         
         return applications
     
+    async def get_application_scores_by_job(self, job_id: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get the best-scored applications for a job, highest matching score first.
+        
+        Sorting and projection run in MongoDB, so only the summary fields of
+        the top applications are returned (as raw documents).
+        """
+        if not ObjectId.is_valid(job_id):
+            return []
+        
+        cursor = self.job_applications.find(
+            {"job_id": ObjectId(job_id)},
+            {"applicant_name": 1, "applicant_email": 1, "status": 1, "matching_score": 1, "created_at": 1}
+        ).sort([("matching_score", -1), ("created_at", -1)]).limit(limit)
+        return await cursor.to_list(length=limit)
+    
     async def get_application_by_id(self, application_id: str) -> Optional[JobApplicationDocument]:
         """Get application by ID."""
         if not ObjectId.is_valid(application_id):
@@ -2,10 +2,12 @@
 MongoDB repository for meeting operations.
 """
 
+import asyncio
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import IndexModel
 from app.models.mongodb_models import (
     MeetingDocument, MeetingSlotDocument, MeetingBookingDocument, MeetingTemplateDocument,
     MeetingStatus, BookingStatus
@@ -22,6 +24,24 @@ class MeetingRepository:
         self.meeting_bookings = database.meeting_bookings
         self.meeting_templates = database.meeting_templates
     
+    async def ensure_indexes(self) -> None:
+        """Create the indexes the repository relies on (no-op if they already exist)."""
+        await asyncio.gather(
+            self.meetings.create_indexes([
+                IndexModel([("user_id", 1), ("status", 1)], name="user_id_status"),
+                IndexModel([("public_link", 1)], name="public_link")
+            ]),
+            self.meeting_slots.create_indexes([
+                IndexModel([("meeting_id", 1)], name="meeting_id")
+            ]),
+            self.meeting_bookings.create_indexes([
+                IndexModel([("meeting_id", 1)], name="meeting_id")
+            ]),
+            self.meeting_templates.create_indexes([
+                IndexModel([("user_id", 1)], name="user_id")
+            ])
+        )
+    
     async def create_meeting(self, meeting_data: Dict[str, Any]) -> MeetingDocument:
         """Create a new meeting."""
         meeting = MeetingDocument(**meeting_data)
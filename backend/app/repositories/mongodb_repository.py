@@ -5,12 +5,16 @@ This module provides MongoDB-specific database operations,
 replacing the SQLAlchemy repository with flexible document operations.
 """
 
+import asyncio
+import time
+import uuid
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from pymongo import MongoClient
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from pymongo import ReturnDocument, IndexModel
+from typing import List, Optional, Dict, Any, Tuple, Sequence
+from datetime import datetime, timedelta
 from bson import ObjectId
 from app.core.logging import logger
+from app.repositories.user_stats_repository import UserStatsRepository, RECENT_UPLOAD_DAYS
 
 from app.models.mongodb_models import (
     JobPostingDocument,
@@ -20,8 +24,56 @@ from app.models.mongodb_models import (
     HiringProcessDocument,
     ProcessStatus,
     CandidateStageStatus,
-    COLLECTIONS
+    COLLECTIONS,
+    resume_search_fields,
+    ROLE_KEYWORDS_PATTERN,
+    LOCATION_TOKEN_PATTERN,
+    location_tokens
 )
+from app.models.job import EXPERIENCE_LEVEL_YEARS
+
+# Short-lived cache of job postings for read-heavy flows such as paging through
+# candidate search results. It is module-level so every repository instance in the
+# process sees the invalidations made by update_job_posting/delete_job_posting.
+JOB_CACHE_TTL_SECONDS = 60
+JOB_CACHE_MAX_SIZE = 1024
+_job_posting_cache: Dict[str, Tuple[float, JobPostingDocument]] = {}
+
+# Ranked candidate ids and scores per (user, search parameters), so paging through
+# the same search reuses one scoring pass. Resume writes in this process invalidate
+# the owner's rankings; the TTL bounds staleness from writes made elsewhere.
+CANDIDATE_RANKING_TTL_SECONDS = 30
+CANDIDATE_RANKING_SIZE = 500
+CANDIDATE_RANKING_MAX_ENTRIES = 256
+_candidate_ranking_cache: Dict[Tuple[Any, ...], Tuple[float, List[Dict[str, Any]], int]] = {}
+
+
+def invalidate_candidate_rankings(user_id: Any = None) -> None:
+    """Drop the cached candidate rankings of a user, or of every user if user_id is None."""
+    if user_id is None:
+        _candidate_ranking_cache.clear()
+        return
+    user_key = str(user_id)
+    for key in [key for key in _candidate_ranking_cache if key[0] == user_key]:
+        del _candidate_ranking_cache[key]
+
+# Candidate search sort options and the aggregation field each one sorts on
+_CANDIDATE_SORT_FIELDS = {
+    "score": "scores.overall",
+    "experience": "years",
+    "name": "name_lower"
+}
+
+
+def _location_tokens_expression(location: str) -> Dict[str, Any]:
+    """Aggregation equivalent of location_tokens for a location field path."""
+    return {"$setUnion": [{"$map": {
+        "input": {"$regexFindAll": {
+            "input": {"$cond": [{"$eq": [{"$type": location}, "string"]}, {"$toLower": location}, ""]},
+            "regex": LOCATION_TOKEN_PATTERN
+        }},
+        "in": "$$this.match"
+    }}]}
 
 
 class MongoDBRepository:
@@ -34,7 +86,95 @@ class MongoDBRepository:
         self.resume_bank_entries = database[COLLECTIONS["resume_bank_entries"]]
         self.users = database[COLLECTIONS["users"]]
         self.hiring_processes = database[COLLECTIONS["hiring_processes"]]
+        self.user_stats = UserStatsRepository(database)
+    
+    async def ensure_indexes(self) -> None:
+        """Create the indexes the repository relies on (no-op if they already exist)."""
+        # One createIndexes call per collection, all sent concurrently
+        await asyncio.gather(
+            self._ensure_resume_bank_indexes(),
+            self.job_postings.create_indexes([
+                IndexModel([("user_id", 1)], name="user_id")
+            ]),
+            self.hiring_processes.create_indexes([
+                IndexModel([("user_id", 1), ("created_at", -1)], name="user_id_created_at")
+            ]),
+            # Login looks users up by email or username
+            self.users.create_indexes([
+                IndexModel([("email", 1)], name="email"),
+                IndexModel([("username", 1)], name="username")
+            ])
+        )
     
+    async def _ensure_resume_bank_indexes(self) -> None:
+        """Create the resume bank indexes."""
+        # One entry per resume text per user; older entries without a hash are exempt
+        await self.resume_bank_entries.create_index(
+            [("user_id", 1), ("text_hash", 1)],
+            name="user_id_text_hash_unique",
+            unique=True,
+            partialFilterExpression={"text_hash": {"$exists": True}}
+        )
+        # Candidate search and the resume bank listing are always scoped to one user
+        await self.resume_bank_entries.create_indexes([
+            IndexModel([("user_id", 1), ("years_experience", 1)], name="user_id_years_experience"),
+            IndexModel([("user_id", 1), ("skills", 1)], name="user_id_skills"),
+            IndexModel([("user_id", 1), ("skills_lower", 1)], name="user_id_skills_lower"),
+            IndexModel([("user_id", 1), ("candidate_location_lower", 1)], name="user_id_candidate_location_lower"),
+            IndexModel([("user_id", 1), ("created_at", -1)], name="user_id_created_at"),
+            IndexModel([("user_id", 1), ("status", 1), ("created_at", -1)], name="user_id_status_created_at"),
+            IndexModel([("user_id", 1), ("tags", 1)], name="user_id_tags"),
+            IndexModel([("user_id", 1), ("file_hash", 1)], name="user_id_file_hash")
+        ])
+    
+    async def backfill_resume_search_fields(self) -> int:
+        """
+        Store the resume_search_fields values on entries written before those fields existed,
+        and normalize tags stored before they were normalized on write.
+        
+        Returns:
+            Number of entries updated
+        """
+        def role_keyword(field: str) -> Dict[str, Any]:
+            return {"$and": [
+                {"$eq": [{"$type": f"${field}"}, "string"]},
+                {"$regexMatch": {"input": {"$toLower": f"${field}"}, "regex": ROLE_KEYWORDS_PATTERN}}
+            ]}
+        
+        result = await self.resume_bank_entries.update_many(
+            {"$or": [
+                {"skills_lower": {"$exists": False}},
+                {"candidate_location_lower": {"$exists": False}},
+                {"location_tokens": {"$exists": False}},
+                {"current_role_keyword": {"$exists": False}},
+                {"desired_role_keyword": {"$exists": False}},
+                # Tags stored before normalize_tags: any with capitals or surrounding spaces
+                {"tags": {"$elemMatch": {"$regex": r"[A-Z]|^\s|\s$"}}}
+            ]},
+            [{"$set": {
+                "skills_lower": {"$setUnion": [
+                    {"$map": {"input": {"$ifNull": ["$skills", []]}, "in": {"$toLower": "$$this"}}}
+                ]},
+                "candidate_location_lower": {"$cond": [
+                    {"$eq": [{"$type": "$candidate_location"}, "string"]},
+                    {"$toLower": "$candidate_location"},
+                    ""
+                ]},
+                "location_tokens": _location_tokens_expression("$candidate_location"),
+                "current_role_keyword": role_keyword("current_role"),
+                "desired_role_keyword": role_keyword("desired_role"),
+                "tags": {"$filter": {
+                    "input": {"$setUnion": [{"$map": {
+                        "input": {"$ifNull": ["$tags", []]},
+                        "in": {"$toLower": {"$trim": {"input": {"$toString": "$$this"}}}}
+                    }}]},
+                    "cond": {"$ne": ["$$this", ""]}
+                }}
+            }}]
+        )
+        invalidate_candidate_rankings()
+        return result.modified_count
+
     # Job Posting operations
     async def create_job_posting(self, job_data: Dict[str, Any]) -> JobPostingDocument:
         """Create a new job posting."""
@@ -57,6 +197,21 @@ class MongoDBRepository:
             logger.error(f"Error getting job posting {job_id}: {e}")
             return None
     
+    async def get_job_posting_by_id_cached(self, job_id: str) -> Optional[JobPostingDocument]:
+        """Get a job posting by ID, served from a short-TTL cache when possible."""
+        now = time.monotonic()
+        cached = _job_posting_cache.get(job_id)
+        if cached and cached[0] > now:
+            return cached[1]
+        
+        job = await self.get_job_posting_by_id(job_id)
+        if job:
+            if job_id not in _job_posting_cache and len(_job_posting_cache) >= JOB_CACHE_MAX_SIZE:
+                # Evict the oldest entry
+                _job_posting_cache.pop(next(iter(_job_posting_cache)))
+            _job_posting_cache[job_id] = (now + JOB_CACHE_TTL_SECONDS, job)
+        return job
+    
     async def get_all_job_postings(self) -> List[JobPostingDocument]:
         """Get all job postings."""
         cursor = self.job_postings.find()
@@ -65,9 +220,16 @@ class MongoDBRepository:
             jobs.append(JobPostingDocument(**job_data))
         return jobs
     
-    async def get_job_postings_by_user(self, user_id: ObjectId) -> List[JobPostingDocument]:
-        """Get job postings for a specific user."""
-        cursor = self.job_postings.find({"user_id": user_id})
+    async def get_job_postings_by_user(
+        self,
+        user_id: ObjectId,
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> List[JobPostingDocument]:
+        """Get job postings for a specific user, optionally only one page of them."""
+        cursor = self.job_postings.find({"user_id": user_id}).skip(skip)
+        if limit is not None:
+            cursor = cursor.limit(limit)
         jobs = []
         async for job_data in cursor:
             jobs.append(JobPostingDocument(**job_data))
@@ -81,6 +243,7 @@ class MongoDBRepository:
             {"_id": ObjectId(job_id)},
             {"$set": update_data}
         )
+        _job_posting_cache.pop(job_id, None)
         
         if result.modified_count > 0:
             return await self.get_job_posting_by_id(job_id)
@@ -89,6 +252,7 @@ class MongoDBRepository:
     async def delete_job_posting(self, job_id: str) -> bool:
         """Delete a job posting."""
         result = await self.job_postings.delete_one({"_id": ObjectId(job_id)})
+        _job_posting_cache.pop(job_id, None)
         return result.deleted_count > 0
     
     # Resume Analysis operations
@@ -137,12 +301,16 @@ class MongoDBRepository:
         """Create a new resume bank entry."""
         entry_data["created_at"] = datetime.utcnow()
         entry_data["updated_at"] = datetime.utcnow()
+        entry_data.update(resume_search_fields(entry_data))
         
         result = await self.resume_bank_entries.insert_one(entry_data)
         entry_data["_id"] = result.inserted_id
         entry_data["id"] = str(result.inserted_id)
         
-        return ResumeBankEntryDocument(**entry_data)
+        entry = ResumeBankEntryDocument(**entry_data)
+        invalidate_candidate_rankings(entry.user_id)
+        await self.user_stats.record_resume_created(entry.user_id, entry.status, entry.created_at)
+        return entry
     
     async def get_resume_bank_entry_by_id(self, entry_id: str) -> Optional[ResumeBankEntryDocument]:
         """Get a resume bank entry by ID."""
@@ -158,6 +326,50 @@ class MongoDBRepository:
             logger.error(f"Error getting resume bank entry {entry_id}: {e}")
             return None
     
+    async def get_resume_bank_entry_by_text_hash(self, user_id: ObjectId, text_hash: str) -> Optional[ResumeBankEntryDocument]:
+        """Get a user's resume bank entry with the given resume text hash."""
+        entry_data = await self.resume_bank_entries.find_one({"user_id": user_id, "text_hash": text_hash})
+        if entry_data:
+            entry_data["id"] = str(entry_data["_id"])
+            return ResumeBankEntryDocument(**entry_data)
+        return None
+    
+    async def get_resume_bank_entry_by_file_hash(self, user_id: ObjectId, file_hash: str) -> Optional[ResumeBankEntryDocument]:
+        """Get a user's resume bank entry whose uploaded PDF has the given SHA-256."""
+        entry_data = await self.resume_bank_entries.find_one({"user_id": user_id, "file_hash": file_hash})
+        if entry_data:
+            entry_data["id"] = str(entry_data["_id"])
+            return ResumeBankEntryDocument(**entry_data)
+        return None
+    
+    async def get_resume_bank_entries_by_ids(
+        self,
+        user_id: ObjectId,
+        entry_ids: List[str],
+        projection: Optional[Dict[str, Any]] = None
+    ) -> List[ResumeBankEntryDocument]:
+        """
+        Get a user's resume bank entries with the given IDs in one query (invalid IDs are skipped).
+        
+        projection may only exclude optional fields, since results are still
+        validated as ResumeBankEntryDocument.
+        """
+        object_ids = [ObjectId(entry_id) for entry_id in entry_ids if ObjectId.is_valid(entry_id)]
+        if not object_ids:
+            return []
+        cursor = self.resume_bank_entries.find({
+            "_id": {"$in": object_ids},
+            "$or": [
+                {"user_id": user_id},
+                {"user_id": str(user_id)}
+            ]
+        }, projection)
+        entries = []
+        async for entry_data in cursor:
+            entry_data["id"] = str(entry_data["_id"])
+            entries.append(ResumeBankEntryDocument(**entry_data))
+        return entries
+    
     async def get_all_resume_bank_entries(self, skip: int = 0, limit: int = 100) -> List[ResumeBankEntryDocument]:
         """Get all resume bank entries with pagination."""
         cursor = self.resume_bank_entries.find().skip(skip).limit(limit).sort("created_at", -1)
@@ -169,16 +381,31 @@ class MongoDBRepository:
             entries.append(ResumeBankEntryDocument(**entry_data))
         return entries
     
-    async def get_resume_bank_entries_by_user(self, user_id: ObjectId, skip: int = 0, limit: int = 100) -> List[ResumeBankEntryDocument]:
-        """Get resume bank entries for a specific user."""
+    async def get_resume_bank_entries_by_user(
+        self,
+        user_id: ObjectId,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> List[ResumeBankEntryDocument]:
+        """
+        Get resume bank entries for a specific user, optionally narrowed by extra field filters.
+        
+        projection may only exclude optional fields, since results are still
+        validated as ResumeBankEntryDocument.
+        """
         # Handle both string and ObjectId user_ids for backward compatibility
         user_id_str = str(user_id)
-        cursor = self.resume_bank_entries.find({
+        query = {
             "$or": [
                 {"user_id": user_id},
                 {"user_id": user_id_str}
             ]
-        }).skip(skip).limit(limit).sort("created_at", -1)
+        }
+        if filters:
+            query.update(filters)
+        cursor = self.resume_bank_entries.find(query, projection).skip(skip).limit(limit).sort("created_at", -1)
         entries = []
         async for entry_data in cursor:
             # Ensure the _id field is properly mapped to id
@@ -188,22 +415,80 @@ class MongoDBRepository:
         return entries
     
     async def update_resume_bank_entry(self, entry_id: str, update_data: Dict[str, Any]) -> Optional[ResumeBankEntryDocument]:
-        """Update a resume bank entry."""
+        """
+        Update a resume bank entry in a single round trip.
+        
+        Returns:
+            The updated entry, or None if it does not exist
+        """
+        if not ObjectId.is_valid(entry_id):
+            return None
         update_data["updated_at"] = datetime.utcnow()
+        update_data.update(resume_search_fields(update_data))
         
-        result = await self.resume_bank_entries.update_one(
+        # The previous document has the old status for the per-user counters, and
+        # applying the $set to it gives the updated entry without reading it back
+        previous = await self.resume_bank_entries.find_one_and_update(
             {"_id": ObjectId(entry_id)},
-            {"$set": update_data}
+            {"$set": update_data},
+            return_document=ReturnDocument.BEFORE
         )
-        
-        if result.modified_count > 0:
-            return await self.get_resume_bank_entry_by_id(entry_id)
-        return None
+        if not previous:
+            return None
+        invalidate_candidate_rankings(previous["user_id"])
+        if "status" in update_data:
+            await self.user_stats.record_resume_status_change(
+                previous["user_id"], previous.get("status", "active"), update_data["status"]
+            )
+        
+        entry_data = {**previous, **update_data}
+        entry_data["id"] = str(entry_data["_id"])
+        return ResumeBankEntryDocument(**entry_data)
     
     async def delete_resume_bank_entry(self, entry_id: str) -> bool:
         """Delete a resume bank entry."""
-        result = await self.resume_bank_entries.delete_one({"_id": ObjectId(entry_id)})
-        return result.deleted_count > 0
+        deleted = await self.resume_bank_entries.find_one_and_delete(
+            {"_id": ObjectId(entry_id)},
+            projection={"user_id": 1, "status": 1}
+        )
+        if not deleted:
+            return False
+        invalidate_candidate_rankings(deleted["user_id"])
+        await self.user_stats.record_resume_deleted(deleted["user_id"], deleted.get("status", "active"))
+        return True
+    
+    async def delete_resume_bank_entries(self, user_id: ObjectId, entry_ids: List[str]) -> List[str]:
+        """
+        Delete a user's resume bank entries with the given IDs.
+        
+        Returns:
+            IDs of the entries that were deleted
+        """
+        object_ids = [ObjectId(entry_id) for entry_id in entry_ids if ObjectId.is_valid(entry_id)]
+        if not object_ids:
+            return []
+        # Read statuses first so the per-user counters can be adjusted in one update
+        entries = await self.resume_bank_entries.find(
+            {
+                "_id": {"$in": object_ids},
+                "$or": [
+                    {"user_id": user_id},
+                    {"user_id": str(user_id)}
+                ]
+            },
+            projection={"status": 1}
+        ).to_list(length=None)
+        if not entries:
+            return []
+        
+        found_ids = [entry["_id"] for entry in entries]
+        result = await self.resume_bank_entries.delete_many({"_id": {"$in": found_ids}})
+        invalidate_candidate_rankings(user_id)
+        await self.user_stats.record_resumes_deleted(user_id, [entry.get("status", "active") for entry in entries])
+        if result.deleted_count != len(entries):
+            # Some entries were deleted concurrently and already counted
+            await self.user_stats.invalidate_resume_stats(user_id)
+        return [str(entry_id) for entry_id in found_ids]
     
     async def search_resume_bank_entries(self, filters: Dict[str, Any]) -> List[ResumeBankEntryDocument]:
         """Search resume bank entries with filters."""
@@ -218,15 +503,8 @@ class MongoDBRepository:
         
         if filters.get("experience_level"):
             # Map experience level to years
-            exp_mapping = {
-                "entry": (0, 2),
-                "junior": (1, 3),
-                "mid": (3, 7),
-                "senior": (5, 10),
-                "lead": (8, 15)
-            }
-            if filters["experience_level"] in exp_mapping:
-                min_exp, max_exp = exp_mapping[filters["experience_level"]]
+            if filters["experience_level"] in EXPERIENCE_LEVEL_YEARS:
+                min_exp, max_exp = EXPERIENCE_LEVEL_YEARS[filters["experience_level"]]
                 query["years_experience"] = {"$gte": min_exp, "$lte": max_exp}
         
         if filters.get("status"):
@@ -238,6 +516,325 @@ class MongoDBRepository:
             entries.append(ResumeBankEntryDocument(**entry_data))
         return entries
     
+    async def aggregate_candidate_matches(
+        self,
+        user_id: ObjectId,
+        job_skills: Sequence[str],
+        expected_range: Tuple[int, int],
+        job_role_match: bool,
+        role_pattern: str,
+        location: Optional[str] = None,
+        required_skills: Optional[List[str]] = None,
+        experience_min: Optional[int] = None,
+        experience_max: Optional[int] = None,
+        min_score: Optional[float] = None,
+        sort_by: str = "score",
+        sort_order: str = "desc",
+        skip: int = 0,
+        limit: int = 10
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Score, filter, sort and paginate a user's resumes against a job in MongoDB.
+        
+        Scores use the weighting of the candidate search endpoint: skills 40%,
+        experience 30%, role 20% and location 10%. Only the requested page is
+        returned.
+        
+        Args:
+            user_id: Owner of the resume bank
+            job_skills: Lowercased job requirement skills
+            expected_range: (min, max) years of experience expected for the job
+            job_role_match: Whether the job title contains a role keyword
+            role_pattern: Regex alternation of lowercased role keywords
+            location: Preferred location (filters and scores)
+            required_skills: Lowercased skills; resumes must have at least one
+            experience_min: Minimum years of experience
+            experience_max: Maximum years of experience
+            min_score: Minimum overall score
+            sort_by: score, experience or name
+            sort_order: asc or desc
+            skip: Number of matches to skip
+            limit: Page size
+            
+        Returns:
+            Tuple of (page of projected resume dicts with score fields, total matches)
+        """
+        user_id_str = str(user_id)
+        expected_min, expected_max = expected_range
+        # User-supplied strings are wrapped in $literal so a leading "$" isn't read as a field path
+        job_skills_literal = {"$literal": job_skills}
+        
+        # Best overall score a resume can reach with no job skills: full experience,
+        # role and location marks. Above that, resumes without a skill match can be
+        # dropped before scoring.
+        max_score_without_skills = (30 * 100 + 20 * (100 if job_role_match else 30) + 10 * (100 if location else 0)) / 100
+        needs_skill_match = bool(job_skills) and bool(min_score) and min_score > max_score_without_skills
+        
+        match_stage: Dict[str, Any] = {
+            "$or": [
+                {"user_id": user_id},
+                {"user_id": user_id_str}
+            ]
+        }
+        prefilter_skills = required_skills or (list(job_skills) if needs_skill_match else None)
+        if prefilter_skills:
+            # Index-backed prefilter on the stored lowercased skills; entries written
+            # before skills_lower existed fall through to the $expr filters below
+            match_stage = {"$and": [
+                match_stage,
+                {"$or": [
+                    {"skills_lower": {"$in": prefilter_skills}},
+                    {"skills_lower": {"$exists": False}}
+                ]}
+            ]}
+        
+        pipeline: List[Dict[str, Any]] = [
+            {"$match": match_stage},
+            {
+                # Only the fields used for filtering, scoring, sorting and the CandidateMatch response
+                "$project": {
+                    "candidate_name": 1, "candidate_email": 1, "candidate_location": 1,
+                    "years_experience": 1, "current_role": 1, "desired_role": 1,
+                    "status": 1, "skills": 1, "created_at": 1,
+                    "skills_lower": 1, "location_tokens": 1,
+                    "current_role_keyword": 1, "desired_role_keyword": 1
+                }
+            },
+            {
+                # Lowercased skills and location words are stored at write time; compute them for older entries
+                "$addFields": {
+                    "skills_lower": {"$ifNull": [
+                        "$skills_lower",
+                        {"$map": {"input": {"$ifNull": ["$skills", []]}, "in": {"$toLower": "$$this"}}}
+                    ]},
+                    "years": {"$convert": {"input": "$years_experience", "to": "double", "onError": 0, "onNull": 0}},
+                    "location_tokens": {"$ifNull": ["$location_tokens", _location_tokens_expression("$candidate_location")]}
+                }
+            }
+        ]
+        
+        job_location_tokens = location_tokens(location)
+        job_tokens_literal = {"$literal": job_location_tokens}
+        
+        # Filters that only depend on the resume; applied before scoring
+        filter_conditions = []
+        if job_location_tokens:
+            # Same test as a non-zero location score, so partial (50) matches are kept;
+            # resumes without a location are kept too
+            filter_conditions.append({"$or": [
+                {"$eq": [{"$size": "$location_tokens"}, 0]},
+                {"$gt": [{"$size": {"$setIntersection": ["$location_tokens", job_tokens_literal]}}, 0]}
+            ]})
+        # Resumes without years of experience are kept
+        if experience_min:
+            filter_conditions.append({"$or": [{"$eq": ["$years", 0]}, {"$gte": ["$years", experience_min]}]})
+        if experience_max:
+            filter_conditions.append({"$or": [{"$eq": ["$years", 0]}, {"$lte": ["$years", experience_max]}]})
+        if required_skills:
+            # Has at least one of the required skills: one set intersection instead of an $in per skill
+            filter_conditions.append({"$gt": [
+                {"$size": {"$setIntersection": ["$skills_lower", {"$literal": required_skills}]}}, 0
+            ]})
+        if filter_conditions:
+            pipeline.append({"$match": {"$expr": {"$and": filter_conditions}}})
+        
+        # Counting only needs the scoring stages when filtering on min_score
+        count_pipeline = list(pipeline)
+        
+        # 1. Skills: share of job skills the resume has
+        if job_skills:
+            skills_score = {"$multiply": [{"$divide": ["$matching_skills_count", len(job_skills)]}, 100]}
+        else:
+            skills_score = 60
+        
+        # 2. Experience: full marks inside the expected range
+        experience_score = {"$switch": {
+            "branches": [
+                {"case": {"$and": [{"$gte": ["$years", expected_min]}, {"$lte": ["$years", expected_max]}]}, "then": 100},
+                {"case": {"$gt": ["$years", expected_max]}, "then": 80},  # Overqualified but still good
+                {"case": {"$gt": ["$years", 0]}, "then": {"$max": [20, {"$multiply": [{"$divide": ["$years", max(expected_min, 1)]}, 60]}]}}
+            ],
+            "default": 10
+        }}
+        
+        # 3. Role: both the job title and the resume roles mention a role keyword.
+        # The resume side is a flag stored at write time; older entries fall back to a regex
+        if job_role_match:
+            role_score = {"$cond": [
+                {"$or": [
+                    {"$ifNull": ["$current_role_keyword", {"$regexMatch": {
+                        "input": {"$toLower": {"$ifNull": ["$current_role", ""]}}, "regex": role_pattern
+                    }}]},
+                    {"$ifNull": ["$desired_role_keyword", {"$regexMatch": {
+                        "input": {"$toLower": {"$ifNull": ["$desired_role", ""]}}, "regex": role_pattern
+                    }}]}
+                ]},
+                100,
+                30
+            ]}
+        else:
+            role_score = 30
+        
+        # 4. Location: all words in common (either way round) or some words in common
+        if job_location_tokens:
+            location_score = {"$switch": {
+                "branches": [
+                    {"case": {"$eq": [{"$size": "$location_tokens"}, 0]}, "then": 0},
+                    {"case": {"$or": [
+                        {"$setIsSubset": [job_tokens_literal, "$location_tokens"]},
+                        {"$setIsSubset": ["$location_tokens", job_tokens_literal]}
+                    ]}, "then": 100},
+                    {"case": {"$gt": [{"$size": {"$setIntersection": ["$location_tokens", job_tokens_literal]}}, 0]}, "then": 50}
+                ],
+                "default": 0
+            }}
+        else:
+            location_score = 0
+        
+        # The intersection is computed once and reused by the skills score and match reasons
+        pipeline.append(
+            {"$addFields": {"matching_skills_count": {"$size": {"$setIntersection": ["$skills_lower", job_skills_literal]}}}}
+        )
+        if needs_skill_match:
+            pipeline.append({"$match": {"matching_skills_count": {"$gt": 0}}})
+        
+        # Component scores and the weighted total in one stage: $let evaluates each
+        # component once and the total reuses it, so every resume is rewritten once
+        pipeline.append({
+            "$addFields": {
+                "scores": {"$let": {
+                    "vars": {
+                        "skills": skills_score,
+                        "experience": experience_score,
+                        "role": role_score,
+                        "location": location_score
+                    },
+                    "in": {
+                        "skills": "$$skills",
+                        "experience": "$$experience",
+                        "role": "$$role",
+                        "location": "$$location",
+                        # Integer weights (percent) and one division: integer component
+                        # scores sum exactly, so thresholds like min_score=70 aren't
+                        # missed by float error from 0.4/0.3/0.2/0.1 products
+                        "overall": {"$divide": [
+                            {"$add": [
+                                {"$multiply": ["$$skills", 40]},
+                                {"$multiply": ["$$experience", 30]},
+                                {"$multiply": ["$$role", 20]},
+                                {"$multiply": ["$$location", 10]}
+                            ]},
+                            100
+                        ]}
+                    }
+                }}
+            }
+        })
+        
+        if min_score and min_score > 0:
+            pipeline.append({"$match": {"scores.overall": {"$gte": min_score}}})
+            count_pipeline = list(pipeline)
+        count_pipeline.append({"$count": "count"})
+        
+        # Unknown sort fields fall back to best score first; newest first among equal sort keys
+        sort_field = _CANDIDATE_SORT_FIELDS.get(sort_by)
+        if sort_field:
+            direction = -1 if sort_order.lower() == "desc" else 1
+        else:
+            sort_field, direction = "scores.overall", -1
+        if sort_field == "name_lower":
+            pipeline.append({"$addFields": {"name_lower": {"$toLower": "$candidate_name"}}})
+        sort_stage = {sort_field: direction, "created_at": -1, "_id": -1}
+        
+        if skip + limit <= CANDIDATE_RANKING_SIZE:
+            cache_key = (
+                user_id_str, tuple(job_skills), tuple(expected_range), job_role_match, role_pattern,
+                location, tuple(required_skills or ()), experience_min, experience_max,
+                min_score, sort_field, direction
+            )
+            now = time.monotonic()
+            cached = _candidate_ranking_cache.get(cache_key)
+            if cached and cached[0] > now:
+                ranking, total = cached[1], cached[2]
+            else:
+                # Rank the first CANDIDATE_RANKING_SIZE matches once, keeping only ids and scores
+                ranking_pipeline = pipeline + [
+                    {"$sort": sort_stage},
+                    {"$limit": CANDIDATE_RANKING_SIZE},
+                    {"$project": {"scores": 1, "matching_skills_count": 1}}
+                ]
+                ranking, count_result = await asyncio.gather(
+                    self.resume_bank_entries.aggregate(ranking_pipeline).to_list(length=CANDIDATE_RANKING_SIZE),
+                    self.resume_bank_entries.aggregate(count_pipeline).to_list(length=1)
+                )
+                total = count_result[0]["count"] if count_result else 0
+                if cache_key not in _candidate_ranking_cache and len(_candidate_ranking_cache) >= CANDIDATE_RANKING_MAX_ENTRIES:
+                    # Evict the oldest entry
+                    _candidate_ranking_cache.pop(next(iter(_candidate_ranking_cache)))
+                _candidate_ranking_cache[cache_key] = (now + CANDIDATE_RANKING_TTL_SECONDS, ranking, total)
+            return await self._load_ranked_candidates(ranking[skip:skip + limit]), total
+        
+        # $sort directly followed by $skip/$limit lets MongoDB run a top-k sort that
+        # only keeps skip + limit documents in memory, instead of sorting every match
+        pipeline.extend([
+            {"$sort": sort_stage},
+            {"$skip": skip},
+            {"$limit": limit},
+            # Flatten the scores for the returned page only
+            {"$addFields": {
+                "years_experience": {"$convert": {"input": "$years_experience", "to": "int", "onError": None, "onNull": None}},
+                "overall_score": "$scores.overall",
+                "skills_score": "$scores.skills",
+                "experience_score": "$scores.experience",
+                "role_score": "$scores.role",
+                "location_score": "$scores.location"
+            }},
+            {"$project": {
+                "scores": 0, "skills": 0, "created_at": 0, "skills_lower": 0,
+                "location_tokens": 0, "years": 0, "name_lower": 0,
+                "current_role_keyword": 0, "desired_role_keyword": 0, "desired_role": 0
+            }}
+        ])
+        
+        items, count_result = await asyncio.gather(
+            self.resume_bank_entries.aggregate(pipeline).to_list(length=limit),
+            self.resume_bank_entries.aggregate(count_pipeline).to_list(length=1)
+        )
+        total = count_result[0]["count"] if count_result else 0
+        return items, total
+    
+    async def _load_ranked_candidates(self, ranked: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fetch the response fields of a page of ranked candidates and merge in their scores."""
+        if not ranked:
+            return []
+        documents = await self.resume_bank_entries.aggregate([
+            {"$match": {"_id": {"$in": [candidate["_id"] for candidate in ranked]}}},
+            {"$project": {
+                "candidate_name": 1, "candidate_email": 1, "candidate_location": 1,
+                "current_role": 1, "status": 1,
+                "years_experience": {"$convert": {"input": "$years_experience", "to": "int", "onError": None, "onNull": None}}
+            }}
+        ]).to_list(length=len(ranked))
+        documents_by_id = {document["_id"]: document for document in documents}
+        
+        items = []
+        for candidate in ranked:
+            document = documents_by_id.get(candidate["_id"])
+            if document is None:
+                # Deleted since the ranking was cached
+                continue
+            scores = candidate["scores"]
+            document.update(
+                matching_skills_count=candidate["matching_skills_count"],
+                overall_score=scores["overall"],
+                skills_score=scores["skills"],
+                experience_score=scores["experience"],
+                role_score=scores["role"],
+                location_score=scores["location"]
+            )
+            items.append(document)
+        return items
+    
     async def get_resume_bank_stats(self) -> Dict[str, Any]:
         """Get resume bank statistics."""
         pipeline = [
@@ -263,8 +860,31 @@ class MongoDBRepository:
     
     async def get_resume_bank_stats_by_user(self, user_id: ObjectId) -> Dict[str, Any]:
         """Get resume bank statistics for a specific user."""
+        # Counters are maintained incrementally on create/update/delete
+        stats = await self.user_stats.get_resume_stats(user_id)
+        if stats is not None:
+            return stats
+        
+        # First read for this user (or counters invalidated): count once and seed,
+        # unless a write lands while counting
+        version = await self.user_stats.get_resume_stats_version(user_id)
+        stats = await self._count_resume_bank_stats_by_user(user_id)
+        await self.user_stats.seed_resume_stats(
+            user_id, version, stats["total_entries"], stats["status_breakdown"], stats["uploads_by_day"]
+        )
+        return {
+            "total_entries": stats["total_entries"],
+            "status_breakdown": stats["status_breakdown"],
+            "recent_uploads": sum(stats["uploads_by_day"].values())
+        }
+    
+    async def _count_resume_bank_stats_by_user(self, user_id: ObjectId) -> Dict[str, Any]:
+        """Count a user's resume bank statistics directly from the entries."""
         # Handle both string and ObjectId user_ids for backward compatibility
         user_id_str = str(user_id)
+        cutoff = datetime.utcnow() - timedelta(days=RECENT_UPLOAD_DAYS)
+        # Status breakdown and per-day uploads in one round trip; the total is
+        # the sum of the status groups, so it needs no separate count
         pipeline = [
             {
                 "$match": {
@@ -275,28 +895,79 @@ class MongoDBRepository:
                 }
             },
             {
-                "$group": {
-                    "_id": "$status",
-                    "count": {"$sum": 1}
+                "$facet": {
+                    "by_status": [
+                        {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+                    ],
+                    "uploads_by_day": [
+                        {"$match": {"created_at": {"$gte": cutoff}}},
+                        {
+                            "$group": {
+                                "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}},
+                                "count": {"$sum": 1}
+                            }
+                        }
+                    ]
                 }
             }
         ]
         
-        cursor = self.resume_bank_entries.aggregate(pipeline)
-        status_counts = {}
-        async for result in cursor:
-            status_counts[result["_id"]] = result["count"]
+        results = await self.resume_bank_entries.aggregate(pipeline).to_list(length=1)
+        facets = results[0] if results else {}
+        status_counts = {result["_id"]: result["count"] for result in facets.get("by_status", [])}
+        uploads_by_day = {result["_id"]: result["count"] for result in facets.get("uploads_by_day", [])}
         
-        total_entries = await self.resume_bank_entries.count_documents({
-            "$or": [
-                {"user_id": user_id},
-                {"user_id": user_id_str}
-            ]
-        })
+        return {
+            "total_entries": sum(status_counts.values()),
+            "status_breakdown": status_counts,
+            "uploads_by_day": uploads_by_day
+        }
+    
+    async def get_resume_bank_distributions_by_user(self, user_id: ObjectId, limit: int = 10) -> Dict[str, Any]:
+        """Get the most common skills, experience levels and locations in a user's resume bank."""
+        # Handle both string and ObjectId user_ids for backward compatibility
+        user_id_str = str(user_id)
+        pipeline = [
+            {
+                "$match": {
+                    "$or": [
+                        {"user_id": user_id},
+                        {"user_id": user_id_str}
+                    ]
+                }
+            },
+            {"$project": {"skills": 1, "experience_level": 1, "candidate_location": 1}},
+            {
+                "$facet": {
+                    "top_skills": [
+                        {"$unwind": "$skills"},
+                        {"$group": {"_id": {"$toLower": "$skills"}, "count": {"$sum": 1}}},
+                        {"$sort": {"count": -1, "_id": 1}},
+                        {"$limit": limit}
+                    ],
+                    "experience": [
+                        {"$match": {"experience_level": {"$nin": [None, ""]}}},
+                        {"$group": {"_id": "$experience_level", "count": {"$sum": 1}}}
+                    ],
+                    "locations": [
+                        {"$match": {"candidate_location": {"$nin": [None, ""]}}},
+                        {"$group": {"_id": "$candidate_location", "count": {"$sum": 1}}},
+                        {"$sort": {"count": -1, "_id": 1}},
+                        {"$limit": limit}
+                    ]
+                }
+            }
+        ]
         
+        results = await self.resume_bank_entries.aggregate(pipeline).to_list(length=1)
+        facets = results[0] if results else {}
         return {
-            "total_entries": total_entries,
-            "status_breakdown": status_counts
+            "top_skills": [
+                {"skill": result["_id"], "count": result["count"]}
+                for result in facets.get("top_skills", [])
+            ],
+            "experience_distribution": {result["_id"]: result["count"] for result in facets.get("experience", [])},
+            "location_distribution": {result["_id"]: result["count"] for result in facets.get("locations", [])}
         }
     
     # User operations
@@ -587,7 +1258,6 @@ class MongoDBRepository:
                         return None
         
         # Generate unique candidate ID for this process
-        import uuid
         candidate_id = str(uuid.uuid4())
         
         # Create candidate data with proper structure and unique ID
@@ -5,9 +5,12 @@ Resume Bank Repository for MongoDB operations.
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from bson import ObjectId
+from pymongo import ReturnDocument
 from pymongo.database import Database
 
-from app.models.mongodb_models import ResumeBankEntryDocument
+from app.models.mongodb_models import ResumeBankEntryDocument, resume_search_fields
+from app.repositories.user_stats_repository import UserStatsRepository
+from app.repositories.mongodb_repository import invalidate_candidate_rankings
 
 
 class ResumeBankRepository:
@@ -16,13 +19,18 @@ class ResumeBankRepository:
     def __init__(self, database: Database):
         self.database = database
         self.resume_bank = database.resume_bank_entries
+        self.user_stats = UserStatsRepository(database)
     
     async def create_resume_entry(self, entry_data: Dict[str, Any]) -> Optional[ResumeBankEntryDocument]:
         """Create a new resume bank entry."""
         try:
             entry = ResumeBankEntryDocument(**entry_data)
-            result = await self.resume_bank.insert_one(entry.model_dump(by_alias=True))
+            document = entry.model_dump(by_alias=True)
+            document.update(resume_search_fields(document))
+            result = await self.resume_bank.insert_one(document)
             entry.id = result.inserted_id
+            invalidate_candidate_rankings(entry.user_id)
+            await self.user_stats.record_resume_created(entry.user_id, entry.status, entry.created_at)
             return entry
         except Exception as e:
             print(f"Error creating resume bank entry: {e}")
@@ -67,13 +75,22 @@ class ResumeBankRepository:
         """Update a resume bank entry."""
         try:
             update_data["updated_at"] = datetime.utcnow()
-            result = await self.resume_bank.update_one(
+            update_data.update(resume_search_fields(update_data))
+            # One round trip: the previous document has the old status for the
+            # counters, and applying the $set to it gives the updated entry
+            previous = await self.resume_bank.find_one_and_update(
                 {"_id": ObjectId(entry_id)},
-                {"$set": update_data}
+                {"$set": update_data},
+                return_document=ReturnDocument.BEFORE
             )
-            if result.modified_count > 0:
-                return await self.get_resume_entry_by_id(entry_id)
-            return None
+            if not previous:
+                return None
+            invalidate_candidate_rankings(previous["user_id"])
+            if "status" in update_data:
+                await self.user_stats.record_resume_status_change(
+                    previous["user_id"], previous.get("status", "active"), update_data["status"]
+                )
+            return ResumeBankEntryDocument(**{**previous, **update_data})
         except Exception as e:
             print(f"Error updating resume bank entry: {e}")
             return None
@@ -81,8 +98,15 @@ class ResumeBankRepository:
     async def delete_resume_entry(self, entry_id: str) -> bool:
         """Delete a resume bank entry."""
         try:
-            result = await self.resume_bank.delete_one({"_id": ObjectId(entry_id)})
-            return result.deleted_count > 0
+            deleted = await self.resume_bank.find_one_and_delete(
+                {"_id": ObjectId(entry_id)},
+                projection={"user_id": 1, "status": 1}
+            )
+            if not deleted:
+                return False
+            invalidate_candidate_rankings(deleted["user_id"])
+            await self.user_stats.record_resume_deleted(deleted["user_id"], deleted.get("status", "active"))
+            return True
         except Exception as e:
             print(f"Error deleting resume bank entry: {e}")
             return False
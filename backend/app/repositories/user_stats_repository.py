@@ -0,0 +1,170 @@
+"""
+User statistics repository for MongoDB operations.
+
+Keeps per-user resume bank counters up to date with $inc on every write, so
+reading the stats is a single document lookup instead of an aggregation over
+all of the user's resumes.
+"""
+
+from typing import List, Optional, Dict, Any
+from datetime import datetime, timedelta
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import DuplicateKeyError
+from app.core.logging import logger
+
+from app.models.mongodb_models import COLLECTIONS
+
+# Number of days of per-day upload counters used for "recent uploads"
+RECENT_UPLOAD_DAYS = 30
+
+
+def _stats_id(user_id: Any) -> str:
+    """Resume user_ids are stored both as ObjectId and as string; key stats by the string form."""
+    return str(user_id)
+
+
+def _day_key(timestamp: datetime) -> str:
+    return timestamp.strftime("%Y-%m-%d")
+
+
+def _status_key(status: Any) -> str:
+    """Counter field name for a status given as a plain string or a ResumeStatus."""
+    return f"resume_status.{getattr(status, 'value', status)}"
+
+
+class UserStatsRepository:
+    """Repository for per-user resume bank counters."""
+
+    def __init__(self, database: AsyncIOMotorDatabase):
+        self.user_stats = database[COLLECTIONS["user_stats"]]
+
+    async def _increment(self, user_id: Any, increments: Dict[str, int]) -> None:
+        """Apply counter increments, invalidating the counters if the update fails."""
+        try:
+            # Every increment bumps the version, so a seed counted before it can tell
+            await self.user_stats.update_one(
+                {"_id": _stats_id(user_id)},
+                {"$inc": {**increments, "version": 1}},
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"Failed to update resume stats for user {user_id}: {e}")
+            await self.invalidate_resume_stats(user_id)
+
+    async def invalidate_resume_stats(self, user_id: Any) -> None:
+        """Force the next read to recount from the resume bank."""
+        try:
+            await self.user_stats.update_one({"_id": _stats_id(user_id)}, {"$set": {"seeded": False}})
+        except Exception:
+            pass
+
+    async def record_resume_created(self, user_id: Any, status: str, created_at: Optional[datetime] = None) -> None:
+        """Count a newly created resume bank entry."""
+        created_at = created_at or datetime.utcnow()
+        await self._increment(user_id, {
+            "resume_total": 1,
+            _status_key(status): 1,
+            f"resume_uploads_by_day.{_day_key(created_at)}": 1
+        })
+
+    async def record_resume_status_change(self, user_id: Any, old_status: str, new_status: str) -> None:
+        """Move a resume bank entry from one status counter to another."""
+        if _status_key(old_status) == _status_key(new_status):
+            return
+        await self._increment(user_id, {
+            _status_key(old_status): -1,
+            _status_key(new_status): 1
+        })
+
+    async def record_resume_deleted(self, user_id: Any, status: str) -> None:
+        """Remove a deleted resume bank entry from the counters."""
+        await self._increment(user_id, {
+            "resume_total": -1,
+            _status_key(status): -1
+        })
+
+    async def record_resumes_deleted(self, user_id: Any, statuses: List[str]) -> None:
+        """Remove several deleted resume bank entries from the counters in one update."""
+        increments: Dict[str, int] = {"resume_total": -len(statuses)}
+        for status in statuses:
+            key = _status_key(status)
+            increments[key] = increments.get(key, 0) - 1
+        await self._increment(user_id, increments)
+
+    async def get_resume_stats(self, user_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Get the user's resume bank counters.
+
+        Returns:
+            Stats dict, or None if the counters have not been seeded yet
+        """
+        stats = await self.user_stats.find_one({"_id": _stats_id(user_id)})
+        if not stats or not stats.get("seeded"):
+            return None
+
+        cutoff = _day_key(datetime.utcnow() - timedelta(days=RECENT_UPLOAD_DAYS))
+        uploads_by_day = stats.get("resume_uploads_by_day", {})
+        expired_days = [day for day in uploads_by_day if day < cutoff]
+        if expired_days:
+            await self.user_stats.update_one(
+                {"_id": _stats_id(user_id)},
+                {"$unset": {f"resume_uploads_by_day.{day}": "" for day in expired_days}}
+            )
+
+        return {
+            "total_entries": stats.get("resume_total", 0),
+            "status_breakdown": {status: count for status, count in stats.get("resume_status", {}).items() if count},
+            "recent_uploads": sum(count for day, count in uploads_by_day.items() if day >= cutoff)
+        }
+
+    async def get_resume_stats_version(self, user_id: Any) -> int:
+        """
+        Get the counters' version, to be read before counting for seed_resume_stats.
+        
+        Returns:
+            Number of increments applied so far (0 if there are no counters yet)
+        """
+        stats = await self.user_stats.find_one({"_id": _stats_id(user_id)}, {"version": 1})
+        return stats.get("version", 0) if stats else 0
+    
+    async def seed_resume_stats(
+        self,
+        user_id: Any,
+        version: int,
+        total_entries: int,
+        status_breakdown: Dict[str, int],
+        uploads_by_day: Dict[str, int]
+    ) -> bool:
+        """
+        Overwrite the user's counters with freshly counted values.
+        
+        The counters are only replaced if no increment landed since version was
+        read; otherwise the count may have missed it, so the counters stay
+        unseeded and the next read counts again.
+        
+        Args:
+            user_id: User the counters belong to
+            version: get_resume_stats_version() result read before counting
+            
+        Returns:
+            True if the counters were seeded
+        """
+        # Counters created before versioning have no version field
+        version_filter = {"$in": [0, None]} if version == 0 else version
+        try:
+            await self.user_stats.update_one(
+                {"_id": _stats_id(user_id), "version": version_filter},
+                {"$set": {
+                    "resume_total": total_entries,
+                    "resume_status": {status: count for status, count in status_breakdown.items() if status},
+                    "resume_uploads_by_day": uploads_by_day,
+                    "seeded": True
+                }},
+                upsert=True
+            )
+        except DuplicateKeyError:
+            # The filter missed because the version moved on, and the upsert
+            # collided with the existing counters document
+            logger.debug("Resume stats for user {} changed while counting; not seeding", user_id)
+            return False
+        return True
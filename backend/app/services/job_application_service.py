@@ -1,8 +1,12 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from operator import attrgetter
+import uuid
 from bson import ObjectId
 
 from app.repositories.job_application_repository import JobApplicationRepository
+from app.repositories.mongodb_repository import MongoDBRepository
+from app.core.database import get_database
 from app.models.mongodb_models import JobApplicationFormDocument, JobApplicationDocument
 
 
@@ -96,23 +100,21 @@ class JobApplicationService:
     
     async def get_applications_with_scores(self, job_id: str) -> List[Dict[str, Any]]:
         """Get applications with matching scores for comparison with resume bank candidates."""
-        applications = await self.repository.get_applications_by_job(job_id)
+        # Already sorted by matching score (highest first) in MongoDB
+        applications = await self.repository.get_application_scores_by_job(job_id)
         
-        result = []
-        for app in applications:
-            result.append({
-                "id": str(app.id),
-                "applicant_name": app.applicant_name,
-                "applicant_email": app.applicant_email,
-                "status": app.status,
-                "matching_score": app.matching_score or 0.0,
-                "created_at": app.created_at.isoformat(),
+        return [
+            {
+                "id": str(app["_id"]),
+                "applicant_name": app.get("applicant_name"),
+                "applicant_email": app.get("applicant_email"),
+                "status": app.get("status", "pending"),
+                "matching_score": app.get("matching_score") or 0.0,
+                "created_at": app["created_at"].isoformat(),
                 "source": "direct_application"
-            })
-        
-        # Sort by matching score (highest first)
-        result.sort(key=lambda x: x["matching_score"], reverse=True)
-        return result
+            }
+            for app in applications
+        ]
 
     async def approve_and_add_to_process(
         self,
@@ -148,16 +150,12 @@ class JobApplicationService:
             
             # Now actually add the candidate to the hiring process
             # We need to inject the hiring process repository
-            from ..repositories.mongodb_repository import MongoDBRepository
-            from ..core.database import get_database
-            
             # Get database connection
             database = await get_database()
             hiring_repository = MongoDBRepository(database)
             
             # Add candidate to hiring process
             # For job applications, we'll use the application data instead of resume bank data
-            import uuid
             candidate_id = str(uuid.uuid4())
             
             candidate_data = {
@@ -195,7 +193,7 @@ class JobApplicationService:
                 return False
             
             # Find the first stage (lowest order)
-            first_stage = min(hiring_process.stages, key=lambda s: s.order)
+            first_stage = min(hiring_process.stages, key=attrgetter("order"))
             candidate_data["current_stage_id"] = first_stage.id
             # Update the stage history with the correct stage ID
             candidate_data["stage_history"][0]["to_stage_id"] = first_stage.id
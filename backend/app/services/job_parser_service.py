@@ -7,11 +7,32 @@ structured data for job creation forms.
 
 import json
 import asyncio
-from typing import Dict, List, Optional
-from openai import AsyncOpenAI
+import re
+from typing import Dict, Optional
 from app.core.logging import logger
 
 from ..core.config import settings
+from .openai_service import get_openai_client
+from ..utils.text import keyword_pattern
+
+
+# Keyword sets the fallback parser looks for in every line of the posting
+_TITLE_SKIP_RE = keyword_pattern(['about the job', 'about', 'job posting', 'description', 'we are looking', 'looking for'])
+_TITLE_KEYWORDS_RE = keyword_pattern([
+    'developer', 'engineer', 'manager', 'analyst', 'designer', 'specialist',
+    'coordinator', 'director', 'lead', 'senior', 'junior', 'architect',
+    'consultant', 'executive', 'officer', 'assistant', 'associate'
+])
+_WORK_MODE_RE = keyword_pattern(['remote', 'hybrid', 'on-site', 'on site', 'onsite'])
+_COMPANY_KEYWORDS_RE = keyword_pattern(['company', 'inc', 'corp', 'ltd', 'llc', 'technologies', 'systems', 'solutions'])
+_COMPANY_LABEL_RE = keyword_pattern(['company', 'about'])
+_REQUIREMENTS_HEADER_RE = keyword_pattern(['required skills', 'requirements', 'qualifications', 'must have'])
+_REQUIREMENTS_END_RE = keyword_pattern(['responsibilities', 'benefits', 'compensation', 'about the role', 'nice to have'])
+_REQUIREMENT_LINE_RE = keyword_pattern(['years', 'experience', 'knowledge', 'proficiency', 'familiarity'])
+_RESPONSIBILITIES_HEADER_RE = keyword_pattern(['responsibilities', 'duties', 'key responsibilities', 'what you', 'you will'])
+_RESPONSIBILITIES_END_RE = keyword_pattern(['requirements', 'benefits', 'compensation', 'nice to have'])
+_BENEFITS_HEADER_RE = keyword_pattern(['benefits', 'perks', 'compensation', 'we offer', 'what we offer'])
+_LIST_ITEM_RE = re.compile(r'^\d+[\.\)]')
 
 
 class JobParserService:
@@ -33,10 +54,9 @@ class JobParserService:
         
         if self.openai_available:
             try:
-                self.client = AsyncOpenAI(
-                    api_key=settings.openai_api_key,
-                    base_url=settings.openai_api_base
-                )
+                # Create the shared client now so a misconfiguration falls back to
+                # local parsing; calls fetch it again in case it was recreated
+                get_openai_client()
                 self.model = settings.openai_model
                 self.max_tokens = settings.max_tokens
                 self.temperature = settings.temperature
@@ -45,7 +65,6 @@ class JobParserService:
                 self.openai_available = False
         else:
             logger.info("OpenAI not configured, using fallback parsing only")
-            self.client = None
             self.model = None
             self.max_tokens = None
             self.temperature = None
@@ -145,7 +164,7 @@ class JobParserService:
     async def _call_openai_api(self, prompt: str) -> str:
         """Make API call to OpenAI for job parsing"""
         try:
-            response = await self.client.chat.completions.create(
+            response = await get_openai_client().chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert HR professional specializing in job posting analysis and data extraction. You excel at parsing job descriptions and extracting structured information accurately."},
@@ -211,24 +230,19 @@ class JobParserService:
         Returns:
             Dict: Parsed job data
         """
-        import re
         lines = [line.strip() for line in job_text.split('\n') if line.strip()] if job_text else []
         
         # Extract title - look for the first substantial line that looks like a job title
         title = ""
-        skip_patterns = ['about the job', 'about', 'job posting', 'description', 'we are looking', 'looking for']
-        title_keywords = ['developer', 'engineer', 'manager', 'analyst', 'designer', 'specialist', 
-                         'coordinator', 'director', 'lead', 'senior', 'junior', 'architect', 
-                         'consultant', 'executive', 'officer', 'assistant', 'associate', 'developer']
         
         for i, line in enumerate(lines[:15]):  # Check first 15 lines
             line_lower = line.lower().strip()
             # Skip common header patterns (only in first few lines)
-            if i < 3 and any(pattern in line_lower for pattern in skip_patterns):
+            if i < 3 and _TITLE_SKIP_RE.search(line_lower):
                 continue
             # Look for lines that look like job titles
             if (len(line) < 120 and len(line) > 5 and 
-                any(word in line_lower for word in title_keywords)):
+                _TITLE_KEYWORDS_RE.search(line_lower)):
                 title = line.strip()
                 break
         
@@ -237,7 +251,7 @@ class JobParserService:
             for i, line in enumerate(lines[1:6]):  # Check lines 2-6
                 line_lower = line.lower().strip()
                 if (line and len(line) < 120 and len(line) > 5 and
-                    not any(pattern in line_lower for pattern in skip_patterns)):
+                    not _TITLE_SKIP_RE.search(line_lower)):
                     title = line.strip()
                     break
             # Last resort: use first line if it exists and is reasonable
@@ -262,18 +276,17 @@ class JobParserService:
                     location = match.group(1).strip()
                     break
             # Check for location keywords
-            if any(keyword in line_lower for keyword in ['remote', 'hybrid', 'on-site', 'on site', 'onsite']):
+            if _WORK_MODE_RE.search(line_lower):
                 location = line.strip()
                 break
         
         # Extract company name
         company = ""
-        company_keywords = ['company', 'inc', 'corp', 'ltd', 'llc', 'technologies', 'systems', 'solutions']
         for line in lines[:15]:
             line_lower = line.lower()
-            if any(keyword in line_lower for keyword in company_keywords):
+            if _COMPANY_KEYWORDS_RE.search(line_lower):
                 # Skip if it's just a label
-                if ':' not in line or not any(keyword in line_lower.split(':')[0] for keyword in ['company', 'about']):
+                if ':' not in line or not _COMPANY_LABEL_RE.search(line_lower.split(':')[0]):
                     company = line.strip()
                     break
         
@@ -327,41 +340,39 @@ class JobParserService:
         # Extract requirements (look for "Required Skills", "Requirements", etc.)
         requirements = []
         in_requirements_section = False
-        requirement_keywords = ['required', 'skills', 'qualifications', 'must have', 'requirements']
         
         for line in lines:
             line_lower = line.lower()
             # Detect requirements section
-            if any(keyword in line_lower for keyword in ['required skills', 'requirements', 'qualifications', 'must have']):
+            if _REQUIREMENTS_HEADER_RE.search(line_lower):
                 in_requirements_section = True
                 continue
             # Stop at next major section
-            if in_requirements_section and any(keyword in line_lower for keyword in ['responsibilities', 'benefits', 'compensation', 'about the role', 'nice to have']):
+            if in_requirements_section and _REQUIREMENTS_END_RE.search(line_lower):
                 break
             # Extract requirements
             if in_requirements_section and line and len(line) > 10:
                 # Check if it's a bullet point or list item
-                if line.startswith(('-', '•', '*', '·')) or re.match(r'^\d+[\.\)]', line):
+                if line.startswith(('-', '•', '*', '·')) or _LIST_ITEM_RE.match(line):
                     skill = line.lstrip('- •*·0123456789.) ').strip()
                     if skill:
                         requirements.append({"skill": skill, "level": "required"})
-                elif 'years' in line_lower or any(tech in line_lower for tech in ['experience', 'knowledge', 'proficiency', 'familiarity']):
+                elif _REQUIREMENT_LINE_RE.search(line_lower):
                     requirements.append({"skill": line.strip(), "level": "required"})
         
         # Extract responsibilities
         responsibilities = []
         in_responsibilities_section = False
-        responsibility_keywords = ['responsibilities', 'duties', 'key responsibilities', 'what you', 'you will']
         
         for line in lines:
             line_lower = line.lower()
-            if any(keyword in line_lower for keyword in responsibility_keywords):
+            if _RESPONSIBILITIES_HEADER_RE.search(line_lower):
                 in_responsibilities_section = True
                 continue
-            if in_responsibilities_section and any(keyword in line_lower for keyword in ['requirements', 'benefits', 'compensation', 'nice to have']):
+            if in_responsibilities_section and _RESPONSIBILITIES_END_RE.search(line_lower):
                 break
             if in_responsibilities_section and line and len(line) > 10:
-                if line.startswith(('-', '•', '*', '·')) or re.match(r'^\d+[\.\)]', line):
+                if line.startswith(('-', '•', '*', '·')) or _LIST_ITEM_RE.match(line):
                     resp = line.lstrip('- •*·0123456789.) ').strip()
                     if resp:
                         responsibilities.append(resp)
@@ -369,15 +380,14 @@ class JobParserService:
         # Extract benefits
         benefits = []
         in_benefits_section = False
-        benefit_keywords = ['benefits', 'perks', 'compensation', 'we offer', 'what we offer']
         
         for line in lines:
             line_lower = line.lower()
-            if any(keyword in line_lower for keyword in benefit_keywords):
+            if _BENEFITS_HEADER_RE.search(line_lower):
                 in_benefits_section = True
                 continue
             if in_benefits_section and line and len(line) > 5:
-                if line.startswith(('-', '•', '*', '·')) or re.match(r'^\d+[\.\)]', line):
+                if line.startswith(('-', '•', '*', '·')) or _LIST_ITEM_RE.match(line):
                     benefit = line.lstrip('- •*·0123456789.) ').strip()
                     if benefit and len(benefit) > 3:
                         benefits.append(benefit)
@@ -33,13 +33,54 @@ KEY AI CONCEPTS EXPLAINED:
 
 import json
 import asyncio
+from operator import attrgetter
 from typing import Dict, List, Optional, Any
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from app.core.logging import logger
 
 # Import configuration settings
 from ..core.config import settings
 
+# Maximum number of inputs the embeddings endpoint accepts per request
+EMBEDDING_BATCH_SIZE = 2048
+
+# Connection pool shared by every OpenAI client in the app
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+_client: Optional[AsyncOpenAI] = None
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """
+    Get the shared AsyncOpenAI client.
+    
+    All services use this one client so keep-alive connections (and their
+    TLS sessions) to the API are reused instead of each service opening its own.
+    """
+    global _client
+    if _client is None:
+        _client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            base_url=settings.openai_api_base,
+            http_client=DefaultAsyncHttpxClient(limits=HTTP_LIMITS)
+        )
+    return _client
+
+
+async def close_openai_client() -> None:
+    """
+    Close the shared OpenAI client.
+    
+    This should be called during application shutdown. The next
+    get_openai_client() call creates a fresh client.
+    """
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+        logger.info("OpenAI client closed")
+
 
 class OpenAIService:
     """
@@ -69,19 +110,24 @@ class OpenAIService:
         """
         Initialize the OpenAI service with API configuration.
         
-        Sets up the async client and model parameters.
+        Sets up the model parameters; the client is shared (see get_openai_client).
         Think of this like configuring your connection to a smart AI assistant.
         """
-        # Create async client for OpenAI API calls
-        self.client = AsyncOpenAI(
-            api_key=settings.openai_api_key,      # Your API key for authentication
-            base_url=settings.openai_api_base     # API endpoint (can be customized)
-        )
-        
         # Model configuration
         self.model = settings.openai_model           # Usually "gpt-3.5-turbo" or "gpt-4"
         self.max_tokens = settings.max_tokens        # Maximum response length
         self.temperature = settings.temperature      # Creativity level (0.0 = focused, 1.0 = creative)
+        self.embedding_model = settings.openai_embedding_model
+    
+    @property
+    def client(self) -> AsyncOpenAI:
+        """
+        Shared async client for OpenAI API calls (one connection pool per app).
+        
+        Looked up on each use rather than stored, so the service keeps working
+        after the client is closed and recreated.
+        """
+        return get_openai_client()
         
     async def extract_candidate_info(self, resume_text: str) -> Dict[str, Any]:
         """
@@ -106,6 +152,54 @@ class OpenAIService:
             logger.info("Using mock data due to API error")
             return self._get_mock_extraction_response(resume_text)
     
+    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for several texts in a single API call.
+        
+        The embeddings endpoint accepts up to 2048 inputs per request, so bulk
+        callers (e.g. embedding many job descriptions) should use this instead
+        of calling generate_embedding in a loop.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            List[List[float]]: One vector per input text, in input order
+            
+        Raises:
+            Exception: If API call fails
+        """
+        if not texts:
+            return []
+        
+        embeddings: List[List[float]] = []
+        for start in range(0, len(texts), EMBEDDING_BATCH_SIZE):
+            batch = texts[start:start + EMBEDDING_BATCH_SIZE]
+            try:
+                response = await self.client.embeddings.create(
+                    model=self.embedding_model,
+                    input=batch
+                )
+            except Exception as e:
+                logger.error(f"OpenAI embeddings call failed: {e}")
+                raise e
+            # The API may return items out of order; sort on their index
+            embeddings.extend(item.embedding for item in sorted(response.data, key=attrgetter("index")))
+        return embeddings
+    
+    async def generate_embedding(self, text: str) -> List[float]:
+        """
+        Generate an embedding for a single text.
+        
+        Args:
+            text: Text to embed
+            
+        Returns:
+            List[float]: Embedding vector
+        """
+        embeddings = await self.generate_embeddings([text])
+        return embeddings[0]
+    
     def _create_extraction_prompt(self, resume_text: str) -> str:
         """
         Create a structured prompt for candidate information extraction.
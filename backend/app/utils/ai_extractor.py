@@ -7,10 +7,27 @@ from any PDF content, whether it's a formal resume or rough candidate data.
 
 import json
 import re
+from datetime import datetime
+from operator import itemgetter
 from typing import Dict, Any, Optional, List
 from app.core.logging import logger
 from app.core.config import settings
-from app.services.openai_service import OpenAIService
+from app.core.database import get_mongodb_database
+from app.services.openai_service import openai_service
+from app.repositories.extraction_cache_repository import ExtractionCacheRepository, extraction_cache_key
+from app.utils.text import keyword_pattern
+
+
+# Job-related words that rule a line out as a candidate name
+_JOB_KEYWORDS = ['engineer', 'developer', 'programmer', 'manager', 'analyst', 'consultant', 'specialist', 'technician', 'lead', 'senior', 'junior', 'principal', 'staff', 'software', 'web', 'full', 'front', 'back', 'devops', 'data', 'machine', 'learning', 'ai', 'mobile', 'game', 'qa', 'test', 'security', 'cloud', 'platform']
+_JOB_KEYWORDS_RE = keyword_pattern(_JOB_KEYWORDS)
+# Section headers and locations that can look like a name on the first lines
+_NAME_HEADER_RE = keyword_pattern(['personal information', 'contact information', 'about me', 'profile', 'resume', 'cv', 'curriculum', 'vitae', 'education', 'experience', 'skills', 'objective', 'summary', 'professional', 'candidate', 'applicant', 'work experience', 'united arab emirates', 'uae', 'dubai', 'pakistan', 'india', 'usa', 'uk', 'canada', 'australia', 'germany', 'france', 'singapore'])
+_NAME_LOCATIONS_RE = keyword_pattern(['united arab emirates', 'uae', 'dubai', 'abu dhabi', 'sharjah', 'pakistan', 'india', 'usa', 'united states', 'uk', 'united kingdom', 'canada', 'australia', 'germany', 'france', 'singapore', 'islamabad', 'karachi', 'lahore', 'new york', 'london', 'toronto', 'sydney', 'berlin', 'paris'])
+# Job words plus section headers, checked against names found anywhere in the text
+_NON_NAME_KEYWORDS = _JOB_KEYWORDS + ['resume', 'cv', 'curriculum', 'vitae', 'experience', 'skills', 'education', 'technical', 'summary', 'objective', 'personal information', 'contact information', 'about me', 'profile']
+_NON_NAME_RE = keyword_pattern(_NON_NAME_KEYWORDS)
+_NON_NAME_LINE_RE = keyword_pattern(_NON_NAME_KEYWORDS + ['dateofbirth', 'nationality', 'address', 'mobile no', 'email'])
 
 
 class AIExtractor:
@@ -22,7 +39,15 @@ class AIExtractor:
     """
     
     def __init__(self):
-        self.openai_service = OpenAIService()
+        self.openai_service = openai_service
+        self._cache: Optional[ExtractionCacheRepository] = None
+    
+    @property
+    def cache(self) -> ExtractionCacheRepository:
+        """Extraction cache, created on first use so importing this module doesn't touch MongoDB."""
+        if self._cache is None:
+            self._cache = ExtractionCacheRepository(get_mongodb_database())
+        return self._cache
     
     async def extract_candidate_info(self, pdf_text: str, filename: str) -> Dict[str, Any]:
         """
@@ -44,6 +69,16 @@ class AIExtractor:
             # Create a comprehensive prompt for AI extraction
             prompt = self._create_extraction_prompt(pdf_text, filename)
             
+            # Identical prompts under the same model settings give the same extraction
+            model_settings = (
+                f"{self.openai_service.model}|{self.openai_service.temperature}|{self.openai_service.max_tokens}"
+            )
+            cache_key = extraction_cache_key(model_settings, prompt)
+            cached_data = await self.cache.get(cache_key)
+            if cached_data is not None:
+                logger.info(f"AI extraction cache hit for {filename}")
+                return cached_data
+            
             # Get AI response using the correct method
             response = await self.openai_service._call_openai_api(prompt)
             
@@ -56,6 +91,9 @@ class AIExtractor:
             
             # Clean and validate the extracted data
             cleaned_data = self._clean_extracted_data(extracted_data)
+            if cleaned_data:
+                # Unparseable responses aren't cached so the next upload retries
+                await self.cache.set(cache_key, self.openai_service.model, cleaned_data)
             
             logger.info(f"AI extraction completed for {filename}")
             return cleaned_data
@@ -312,11 +350,11 @@ Return the result as a valid JSON object with these exact field names.
                     words = line.split()
                     if 2 <= len(words) <= 4 and all(re.match(r'^[A-Za-z\.\-]+$', word) for word in words):
                         # Check if it's not a section header
-                        if not any(keyword in line.lower() for keyword in ['personal information', 'contact information', 'about me', 'profile', 'resume', 'cv', 'curriculum', 'vitae', 'education', 'experience', 'skills', 'objective', 'summary', 'professional', 'candidate', 'applicant', 'work experience', 'united arab emirates', 'uae', 'dubai', 'pakistan', 'india', 'usa', 'uk', 'canada', 'australia', 'germany', 'france', 'singapore']):
+                        if not _NAME_HEADER_RE.search(line.lower()):
                             # Additional validation - should not contain job-related keywords
-                            if not any(keyword in line.lower() for keyword in ['engineer', 'developer', 'programmer', 'manager', 'analyst', 'consultant', 'specialist', 'technician', 'lead', 'senior', 'junior', 'principal', 'staff', 'software', 'web', 'full', 'front', 'back', 'devops', 'data', 'machine', 'learning', 'ai', 'mobile', 'game', 'qa', 'test', 'security', 'cloud', 'platform']):
+                            if not _JOB_KEYWORDS_RE.search(line.lower()):
                                 # Additional validation - should not be location names
-                                if not any(location in line.lower() for location in ['united arab emirates', 'uae', 'dubai', 'abu dhabi', 'sharjah', 'pakistan', 'india', 'usa', 'united states', 'uk', 'united kingdom', 'canada', 'australia', 'germany', 'france', 'singapore', 'islamabad', 'karachi', 'lahore', 'new york', 'london', 'toronto', 'sydney', 'berlin', 'paris']):
+                                if not _NAME_LOCATIONS_RE.search(line.lower()):
                                     extracted['name'] = line.title()
                                     name_found = True
                                     break
@@ -341,7 +379,7 @@ Return the result as a valid JSON object with these exact field names.
                             # Check if all words are proper name words (capitalized or all caps, no numbers, no special chars)
                             if all(re.match(r'^[A-Za-z\.\-]+$', word) and (word[0].isupper() or word.isupper()) for word in words[:i]):
                                 # Should not contain job-related keywords
-                                if not any(keyword in potential_name.lower() for keyword in ['engineer', 'developer', 'programmer', 'manager', 'analyst', 'consultant', 'specialist', 'technician', 'lead', 'senior', 'junior', 'principal', 'staff', 'software', 'web', 'full', 'front', 'back', 'devops', 'data', 'machine', 'learning', 'ai', 'mobile', 'game', 'qa', 'test', 'security', 'cloud', 'platform']):
+                                if not _JOB_KEYWORDS_RE.search(potential_name.lower()):
                                     # Convert all-caps names to proper case for better display
                                     if potential_name.isupper() and len(potential_name.split()) >= 2:
                                         extracted['name'] = potential_name.title()
@@ -359,7 +397,7 @@ Return the result as a valid JSON object with these exact field names.
                 line = line.strip()
                 if line and len(line) > 3 and len(line) < 50:
                     # Skip lines that contain job-related keywords or section headers
-                    if not any(keyword in line.lower() for keyword in ['engineer', 'developer', 'programmer', 'manager', 'analyst', 'consultant', 'specialist', 'technician', 'lead', 'senior', 'junior', 'principal', 'staff', 'software', 'web', 'full', 'front', 'back', 'devops', 'data', 'machine', 'learning', 'ai', 'mobile', 'game', 'qa', 'test', 'security', 'cloud', 'platform', 'resume', 'cv', 'curriculum', 'vitae', 'experience', 'skills', 'education', 'technical', 'summary', 'objective', 'personal information', 'contact information', 'about me', 'profile', 'dateofbirth', 'nationality', 'address', 'mobile no', 'email', 'objective']):
+                    if not _NON_NAME_LINE_RE.search(line.lower()):
                         # Check if it looks like a name (2-4 words, mostly letters)
                         words = line.split()
                         if 2 <= len(words) <= 4 and all(re.match(r'^[A-Za-z\.\-]+$', word) for word in words):
@@ -390,7 +428,7 @@ Return the result as a valid JSON object with these exact field names.
                     for match in matches:
                         potential_name = match.group(1) if match.groups() else match.group()
                         # Validate it's not a job title or section header
-                        if not any(keyword in potential_name.lower() for keyword in ['engineer', 'developer', 'programmer', 'manager', 'analyst', 'consultant', 'specialist', 'technician', 'lead', 'senior', 'junior', 'principal', 'staff', 'software', 'web', 'full', 'front', 'back', 'devops', 'data', 'machine', 'learning', 'ai', 'mobile', 'game', 'qa', 'test', 'security', 'cloud', 'platform', 'resume', 'cv', 'curriculum', 'vitae', 'experience', 'skills', 'education', 'technical', 'summary', 'objective', 'personal information', 'contact information', 'about me', 'profile']):
+                        if not _NON_NAME_RE.search(potential_name.lower()):
                             extracted['name'] = potential_name
                             name_found = True
                             break
@@ -753,7 +791,7 @@ Return the result as a valid JSON object with these exact field names.
             
             # Sort by score and take the highest scoring location
             if potential_locations:
-                potential_locations.sort(key=lambda x: x['score'], reverse=True)
+                potential_locations.sort(key=itemgetter('score'), reverse=True)
                 best_location = potential_locations[0]
                 if best_location['score'] > 0:  # Only use if it has positive context score
                     location = best_location['location']
@@ -846,9 +884,6 @@ Return the result as a valid JSON object with these exact field names.
     
     def _calculate_experience_from_work_history(self, pdf_text: str) -> int:
         """Calculate total years of experience from work history."""
-        import re
-        from datetime import datetime
-        
         # Look for date patterns in work experience
         date_patterns = [
             r'(\w+)\s+(\d{4})\s*[-–]\s*(\w+)?\s*(\d{4})?',  # "Jan 2020 - Dec 2023" or "2020 - 2023"
@@ -6,13 +6,16 @@ and validation for the resume analysis system.
 """
 
 import PyPDF2
+import asyncio
+import hashlib
 import io
 import re
-from typing import Optional, Tuple, Dict, Any
+import uuid
+from typing import Optional, Tuple, Dict, Any, Union
 from fastapi import UploadFile, HTTPException
 import os
 
-from app.core.config import settings
+from app.core.config import settings, ensure_directory
 from app.core.logging import logger
 
 # Try to import pdfplumber for better PDF processing
@@ -23,6 +26,68 @@ except ImportError:
     HAS_PDFPLUMBER = False
     logger.warning("pdfplumber not available, using PyPDF2 only")
 
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+# Patterns used by the text helpers below, compiled once at import time
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_NAME_LINE_RE = re.compile(r'^[A-Za-z\s\.\-]+$')
+_ALPHA_SPACE_RE = re.compile(r'^[A-Za-z\s]+$')
+_DIGITS_RE = re.compile(r'[0-9]+')
+_EMAIL_RE = re.compile(r'\b([A-Za-z0-9._%+-]+)@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# Location patterns; the "City: X | Country: Y" form captures two groups
+_LOCATION_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'[A-Z][a-zA-Z\s,]+,\s*[A-Z]{2}',  # City, State
+    r'[A-Z][a-zA-Z\s,]+,\s*[A-Z][a-zA-Z\s]+',  # City, Country
+    r'[A-Z][a-zA-Z\s]+,\s*Pakistan',  # Pakistani cities
+    r'[A-Z][a-zA-Z\s]+,\s*UAE',  # UAE cities
+    r'[A-Z][a-zA-Z\s]+,\s*KP',  # Khyber Pakhtunkhwa
+    r'[A-Z][a-zA-Z\s]+,\s*Hong Kong',  # Hong Kong
+    r'City:\s*([A-Za-z\s]+)\s*\|\s*Country:\s*([A-Za-z\s]+)',  # City: X | Country: Y format
+))
+
+_EXPERIENCE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+)\s*(?:years?|yrs?)\s*(?:of\s*)?experience',
+    r'experience[:\s]*(\d+)\s*(?:years?|yrs?)',
+    r'(\d+)\s*(?:years?|yrs?)\s*in\s*(?:the\s*)?field',
+))
+
+# Role patterns; the ungrouped one returns the whole match
+_ROLE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'current[:\s]*([A-Za-z\s]+(?:Engineer|Developer|Manager|Analyst|Specialist))',
+    r'present[:\s]*([A-Za-z\s]+(?:Engineer|Developer|Manager|Analyst|Specialist))',
+    r'currently[:\s]*([A-Za-z\s]+(?:Engineer|Developer|Manager|Analyst|Specialist))',
+    r'Full\s+stack\s+Software\s+engineer',  # Specific pattern for our sample
+    r'([A-Za-z\s]+(?:Engineer|Developer|Manager|Analyst|Specialist))\s*\[.*Current.*\]',  # Role with [Current] indicator
+))
+
+_EDUCATION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'education[:\s]*([A-Za-z\s,]+(?:University|College|Institute|School))',
+    r'degree[:\s]*([A-Za-z\s]+(?:Bachelor|Master|PhD|BSc|MSc|MBA))',
+    r'([A-Za-z\s]+(?:University|College|Institute|School))',
+))
+
+# Common job titles to avoid when looking for a name
+_JOB_TITLES = frozenset({
+    'software engineer', 'developer', 'programmer', 'full stack', 'frontend', 'backend',
+    'data scientist', 'analyst', 'manager', 'director', 'lead', 'senior', 'junior',
+    'architect', 'consultant', 'specialist', 'coordinator', 'assistant', 'intern'
+})
+_SECTION_HEADERS = frozenset({'experience', 'education', 'skills', 'summary', 'objective', 'work', 'nationality', 'date of birth'})
+_LOCATION_TECH_TERMS = ('react', 'node', 'python', 'javascript', 'material', 'tailwind', 'bootstrap', 'express', 'mongodb', 'mysql')
+
+# Common programming languages and technologies, paired with their lowercase form
+_COMMON_SKILLS = tuple((skill, skill.lower()) for skill in (
+    'Python', 'JavaScript', 'Java', 'C++', 'C#', 'PHP', 'Ruby', 'Go', 'Rust', 'Swift',
+    'React', 'Angular', 'Vue', 'Node.js', 'Express', 'Django', 'Flask', 'Spring',
+    'MongoDB', 'MySQL', 'PostgreSQL', 'Redis', 'AWS', 'Azure', 'Docker', 'Kubernetes',
+    'Git', 'GitHub', 'Jenkins', 'Jira', 'Agile', 'Scrum', 'REST', 'GraphQL', 'API',
+    'HTML', 'CSS', 'SASS', 'TypeScript', 'Webpack', 'Babel', 'Jest', 'Cypress'
+))
+
 
 class PDFProcessor:
     """
@@ -36,12 +101,16 @@ class PDFProcessor:
     """
     
     @staticmethod
-    async def process_pdf(file: UploadFile) -> Tuple[str, str]:
+    async def process_pdf(file: UploadFile, destination_path: str) -> Tuple[str, str]:
         """
-        Process a PDF file and extract text content.
+        Save an uploaded PDF to disk and extract its text content.
+        
+        The upload is streamed to destination_path in fixed-size chunks and
+        parsed from there, so the whole file is never held in memory.
         
         Args:
             file: Uploaded PDF file
+            destination_path: Where the PDF is stored
             
         Returns:
             Tuple of (extracted_text, filename)
@@ -49,6 +118,26 @@ class PDFProcessor:
         Raises:
             HTTPException: If file is invalid or processing fails
         """
+        await PDFProcessor.save_pdf_upload(file, destination_path)
+        # Parsing is blocking, so it runs in a worker thread
+        text = await asyncio.to_thread(PDFProcessor.extract_text_from_file, destination_path, file.filename)
+        return text, file.filename
+    
+    @staticmethod
+    async def save_pdf_upload(file: UploadFile, destination_path: str) -> str:
+        """
+        Validate an uploaded PDF and stream it to disk.
+        
+        Args:
+            file: Uploaded PDF file
+            destination_path: Where the PDF is stored
+            
+        Returns:
+            SHA-256 hex digest of the file bytes, computed while streaming
+            
+        Raises:
+            HTTPException: If the file is invalid or can't be saved
+        """
         try:
             # Validate file
             if not file.filename.lower().endswith('.pdf'):
@@ -57,49 +146,150 @@ class PDFProcessor:
                     detail="Only PDF files are supported"
                 )
             
-            # Check file size
-            content = await file.read()
-            if len(content) > settings.max_file_size:
+            # Reject oversized uploads up front when the size is known
+            if file.size is not None and file.size > settings.max_file_size:
                 raise HTTPException(
-                    status_code=400,
+                    status_code=413,
                     detail=f"File size exceeds maximum limit of {settings.max_file_size} bytes"
                 )
             
-            # Extract text from PDF with error handling
-            try:
-                text = PDFProcessor._extract_text_from_pdf(content)
-            except Exception as extract_error:
-                logger.error(f"Text extraction failed for {file.filename}: {extract_error}")
-                text = f"PDF file: {file.filename}\nContent could not be extracted automatically.\nPlease review this resume manually."
-            
-            # If no text was extracted, create a minimal placeholder
-            if not text.strip() or text.strip() == "PDF content could not be extracted. Please check the file format.":
-                logger.warning(f"Could not extract text from PDF {file.filename}, creating placeholder")
-                text = f"PDF file: {file.filename}\nContent could not be extracted automatically.\nPlease review this resume manually."
-            
-            logger.info(f"Successfully processed PDF: {file.filename}")
-            return text, file.filename
+            return await PDFProcessor._stream_to_disk(file, destination_path)
             
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Failed to process PDF {file.filename}: {e}")
+            logger.error(f"Failed to save PDF {file.filename}: {e}")
             raise HTTPException(
                 status_code=500,
                 detail="Failed to process PDF file"
             )
     
     @staticmethod
-    def _extract_text_from_pdf(pdf_content: bytes) -> str:
+    def temporary_upload_path(directory: str) -> str:
         """
-        Extract text content from PDF bytes with multiple fallback methods.
+        Get a unique path in directory to stream an upload to before it is kept.
+        
+        Uploads land here first so a duplicate or failed upload never touches
+        a PDF that already belongs to a resume bank entry.
+        """
+        return os.path.join(directory, f".upload-{uuid.uuid4().hex}.pdf")
+    
+    @staticmethod
+    def reserve_upload_path(directory: str, filename: str) -> str:
+        """
+        Claim a free path for a kept upload, named after the original filename.
+        
+        The name gets a random suffix if another upload already uses it. The
+        returned path exists as an empty file, so concurrent uploads can't
+        claim it too; move the upload onto it with os.replace.
         
         Args:
-            pdf_content: PDF file content as bytes
+            directory: Directory the PDF is kept in
+            filename: Original filename of the upload
+            
+        Returns:
+            Reserved file path
+        """
+        name, extension = os.path.splitext(os.path.basename(filename) or "resume.pdf")
+        path = os.path.join(directory, name + extension)
+        while True:
+            try:
+                with open(path, "x"):
+                    return path
+            except FileExistsError:
+                path = os.path.join(directory, f"{name}-{uuid.uuid4().hex[:8]}{extension}")
+    
+    @staticmethod
+    async def remove_files(*paths: Optional[str]) -> None:
+        """Delete upload files that weren't kept, skipping None and missing paths."""
+        def remove(path: str) -> None:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        
+        for path in paths:
+            if path:
+                await asyncio.to_thread(remove, path)
+    
+    @staticmethod
+    def extract_text_from_file(path: str, filename: str) -> str:
+        """
+        Extract text from a saved PDF, falling back to a placeholder when nothing is readable.
+        
+        Args:
+            path: Path to the saved PDF
+            filename: Original filename, used in the placeholder text
+            
+        Returns:
+            Extracted text, or placeholder text for unreadable PDFs
+        """
+        try:
+            text = PDFProcessor._extract_text_from_pdf(path)
+        except Exception as extract_error:
+            logger.error(f"Text extraction failed for {filename}: {extract_error}")
+            text = f"PDF file: {filename}\nContent could not be extracted automatically.\nPlease review this resume manually."
+        
+        # If no text was extracted, create a minimal placeholder
+        if not text.strip() or text.strip() == "PDF content could not be extracted. Please check the file format.":
+            logger.warning(f"Could not extract text from PDF {filename}, creating placeholder")
+            text = f"PDF file: {filename}\nContent could not be extracted automatically.\nPlease review this resume manually."
+        
+        logger.info(f"Successfully processed PDF: {filename}")
+        return text
+    
+    @staticmethod
+    async def _stream_to_disk(file: UploadFile, destination_path: str) -> str:
+        """
+        Copy an upload to disk chunk by chunk, enforcing the size limit.
+        
+        Args:
+            file: Uploaded file
+            destination_path: Target file path
+            
+        Returns:
+            SHA-256 hex digest of the bytes written
+            
+        Raises:
+            HTTPException: If the upload exceeds the maximum file size
+        """
+        written = 0
+        file_hash = hashlib.sha256()
+        # Disk I/O runs in worker threads so a slow disk doesn't stall the event loop
+        buffer = await asyncio.to_thread(open, destination_path, "wb")
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > settings.max_file_size:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File size exceeds maximum limit of {settings.max_file_size} bytes"
+                    )
+                file_hash.update(chunk)
+                await asyncio.to_thread(buffer.write, chunk)
+        except BaseException:
+            # Don't leave partial uploads behind
+            await asyncio.to_thread(buffer.close)
+            await asyncio.to_thread(os.remove, destination_path)
+            raise
+        await asyncio.to_thread(buffer.close)
+        return file_hash.hexdigest()
+    
+    @staticmethod
+    def _extract_text_from_pdf(pdf_source: Union[bytes, str]) -> str:
+        """
+        Extract text content from a PDF with multiple fallback methods.
+        
+        Args:
+            pdf_source: PDF file content as bytes, or a path to the PDF file
             
         Returns:
             Extracted text from the PDF
         """
+        def open_source():
+            # PyPDF2 and pdfplumber both accept a path or a file-like object
+            return io.BytesIO(pdf_source) if isinstance(pdf_source, bytes) else pdf_source
+        
         # Method 1: Try PyPDF2 with comprehensive error handling and fallbacks
         pdf_reader = None
         text = ""
@@ -107,7 +297,7 @@ class PDFProcessor:
         failed_pages = 0
         
         try:
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_content))
+            pdf_reader = PyPDF2.PdfReader(open_source())
             total_pages = len(pdf_reader.pages)
             logger.info(f"PDF has {total_pages} pages")
             
@@ -146,7 +336,7 @@ class PDFProcessor:
                 # If still failed, try pdfplumber for this specific page
                 if not page_success and HAS_PDFPLUMBER:
                     try:
-                        with pdfplumber.open(io.BytesIO(pdf_content)) as pdf_plumber:
+                        with pdfplumber.open(open_source()) as pdf_plumber:
                             if page_num < len(pdf_plumber.pages):
                                 page_text = pdf_plumber.pages[page_num].extract_text()
                                 if page_text and len(page_text.strip()) > 10:
@@ -182,7 +372,7 @@ class PDFProcessor:
         if HAS_PDFPLUMBER and (failed_pages > 0 or not text.strip()):
             logger.info("Trying pdfplumber as fallback for failed pages")
             try:
-                with pdfplumber.open(io.BytesIO(pdf_content)) as pdf_plumber:
+                with pdfplumber.open(open_source()) as pdf_plumber:
                     pdfplumber_text = ""
                     pdfplumber_successful = 0
                     
@@ -211,7 +401,7 @@ class PDFProcessor:
         if not text.strip() or len(text.strip()) < 100:
             logger.info("Trying PyPDF2 with different settings as last resort")
             try:
-                pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_content))
+                pdf_reader = PyPDF2.PdfReader(open_source())
                 alt_text = ""
                 
                 for page_num, page in enumerate(pdf_reader.pages):
@@ -243,10 +433,15 @@ class PDFProcessor:
             logger.info("Trying raw content extraction as last resort")
             try:
                 # Try to extract raw content and clean it
+                if isinstance(pdf_source, bytes):
+                    pdf_content = pdf_source
+                else:
+                    with open(pdf_source, 'rb') as f:
+                        pdf_content = f.read()
                 raw_text = pdf_content.decode('utf-8', errors='ignore')
                 # Clean up the raw text
-                cleaned_text = re.sub(r'[^\x00-\x7F]+', ' ', raw_text)  # Remove non-ASCII
-                cleaned_text = re.sub(r'\s+', ' ', cleaned_text)  # Normalize whitespace
+                cleaned_text = _NON_ASCII_RE.sub(' ', raw_text)  # Remove non-ASCII
+                cleaned_text = _WHITESPACE_RE.sub(' ', cleaned_text)  # Normalize whitespace
                 
                 if len(cleaned_text) > 100:  # Ensure we have meaningful content
                     logger.info(f"Raw content extraction successful: {len(cleaned_text)} characters")
@@ -259,6 +454,23 @@ class PDFProcessor:
         logger.error(f"All PDF text extraction methods failed. Final text length: {len(text)}")
         return "PDF content could not be extracted. Please check the file format or try a different PDF file."
     
+    @staticmethod
+    def compute_text_hash(text: str) -> str:
+        """
+        Hash resume text so re-uploads of the same resume can be detected.
+        
+        Whitespace is collapsed first so layout-only differences in the
+        extracted text don't produce a different hash.
+        
+        Args:
+            text: Extracted resume text
+            
+        Returns:
+            Hex SHA-256 digest of the normalized text
+        """
+        normalized = _WHITESPACE_RE.sub(' ', text).strip()
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+    
     @staticmethod
     async def extract_candidate_info_from_text(resume_text: str, filename: str = "unknown.pdf") -> Dict[str, Any]:
         """
@@ -312,13 +524,6 @@ class PDFProcessor:
         Returns:
             Extracted name or "Unknown"
         """
-        # Common job titles to avoid
-        job_titles = {
-            'software engineer', 'developer', 'programmer', 'full stack', 'frontend', 'backend',
-            'data scientist', 'analyst', 'manager', 'director', 'lead', 'senior', 'junior',
-            'architect', 'consultant', 'specialist', 'coordinator', 'assistant', 'intern'
-        }
-        
         # Check first 20 lines for name
         for i, line in enumerate(lines[:20]):
             line = line.strip()
@@ -327,15 +532,14 @@ class PDFProcessor:
             
             # Skip lines that are clearly not names
             line_lower = line.lower()
-            if any(title in line_lower for title in job_titles):
+            if any(title in line_lower for title in _JOB_TITLES):
                 continue
             
             # Check if it looks like a name (contains letters and possibly spaces)
             # More flexible regex to handle names with special characters
-            if re.match(r'^[A-Za-z\s\.\-]+$', line) and 2 <= len(line.split()) <= 4:
+            if _NAME_LINE_RE.match(line) and 2 <= len(line.split()) <= 4:
                 # Additional validation: should not contain common resume section headers
-                section_headers = {'experience', 'education', 'skills', 'summary', 'objective', 'work', 'nationality', 'date of birth'}
-                if not any(header in line_lower for header in section_headers):
+                if not any(header in line_lower for header in _SECTION_HEADERS):
                     # Check if it's not just a single word (likely a job title)
                     if len(line.split()) >= 2:
                         return line
@@ -345,24 +549,22 @@ class PDFProcessor:
             line = line.strip()
             if '@' in line:
                 # Look for name pattern before email
-                email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                email_match = re.search(email_pattern, line)
+                email_match = _EMAIL_RE.search(line)
                 if email_match:
                     # Get text before email
                     before_email = line[:email_match.start()].strip()
-                    if before_email and re.match(r'^[A-Za-z\s]+$', before_email):
+                    if before_email and _ALPHA_SPACE_RE.match(before_email):
                         return before_email
         
         # If still no name found, try to extract from email username
         for line in lines:
             line = line.strip()
             if '@' in line:
-                email_pattern = r'\b([A-Za-z0-9._%+-]+)@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                email_match = re.search(email_pattern, line)
+                email_match = _EMAIL_RE.search(line)
                 if email_match:
                     email_username = email_match.group(1)
                                     # Remove numbers and special characters
-                name_parts = re.sub(r'[0-9]+', '', email_username)
+                name_parts = _DIGITS_RE.sub('', email_username)
                 name_parts = name_parts.replace('.', ' ').replace('_', ' ').replace('-', ' ')
                 name_words = [word.capitalize() for word in name_parts.split() if word]
                 
@@ -385,21 +587,10 @@ class PDFProcessor:
         Returns:
             Extracted location or None
         """
-        # Improved location patterns
-        location_patterns = [
-            r'[A-Z][a-zA-Z\s,]+,\s*[A-Z]{2}',  # City, State
-            r'[A-Z][a-zA-Z\s,]+,\s*[A-Z][a-zA-Z\s]+',  # City, Country
-            r'[A-Z][a-zA-Z\s]+,\s*Pakistan',  # Pakistani cities
-            r'[A-Z][a-zA-Z\s]+,\s*UAE',  # UAE cities
-            r'[A-Z][a-zA-Z\s]+,\s*KP',  # Khyber Pakhtunkhwa
-            r'[A-Z][a-zA-Z\s]+,\s*Hong Kong',  # Hong Kong
-            r'City:\s*([A-Za-z\s]+)\s*\|\s*Country:\s*([A-Za-z\s]+)',  # City: X | Country: Y format
-        ]
-        
-        for pattern in location_patterns:
-            location_match = re.search(pattern, resume_text)
+        for pattern in _LOCATION_PATTERNS:
+            location_match = pattern.search(resume_text)
             if location_match:
-                if 'City:' in pattern:
+                if pattern.groups == 2:
                     # Handle City: X | Country: Y format
                     city = location_match.group(1).strip()
                     country = location_match.group(2).strip()
@@ -409,8 +600,7 @@ class PDFProcessor:
                 
                 if len(location) > 5 and len(location) < 100:
                     # Filter out technology names
-                    tech_terms = ['react', 'node', 'python', 'javascript', 'material', 'tailwind', 'bootstrap', 'express', 'mongodb', 'mysql']
-                    if not any(tech in location.lower() for tech in tech_terms):
+                    if not any(tech in location.lower() for tech in _LOCATION_TECH_TERMS):
                         return location
         
         return None
@@ -426,20 +616,11 @@ class PDFProcessor:
         Returns:
             List of extracted skills
         """
-        # Common programming languages and technologies
-        common_skills = [
-            'Python', 'JavaScript', 'Java', 'C++', 'C#', 'PHP', 'Ruby', 'Go', 'Rust', 'Swift',
-            'React', 'Angular', 'Vue', 'Node.js', 'Express', 'Django', 'Flask', 'Spring',
-            'MongoDB', 'MySQL', 'PostgreSQL', 'Redis', 'AWS', 'Azure', 'Docker', 'Kubernetes',
-            'Git', 'GitHub', 'Jenkins', 'Jira', 'Agile', 'Scrum', 'REST', 'GraphQL', 'API',
-            'HTML', 'CSS', 'SASS', 'TypeScript', 'Webpack', 'Babel', 'Jest', 'Cypress'
-        ]
-        
         skills = []
         resume_lower = resume_text.lower()
         
-        for skill in common_skills:
-            if skill.lower() in resume_lower:
+        for skill, skill_lower in _COMMON_SKILLS:
+            if skill_lower in resume_lower:
                 skills.append(skill)
         
         return skills[:10]  # Limit to top 10 skills
@@ -455,15 +636,8 @@ class PDFProcessor:
         Returns:
             Years of experience or None
         """
-        # Look for experience patterns
-        experience_patterns = [
-            r'(\d+)\s*(?:years?|yrs?)\s*(?:of\s*)?experience',
-            r'experience[:\s]*(\d+)\s*(?:years?|yrs?)',
-            r'(\d+)\s*(?:years?|yrs?)\s*in\s*(?:the\s*)?field'
-        ]
-        
-        for pattern in experience_patterns:
-            match = re.search(pattern, resume_text, re.IGNORECASE)
+        for pattern in _EXPERIENCE_PATTERNS:
+            match = pattern.search(resume_text)
             if match:
                 try:
                     years = int(match.group(1))
@@ -485,19 +659,10 @@ class PDFProcessor:
         Returns:
             Current role or None
         """
-        # Look for current role patterns
-        role_patterns = [
-            r'current[:\s]*([A-Za-z\s]+(?:Engineer|Developer|Manager|Analyst|Specialist))',
-            r'present[:\s]*([A-Za-z\s]+(?:Engineer|Developer|Manager|Analyst|Specialist))',
-            r'currently[:\s]*([A-Za-z\s]+(?:Engineer|Developer|Manager|Analyst|Specialist))',
-            r'Full\s+stack\s+Software\s+engineer',  # Specific pattern for our sample
-            r'([A-Za-z\s]+(?:Engineer|Developer|Manager|Analyst|Specialist))\s*\[.*Current.*\]',  # Role with [Current] indicator
-        ]
-        
-        for pattern in role_patterns:
-            match = re.search(pattern, resume_text, re.IGNORECASE)
+        for pattern in _ROLE_PATTERNS:
+            match = pattern.search(resume_text)
             if match:
-                if r'Full\s+stack\s+Software\s+engineer' in pattern:
+                if pattern.groups == 0:
                     role = match.group(0).strip()
                 else:
                     role = match.group(1).strip()
@@ -517,15 +682,8 @@ class PDFProcessor:
         Returns:
             Education information or None
         """
-        # Look for education patterns
-        education_patterns = [
-            r'education[:\s]*([A-Za-z\s,]+(?:University|College|Institute|School))',
-            r'degree[:\s]*([A-Za-z\s]+(?:Bachelor|Master|PhD|BSc|MSc|MBA))',
-            r'([A-Za-z\s]+(?:University|College|Institute|School))'
-        ]
-        
-        for pattern in education_patterns:
-            match = re.search(pattern, resume_text, re.IGNORECASE)
+        for pattern in _EDUCATION_PATTERNS:
+            match = pattern.search(resume_text)
             if match:
                 education = match.group(1).strip()
                 if len(education) > 5 and len(education) < 100:
@@ -547,10 +705,9 @@ class PDFProcessor:
         """
         try:
             # Create uploads directory if it doesn't exist
-            os.makedirs(settings.upload_folder, exist_ok=True)
+            ensure_directory(settings.upload_folder)
             
             # Generate unique filename
-            import uuid
             unique_filename = f"{uuid.uuid4()}_{filename}"
             file_path = os.path.join(settings.upload_folder, unique_filename)
             
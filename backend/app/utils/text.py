@@ -0,0 +1,11 @@
+"""
+Text matching helpers shared by the resume and job posting parsers.
+"""
+
+import re
+from typing import List
+
+
+def keyword_pattern(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile a keyword list into one alternation, so a line is scanned once instead of once per keyword."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
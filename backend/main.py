@@ -7,15 +7,21 @@ and includes all API routes for resume analysis functionality.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
+import asyncio
 import os
-from dotenv import load_dotenv
 
 # Import core modules first
 from app.core.config import settings
 from app.core.logging import logger, setup_logging
 from app.core.database import close_mongodb_connection
+from app.services.openai_service import get_openai_client, close_openai_client
+from app.core.container import get_container
+from app.repositories.mongodb_repository import MongoDBRepository
+from app.repositories.job_application_repository import JobApplicationRepository
+from app.repositories.meeting_repository import MeetingRepository
 
 # Import API routes
 from app.api.dashboard import router as dashboard_router
@@ -40,6 +46,30 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize MongoDB: {e}")
         raise
     
+    # Create indexes up front so first requests don't wait on them; the API can
+    # still serve requests if this fails
+    try:
+        container = get_container()
+        await asyncio.gather(
+            container.get_repository(MongoDBRepository).ensure_indexes(),
+            container.get_repository(JobApplicationRepository).ensure_indexes(),
+            container.get_repository(MeetingRepository).ensure_indexes()
+        )
+        logger.info("MongoDB indexes ensured")
+    except Exception as e:
+        logger.warning(f"Failed to ensure MongoDB indexes: {e}")
+    
+    # Store derived search fields on older resume bank entries so search can rely on the stored copies
+    try:
+        backfilled = await get_container().get_repository(MongoDBRepository).backfill_resume_search_fields()
+        if backfilled:
+            logger.info(f"Backfilled search fields on {backfilled} resume bank entries")
+    except Exception as e:
+        logger.warning(f"Failed to backfill resume search fields: {e}")
+    
+    # Create the shared OpenAI client up front rather than on the first request
+    get_openai_client()
+    
 
     
     logger.info("AI Resume Management API started successfully")
@@ -49,9 +79,10 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down AI Resume Management API...")
     await close_mongodb_connection()
-
-# Load environment variables
-load_dotenv()
+    await close_openai_client()
+    
+    # Flush records still queued for the file sinks
+    await logger.complete()
 
 # Validate settings after all imports are complete
 from app.core.config import validate_settings
@@ -69,6 +100,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    # Routers without their own default_response_class (auth, health) also serialize with orjson
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
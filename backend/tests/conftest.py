@@ -0,0 +1,10 @@
+"""
+Shared pytest setup.
+
+Settings are loaded at import time and require a SECRET_KEY, so provide a
+throwaway one before any app module is imported.
+"""
+
+import os
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key-" + "x" * 32)
@@ -0,0 +1,56 @@
+"""Tests for the cached job scoring context used by candidate search."""
+
+from bson import ObjectId
+
+from app.api import resume_bank
+from app.models.mongodb_models import JobPostingDocument
+
+
+def _job(**overrides) -> JobPostingDocument:
+    fields = {
+        "user_id": ObjectId(),
+        "title": "Senior Backend Engineer",
+        "company": "Acme",
+        "location": "Berlin",
+        "job_type": "full-time",
+        "experience_level": "Senior",
+        "description": "Build APIs",
+        "requirements": [{"skill": "Python"}, {"skill": "MongoDB"}, {"skill": "python"}],
+    }
+    fields.update(overrides)
+    return JobPostingDocument(**fields)
+
+
+def setup_function():
+    resume_bank._job_scoring_cache.clear()
+
+
+def test_builds_context_from_job():
+    context = resume_bank._job_scoring_context(_job())
+
+    assert context is not None
+    assert context.skills == ("python", "mongodb")
+    assert context.expected_range == resume_bank.EXPERIENCE_LEVEL_YEARS["senior"]
+
+
+def test_second_call_hits_cache():
+    job = _job()
+
+    first = resume_bank._job_scoring_context(job)
+    second = resume_bank._job_scoring_context(job)
+
+    assert second is first
+    assert len(resume_bank._job_scoring_cache) == 1
+
+
+def test_updated_job_gets_new_context():
+    job = _job()
+    first = resume_bank._job_scoring_context(job)
+
+    changed = job.model_copy(update={
+        "requirements": [{"skill": "Go"}],
+        "updated_at": job.updated_at.replace(year=job.updated_at.year + 1),
+    })
+
+    assert resume_bank._job_scoring_context(changed) is not first
+    assert resume_bank._job_scoring_context(changed).skills == ("go",)
@@ -0,0 +1,103 @@
+"""Tests for the buffered app.log sink and its size-based rotation."""
+
+import gzip
+import os
+import time
+
+import pytest
+from loguru import logger
+
+from app.core.logging import _BufferedFileSink
+
+MESSAGE = "x" * 30
+
+
+@pytest.fixture
+def test_logger():
+    """Yield a logger bound so that only the handlers added by a test see its records."""
+    handler_ids = []
+
+    def add(sink, **options):
+        handler_id = logger.add(
+            sink, format="{message}", filter=lambda record: record["extra"].get("under_test"), **options
+        )
+        handler_ids.append(handler_id)
+        return handler_id
+
+    def remove(handler_id):
+        handler_ids.remove(handler_id)
+        logger.remove(handler_id)
+
+    yield logger.bind(under_test=True), add, remove
+    for handler_id in handler_ids:
+        logger.remove(handler_id)
+
+
+def test_rotation_counts_encoded_bytes(tmp_path, test_logger):
+    log, add, remove = test_logger
+    path = tmp_path / "app.log"
+    handler_id = add(_BufferedFileSink(str(path), max_bytes=100, flush_interval=3600))
+
+    # 2 bytes per "é": each line is 61 bytes but only 31 characters
+    for _ in range(3):
+        log.info("é" * 30)
+    remove(handler_id)  # closes the file so the buffer is on disk
+
+    assert path.stat().st_size == 61
+    rotated = sorted(tmp_path.glob("app.*.log.gz"))
+    assert len(rotated) == 2
+    assert [gzip.decompress(p.read_bytes()) for p in rotated] == [("é" * 30 + "\n").encode()] * 2
+
+
+def test_rotation_starts_from_existing_file_size(tmp_path, test_logger):
+    log, add, remove = test_logger
+    path = tmp_path / "app.log"
+    path.write_text("x" * 80)
+    handler_id = add(_BufferedFileSink(str(path), max_bytes=100, flush_interval=3600))
+
+    log.info(MESSAGE)
+    remove(handler_id)
+
+    assert path.read_text() == MESSAGE + "\n"
+    (rotated,) = tmp_path.glob("app.*.log.gz")
+    assert gzip.decompress(rotated.read_bytes()) == b"x" * 80
+
+
+def test_rotation_removes_expired_files(tmp_path, test_logger):
+    log, add, remove = test_logger
+    path = tmp_path / "app.log"
+    expired = tmp_path / "app.2000-01-01_00-00-00_000000.log.gz"
+    expired.write_bytes(b"")
+    os.utime(expired, (0, 0))
+    handler_id = add(_BufferedFileSink(str(path), max_bytes=40, flush_interval=3600, retention_days=1))
+
+    log.info(MESSAGE)
+    log.info(MESSAGE)
+    remove(handler_id)
+
+    assert not expired.exists()
+    assert len(list(tmp_path.glob("app.*.log.gz"))) == 1
+
+
+def test_buffered_sink_holds_info_and_flushes_errors(tmp_path, test_logger):
+    log, add, _ = test_logger
+    path = tmp_path / "app.log"
+    add(_BufferedFileSink(str(path), max_bytes=1024 * 1024, flush_interval=3600))
+
+    log.info(MESSAGE)
+    assert path.stat().st_size == 0
+
+    log.error(MESSAGE)
+    assert path.read_text().splitlines() == [MESSAGE, MESSAGE]
+
+
+def test_buffered_sink_flushes_on_timer(tmp_path, test_logger):
+    log, add, _ = test_logger
+    path = tmp_path / "app.log"
+    add(_BufferedFileSink(str(path), max_bytes=1024 * 1024, flush_interval=0.05))
+
+    log.info(MESSAGE)
+    deadline = time.monotonic() + 2
+    while path.stat().st_size == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert path.read_text() == MESSAGE + "\n"
@@ -0,0 +1,18 @@
+"""Tests for the shared OpenAI client lifecycle."""
+
+import asyncio
+
+from app.services import openai_service
+
+
+def test_closed_client_is_replaced_on_next_use():
+    first = openai_service.get_openai_client()
+    service = openai_service.OpenAIService()
+    assert service.client is first
+
+    asyncio.run(openai_service.close_openai_client())
+
+    second = openai_service.get_openai_client()
+    assert second is not first
+    assert not second.is_closed()
+    assert service.client is second
@@ -0,0 +1,102 @@
+"""Tests for seeding the per-user resume bank counters."""
+
+import asyncio
+import copy
+
+from pymongo.errors import DuplicateKeyError
+
+from app.repositories.user_stats_repository import UserStatsRepository
+
+
+class FakeCollection:
+    """Just enough of a Motor collection for UserStatsRepository."""
+
+    def __init__(self):
+        self.documents = {}
+
+    @staticmethod
+    def _matches(document, query):
+        for field, condition in query.items():
+            value = document.get(field)
+            if isinstance(condition, dict) and "$in" in condition:
+                if value not in condition["$in"]:
+                    return False
+            elif value != condition:
+                return False
+        return True
+
+    async def find_one(self, query, projection=None):
+        document = self.documents.get(query["_id"])
+        if document is None or not self._matches(document, query):
+            return None
+        return copy.deepcopy(document)
+
+    async def update_one(self, query, update, upsert=False):
+        document = self.documents.get(query["_id"])
+        if document is None or not self._matches(document, query):
+            if not upsert:
+                return
+            if document is not None:
+                raise DuplicateKeyError("E11000 duplicate key error")
+            document = self.documents[query["_id"]] = {"_id": query["_id"]}
+        for path, amount in update.get("$inc", {}).items():
+            target, key = self._resolve(document, path)
+            target[key] = target.get(key, 0) + amount
+        for path, value in update.get("$set", {}).items():
+            target, key = self._resolve(document, path)
+            target[key] = value
+
+    @staticmethod
+    def _resolve(document, path):
+        *parents, key = path.split(".")
+        for parent in parents:
+            document = document.setdefault(parent, {})
+        return document, key
+
+
+def _repository():
+    collection = FakeCollection()
+    return UserStatsRepository({"user_stats": collection}), collection
+
+
+def test_seed_sets_counters_when_nothing_raced():
+    repository, _ = _repository()
+
+    async def scenario():
+        version = await repository.get_resume_stats_version("user")
+        assert await repository.seed_resume_stats("user", version, 2, {"active": 2}, {})
+        return await repository.get_resume_stats("user")
+
+    stats = asyncio.run(scenario())
+    assert stats["total_entries"] == 2
+    assert stats["status_breakdown"] == {"active": 2}
+
+
+def test_increment_between_count_and_seed_leaves_counters_unseeded():
+    repository, collection = _repository()
+
+    async def scenario():
+        version = await repository.get_resume_stats_version("user")
+        # Counted 2 entries; a third upload is recorded before the seed lands
+        await repository.record_resume_created("user", "active")
+        seeded = await repository.seed_resume_stats("user", version, 2, {"active": 2}, {})
+        return seeded, await repository.get_resume_stats("user")
+
+    seeded, stats = asyncio.run(scenario())
+    assert seeded is False
+    assert stats is None  # the next read recounts
+    assert collection.documents["user"]["resume_total"] == 1
+
+
+def test_increment_between_count_and_reseed_keeps_existing_counters():
+    repository, collection = _repository()
+
+    async def scenario():
+        await repository.seed_resume_stats("user", 0, 1, {"active": 1}, {})
+        await repository.invalidate_resume_stats("user")
+        version = await repository.get_resume_stats_version("user")
+        await repository.record_resume_deleted("user", "active")
+        return await repository.seed_resume_stats("user", version, 1, {"active": 1}, {})
+
+    assert asyncio.run(scenario()) is False
+    assert collection.documents["user"]["seeded"] is False
@@ -47,6 +47,8 @@ export const API_ENDPOINTS = {
     DETAIL: (id) => `${API_URL}/resume-bank/${id}`,
     UPDATE: (id) => `${API_URL}/resume-bank/${id}`,
     DELETE: (id) => `${API_URL}/resume-bank/${id}`,
+    BATCH: `${API_URL}/resume-bank/batch`,
+    BATCH_DELETE: `${API_URL}/resume-bank/batch-delete`,
   },
   
   // Jobs
@@ -60,6 +60,20 @@ export const resumesAPI = {
     return apiClient.delete(API_ENDPOINTS.RESUME_BANK.DELETE(id));
   },
 
+  /**
+   * Get several resumes by ID in one request (keyed by ID)
+   */
+  getResumesByIds: async (ids) => {
+    return apiClient.post(API_ENDPOINTS.RESUME_BANK.BATCH, { ids });
+  },
+
+  /**
+   * Delete several resumes in one request
+   */
+  deleteResumes: async (ids) => {
+    return apiClient.post(API_ENDPOINTS.RESUME_BANK.BATCH_DELETE, { ids });
+  },
+
   /**
    * Search candidates for a job
    */